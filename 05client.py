@@ -7,9 +7,11 @@ from girl_definitions import *
 from elements import *
 from expobject import *
 from locationobj import *
+from pacing import BlockingPacer
 
-e = Engine()
+e = Engine(pacer=BlockingPacer())
 i = Input()
+install_readline_completion(i)
 d = Dialogue()
 exp = Experience()
 mc = Character()
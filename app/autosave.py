@@ -0,0 +1,162 @@
+"""Atomic, coalescing save-file writer.
+
+The engine thread only takes a snapshot (plain dicts and lists) and hands
+it over. Serialising and writing happen on the writer's own thread. A
+snapshot still waiting to be written is replaced by a newer one, so a
+burst of save requests costs a single write. Files are written to a
+temporary sibling, fsynced and renamed over the target, so a crash leaves
+either the old save or the new one, never a torn file.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import IO, Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+SAVE_PATH = "save.yaml"
+# Gather requests for this long before writing.
+DEBOUNCE_S = 1.0
+FLUSH_TIMEOUT_S = 1.5
+
+_logger = logging.getLogger(__name__)
+
+ErrorCallback = Callable[[str, Exception], None]
+# runs on the writer thread once a snapshot is safely on disk
+WrittenCallback = Callable[[], None]
+
+
+def atomic_write(path: str, dump: Callable[[IO[str]], None]) -> None:
+    """Write through ``dump(file)`` to a temporary sibling, then rename it over ``path``."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            dump(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):  # make the rename itself durable
+        try:
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def atomic_write_yaml(path: str, data: Any) -> None:
+    atomic_write(path, lambda f: yaml.safe_dump(data, f))
+
+
+class AutosaveWriter(object):
+    """Background writer keeping only the newest pending snapshot per path."""
+
+    def __init__(self, debounce_s: float = DEBOUNCE_S, on_error: Optional[ErrorCallback] = None):
+        self.debounce_s = debounce_s
+        self.on_error = on_error
+        self.written = 0
+        self.coalesced = 0
+        self._cond = threading.Condition()
+        # path -> (snapshot, monotonic time it may be written, callback)
+        self._pending: Dict[str, Tuple[Any, float, Optional[WrittenCallback]]] = {}
+        self._writing = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        path: str,
+        snapshot: Any,
+        *,
+        immediate: bool = False,
+        then: Optional[WrittenCallback] = None,
+    ) -> None:
+        """Queue ``snapshot`` for ``path``, replacing any not yet written
+        (together with its ``then`` callback)."""
+        due = time.monotonic() + (0.0 if immediate else self.debounce_s)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("autosave writer is closed")
+            if path in self._pending:
+                # newer state rides along with the write already scheduled,
+                # so a steady stream of requests cannot postpone it forever
+                self.coalesced += 1
+                due = min(due, self._pending[path][1])
+            self._pending[path] = (snapshot, due, then)
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT_S) -> bool:
+        """Write everything pending now; False if that took longer than ``timeout``."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            now = time.monotonic()
+            self._pending = {p: (s, now, then) for p, (s, _, then) in self._pending.items()}
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = FLUSH_TIMEOUT_S) -> bool:
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return flushed
+
+    def _next_due(self) -> Optional[Tuple[str, Any, Optional[WrittenCallback]]]:
+        # called with the lock held
+        now = time.monotonic()
+        for path, (snapshot, due, then) in self._pending.items():
+            if due <= now:
+                del self._pending[path]
+                return path, snapshot, then
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    job = self._next_due()
+                    if job is not None:
+                        self._writing += 1
+                        break
+                    if self._closed:
+                        return
+                    wait = None
+                    if self._pending:
+                        wait = min(due for _, due, _ in self._pending.values()) - time.monotonic()
+                    self._cond.wait(wait)
+            path, snapshot, then = job
+            try:
+                atomic_write_yaml(path, snapshot)
+                self.written += 1
+                if then is not None:
+                    then()
+            except Exception as exc:
+                _logger.exception("Could not write save file %s", path)
+                if self.on_error is not None:
+                    self.on_error(path, exc)
+            finally:
+                with self._cond:
+                    self._writing -= 1
+                    self._cond.notify_all()
@@ -3,17 +3,24 @@ from PySide6.QtCore import QObject, Signal
 class Bus(QObject):
     # Engine → UI
     scene_changed = Signal(dict)          # {bg, sprite}
-    dialogue_ready = Signal(dict)         # {speaker, text, options}
+    dialogue_ready = Signal(dict)         # {speaker, text, options, turn}
     nav_ready = Signal(dict)              # {location, exits:[{id,label}], characters:[str]}
     state_changed = Signal(str)           # "day" | "dialogue" | "date"
     stats_updated = Signal(dict)          # {name,hp,mp,stamina,level,attrs,skills,conditions,affinity}
     inventory_updated = Signal(list)      # [{id,name,qty},...]
     knowledge_updated = Signal(dict)      # {notes,factions,sites,tech}
     toast = Signal(str)
-    toast_history = Signal(list)
+    toast_logged = Signal(str)            # one new history entry
+    toast_history_reset = Signal()        # a new game started; drop the log
+    ending_reached = Signal(dict)         # {id,text,girl,experiences,committed}
+    completions_ready = Signal(list)      # ranked full-line completions
+    prefetch_hint = Signal(list)          # asset paths likely needed after the next move
+    pause_elapsed = Signal(int)           # dialogue turn whose pause beat has run out
 
     # UI → Engine
     option_chosen = Signal(int)
     travel_chosen = Signal(str)           # exit key (e.g., "north", "club")
     talk_to = Signal(str)                 # girl name
     pane_toggled = Signal(str)            # "left" | "right"
+    command_entered = Signal(str)         # typed command line
+    completion_requested = Signal(str)    # partially typed command line
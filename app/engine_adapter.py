@@ -1,30 +1,45 @@
 from __future__ import annotations
 
 import os
-from collections import deque
+import time
 from copy import deepcopy
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from app.autosave import SAVE_PATH, atomic_write_yaml
 from app.bus import Bus
 from app.loaders import load_character, load_assets
+from app.pacing import QtPacer
+from dialogue_graph import DialogueContext, DialogueSession, load_graph
+from dialogue_trees import Level
 from elements import Character, Engine, Girl
+from endings import EndingRecord
 from girl_definitions import girl_list
 from location_definitions import location_list
 from expobject import set_random_seed as set_experience_random_seed
 from getdialogue import set_random_seed as set_dialogue_random_seed
 from locationobj import activate_location, set_random_seed as set_location_random_seed
 from script_loader import load_script
+from string_table import S, load_strings
 from getinputobject import Input
+from pacing import Pacer
 
 class EngineAdapter:
     """Bridge the legacy engine with the Qt GUI overlay."""
 
-    def __init__(self, bus: Bus, *, seed: Optional[int] = None):
+    def __init__(
+        self,
+        bus: Bus,
+        *,
+        seed: Optional[int] = None,
+        pacer: Optional[Pacer] = None,
+        character: Optional[Dict[str, Any]] = None,
+        assets: Optional[Dict[str, Any]] = None,
+    ):
+        """``character`` and ``assets`` may be passed in when already loaded."""
         self.bus = bus
-        self._toast_history: Deque[str] = deque(maxlen=20)
-        self.bus.toast_history.emit(list(self._toast_history))
+        self.bus.toast_history_reset.emit()
         if seed is not None:
             set_location_random_seed(seed)
             set_dialogue_random_seed(seed)
@@ -32,26 +47,29 @@ class EngineAdapter:
 
         self.script = load_script()
         self.dialogue_text = self.script["dialogue"]
-        self.dialogue_trees = self.script["dialogue_trees"]
-        self.ui_text = self.script.get("ui", {})
-        self._general_ui = self.ui_text.get("general", {})
-        self._dialogue_ui = self.ui_text.get("dialogue", {})
-        self._nav_ui = self.ui_text.get("nav_overlay", {})
+        self.ui_text = self.script["ui"]
+        self.strings = load_strings()
 
-        self.e = Engine()
+        self.e = Engine(pacer=pacer or QtPacer())
+        self._play_time_base = 0.0
+        self._play_clock = time.monotonic()
+        self._ending_emitted: Optional[EndingRecord] = None
         self.mc = Character()
-        self._base_stats = load_character()
+        self._base_stats = character if character is not None else load_character()
         self.e.build_locations(location_list)
         self.e.build_girls(girl_list)
 
         self.mc.get_name("Protagonist")
-        arrival = activate_location(self.e, "residential district", Input(), self.mc)
+        # One parser for the session so its completion trie stays in step.
+        self._input = Input()
+        arrival = activate_location(self.e, "residential district", self._input, self.mc)
         day_message: Optional[str] = None
         if str(self.e.state) != "date_state":
             day_message = self.e.start_day()
         self._toast(*arrival, day_message)
 
-        assets = load_assets()
+        if assets is None:
+            assets = load_assets()
         self._bg_by_loc = dict(assets.get("locales", {}))
         self._sprite_for = dict(assets.get("sprites", {}))
         defaults = assets.get("defaults", {})
@@ -62,120 +80,86 @@ class EngineAdapter:
         self._happy_sprite = self._sprite_for.get("happy")
 
         # Dialogue traversal state must exist before any focus/advance calls.
-        self._levels: List[Tuple[int, Dict[str, Any]]] = self._ordered_levels()
+        self._levels: Tuple[Level, ...] = self._ordered_levels()
         self._level_index: int = 0
-        self._pending_date = False
+        self._session: Optional[DialogueSession] = None
+        self._graph = load_graph()
+        # Bumped for every dialogue payload; choices made against an older
+        # payload (e.g. Continue on a pause beat that already moved on) are dropped.
+        self._turn = 0
 
         # Focus a default character so GUI dialogue works.
         self.focus("tammy")
         self._emit_scene()
+        self._emit_prefetch()
 
     def _toast(self, *lines: Optional[str]) -> None:
         message = "\n".join(line for line in lines if line)
         if message.strip():
-            self._toast_history.append(message)
-            self.bus.toast_history.emit(list(self._toast_history))
+            self.bus.toast_logged.emit(message)
             self.bus.toast.emit(message)
 
     # -------- GUI API --------
     def next_dialogue_payload(self) -> Dict[str, Any]:
-        if getattr(self, "_pending_date", False):
-            return self._prepare_date_choices()
-
-        girl = self._focused()
-        if girl is None:
-            empty_state = self._dialogue_ui.get("empty_scene", {})
-            continue_label = self._general_ui.get("continue_label", "Continue")
+        session = self._dialogue_session()
+        if session is None:
             return {
-                "speaker": empty_state.get("speaker", ""),
-                "text": empty_state.get("text", "No one is here."),
-                "options": [{"id": 1, "label": continue_label}],
+                "speaker": self.strings[S.EMPTY_SCENE_SPEAKER],
+                "text": self.strings[S.EMPTY_SCENE_TEXT],
+                "options": [{"id": 1, "label": self.strings[S.CONTINUE_LABEL]}],
             }
 
-        speaker = girl.name.title()
-        level_num, level = self._current_level()
-        known = girl.name in self.mc.known_girls
-        opinion = girl.opinion
-
-        header = (
-            f"{self.dialogue_text['level_label']} {level_num}\n"
-            f"{self.dialogue_text['opinion_label']} {opinion}"
-        )
-        text = f"{header}\n\n{self.dialogue_text['greeting']}"
-
-        if not known:
-            opts = [
-                {"id": 1, "label": level["statement"]["compliment"]},
-                {
-                    "id": 2,
-                    "label": f"{level['statement']['introduction']} {self.mc.name}",
-                },
-                {"id": 3, "label": level["statement"]["question"]},
-            ]
-        else:
-            opts = [
-                {"id": 1, "label": level["statement"]["compliment"]},
-                {"id": 2, "label": self._random_observation()},
-                {"id": 3, "label": level["statement"]["question"]},
-            ]
-            if opinion >= 3:
-                opts.append({"id": 4, "label": self.dialogue_text["date_offer"]})
-
-        return {"speaker": speaker, "text": text, "options": opts}
+        return {
+            "speaker": session.context.girl.name.title(),
+            "text": session.text(),
+            "options": [{"id": i, "label": label} for i, label in session.options()],
+        }
 
     def advance_dialogue(self) -> Dict[str, Any]:
+        self._turn += 1
         payload = self.next_dialogue_payload()
+        payload["turn"] = self._turn
         self.bus.dialogue_ready.emit(payload)
+        session = self._session
+        if session is not None and session.paused:
+            # a pause beat moves on by itself; Continue just skips the wait.
+            # The window answers pause_elapsed with a ``resume`` request.
+            turn = self._turn
+            self.e.pacer.pause(session.paused, lambda: self.bus.pause_elapsed.emit(turn))
         return payload
 
-    def apply_choice(self, option_id: int) -> None:
-        girl = self._focused()
-        if girl is None:
+    def resume(self, turn: int) -> None:
+        """Leave the pause beat shown as ``turn``, if it is still showing."""
+        session = self._session
+        if session is not None and session.paused:
+            self.apply_choice(1, turn)
+
+    def apply_choice(self, option_id: int, turn: Optional[int] = None) -> None:
+        """Choose ``option_id`` from the current payload, or from payload
+        ``turn`` when given; a choice from an outdated payload is ignored."""
+        if turn is not None and turn != self._turn:
+            return
+        session = self._dialogue_session()
+        if session is None:
             self._emit_stats()
             return
 
-        _, level = self._current_level()
-        known = girl.name in self.mc.known_girls
-        reply_text: Optional[str] = None
-
-        def apply_reply(key: str) -> None:
-            nonlocal reply_text
-            reply = level["reply"].get(key)
-            if not reply:
-                return
-            reply_text = reply[0]
-            girl.opinion += reply[1]
-
-        if not known:
-            choice_map = {1: "compliment", 2: "introduction", 3: "question"}
-            key = choice_map.get(option_id)
-            if not key:
-                return
-            if key == "introduction":
-                self.mc.make_acquaintance(girl)
-            apply_reply(key)
-        else:
-            if option_id == 4 and girl.opinion >= 3:
-                self._pending_date = True
-                reply_text = self.dialogue_text.get("date_invite")
-            else:
-                choice_map = {1: "compliment", 2: "observation", 3: "question"}
-                key = choice_map.get(option_id)
-                if not key:
-                    return
-                apply_reply(key)
+        step = session.choose(option_id)
+        if step is None:
+            return
 
-        if reply_text:
-            self._toast(reply_text)
+        if step.reply:
+            self._toast(step.reply)
 
         self._emit_stats()
 
-        if self._pending_date:
+        if not step.ended:
             self._emit_scene()
             self.advance_dialogue()
             return
 
         self._level_index = min(self._level_index + 1, len(self._levels) - 1)
+        self._session = None
         day_message = self.e.start_day()
         self._toast(day_message)
         self._emit_scene()
@@ -184,27 +168,79 @@ class EngineAdapter:
     def travel_to(self, exit_key: str) -> None:
         if not self.e.current_location:
             return
-        _inp = Input()
-        messages = activate_location(self.e, exit_key, _inp, self.mc)
+        messages = activate_location(self.e, exit_key, self._input, self.mc)
         day_message: Optional[str] = None
         if str(self.e.state) != "date_state":
             day_message = self.e.start_day()
         self._toast(*messages, day_message)
         self._emit_scene()
+        self._emit_prefetch()
         self.advance_dialogue()
 
-    def save(self, path: str = "save.yaml") -> None:
+    def complete(self, text: str, limit: int = 8) -> List[str]:
+        completions = self._input.complete(text, limit)
+        self.bus.completions_ready.emit(completions)
+        return completions
+
+    def run_command(self, text: str) -> None:
+        """Interpret a typed command the way the console parser does."""
+        loc = self.e.current_location
+        if not text.strip() or loc is None:
+            return
+        inp = self._input
+        x = inp.parse_sentence(inp.scan(text, inp))
+        verb = x.verb.lower()
+        obj = x.object.lower()
+
+        if x.subject == "inactive_player":
+            self._toast(loc.inactive_verbs.get(x.verb))
+        elif verb == "?":
+            self._toast(*inp.help_lines())
+        elif verb in ("go", "leave"):
+            if obj == "none" and verb == "leave" and "outside" in loc.destinations:
+                self.travel_to("outside")
+            elif obj == "none":
+                self._toast(self.strings[S.CMD_GO_WHERE])
+            elif obj == "error":
+                self._toast(self.strings[S.CMD_UNKNOWN_DESTINATION])
+            else:
+                self.travel_to(obj)
+        elif verb == "talk":
+            if obj in loc.characters:
+                self.focus(obj)
+            else:
+                self._toast(self.strings[S.CMD_NO_SUCH_PERSON])
+        elif verb == "look":
+            self._toast(loc.describe() if obj == "none" else loc.nouns.get(obj))
+        elif verb == "reflect":
+            self._toast(
+                self.strings.format(S.CMD_REFLECT_NAME, name=self.mc.name),
+                self.strings.format(S.CMD_REFLECT_LOCATIONS, locations=self.mc.known_locations),
+            )
+        elif verb in loc.verbs:
+            self._toast(loc.verbs[verb])
+        else:
+            self._toast(self.strings[S.CMD_NOT_UNDERSTOOD])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The saved state as fresh plain data, safe to hand to another thread."""
         focused = self._focused()
-        data = {
+        return {
             "focused": focused.name if focused else None,
             "known_girls": list(self.mc.known_girls),
             "opinions": {girl.name: girl.opinion for girl in self.e.girls.values()},
             "location": self.e.current_location.name if self.e.current_location else None,
+            "play_time_s": round(self.play_time(), 1),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f)
 
-    def load(self, path: str = "save.yaml") -> bool:
+    def play_time(self) -> float:
+        """Seconds played, including the time recorded in a loaded save."""
+        return self._play_time_base + time.monotonic() - self._play_clock
+
+    def save(self, path: str = SAVE_PATH) -> None:
+        atomic_write_yaml(path, self.snapshot())
+
+    def load(self, path: str = SAVE_PATH) -> bool:
         if not os.path.exists(path):
             return False
         with open(path, "r", encoding="utf-8") as f:
@@ -212,6 +248,12 @@ class EngineAdapter:
 
         loaded = bool(data)
 
+        try:
+            self._play_time_base = float(data.get("play_time_s") or 0.0)
+            self._play_clock = time.monotonic()
+        except (TypeError, ValueError):
+            pass
+
         known = data.get("known_girls", [])
         if isinstance(known, list):
             self.mc.known_girls = [str(name) for name in known]
@@ -240,6 +282,7 @@ class EngineAdapter:
                 self.mc.focus(fallback)
         self._levels = self._ordered_levels()
         self._level_index = 0
+        self._session = None
         self._emit_stats()
         self._emit_scene()
         self.advance_dialogue()
@@ -247,25 +290,39 @@ class EngineAdapter:
     def _focused(self) -> Optional[Girl]:
         return self.mc.focus_character
 
-    def _ordered_levels(self) -> List[Tuple[int, Dict[str, Any]]]:
-        tree = self.dialogue_trees["default"]
-        items: List[Tuple[int, Dict[str, Any]]] = []
-        for key, value in tree.items():
-            try:
-                items.append((int(key), value))
-            except ValueError:
-                items.append((key, value))  # type: ignore[list-item]
-        items.sort(key=lambda kv: kv[0])
-        return items
-
-    def _current_level(self) -> Tuple[int, Dict[str, Any]]:
+    def _ordered_levels(self) -> Tuple[Level, ...]:
+        girl = self._focused()
+        return girl.dialogue_tree.levels if girl else ()
+
+    def _current_level(self) -> Level:
         return self._levels[self._level_index]
 
+    def _dialogue_session(self) -> Optional[DialogueSession]:
+        """Return the graph walk for the focused girl's current level."""
+        girl = self._focused()
+        if girl is None or not self._levels:
+            return None
+        if self._session is None or self._session.context.girl is not girl:
+            level_num, level = self._current_level()
+            self._session = self._graph.session(
+                DialogueContext(
+                    engine=self.e,
+                    player=self.mc,
+                    girl=girl,
+                    level_number=level_num,
+                    level=level,
+                    messages=self.dialogue_text,
+                    ui=self.ui_text,
+                    observe=self._random_observation,
+                )
+            )
+        return self._session
+
     def _random_observation(self) -> str:
         loc = self.e.current_location
         if loc and loc.observations:
             return loc.observations[0]
-        return self._general_ui.get("ellipsis", "…")
+        return self.strings[S.ELLIPSIS]
 
     def _snapshot_nav(self) -> Dict[str, Any]:
         loc = self.e.current_location
@@ -275,7 +332,7 @@ class EngineAdapter:
                 exits.append({"id": label, "label": label})
         chars = list(loc.characters) if loc else []
         return {
-            "location": loc.name if loc else self._nav_ui.get("location_placeholder", ""),
+            "location": loc.name if loc else self.strings[S.NAV_LOCATION_PLACEHOLDER],
             "exits": exits,
             "characters": chars,
         }
@@ -283,7 +340,16 @@ class EngineAdapter:
     def _emit_nav(self) -> None:
         self.bus.nav_ready.emit(self._snapshot_nav())
 
+    def _emit_ending(self) -> None:
+        ending = self.e.ending
+        if ending is None or ending is self._ending_emitted:
+            return
+        self._ending_emitted = ending
+        self._toast(ending.text)
+        self.bus.ending_reached.emit(ending.as_dict())
+
     def _emit_state(self) -> None:
+        self._emit_ending()
         state = str(self.e.state)
         if state.endswith("_state"):
             state = state[: -len("_state")]
@@ -311,6 +377,27 @@ class EngineAdapter:
 
         self.bus.stats_updated.emit(stats)
 
+    def _prefetch_paths(self) -> List[str]:
+        """Backgrounds of adjacent locations, plus sprites if a girl may be met there."""
+        loc = self.e.current_location
+        if loc is None:
+            return []
+        paths: List[str] = []
+        sprites_needed = False
+        for name in loc.destinations.values():
+            paths.append(self._bg_by_loc.get(name, self._default_bg))
+            if not sprites_needed:
+                sprites_needed = any(
+                    name == girl.meet_at or name in girl.see_at
+                    for girl in self.e.girls.values()
+                )
+        if sprites_needed:
+            paths.extend(p for p in (self._neutral_sprite, self._happy_sprite) if p)
+        return list(dict.fromkeys(paths))
+
+    def _emit_prefetch(self) -> None:
+        self.bus.prefetch_hint.emit(self._prefetch_paths())
+
     def _emit_scene(self) -> None:
         loc_name = self.e.current_location.name if self.e.current_location else ""
         bg = self._bg_by_loc.get(loc_name, self._default_bg)
@@ -324,51 +411,3 @@ class EngineAdapter:
         self.bus.scene_changed.emit({"bg": bg, "sprite": sprite})
         self._emit_nav()
         self._emit_state()
-
-    def _prepare_date_choices(self) -> Dict[str, Any]:
-        choices = self.dialogue_text["date_choices"]
-        continue_label = self._general_ui.get("continue_label", "Continue")
-        payload = {
-            "speaker": self._focused().name.title() if self._focused() else "",
-            "text": f"{self.dialogue_text['date_invite']}",
-            "options": [{"id": i + 1, "label": choice["text"]} for i, choice in enumerate(choices)],
-        }
-
-        original_apply = self.apply_choice
-
-        def _after_confirmation(_: int) -> None:
-            day_message: Optional[str] = None
-            try:
-                self._level_index = min(self._level_index + 1, len(self._levels) - 1)
-                day_message = self.e.start_day()
-            finally:
-                self.apply_choice = original_apply
-            self._toast(day_message)
-            self._emit_scene()
-            self.advance_dialogue()
-
-        def _handle(option: int) -> None:
-            idx = max(1, min(option, len(choices))) - 1
-            loc_key = choices[idx]["location"]
-            location = self.e.locations.get(loc_key)
-            if location is None:
-                if self.e.locations:
-                    location = next(iter(self.e.locations.values()))
-                else:
-                    return
-            self.e.make_date(location, self._focused())
-            self.apply_choice = _after_confirmation  # type: ignore[assignment]
-            self.bus.dialogue_ready.emit(
-                {
-                    "speaker": self._focused().name.title() if self._focused() else "",
-                    "text": self.dialogue_text["date_confirmation"],
-                    "options": [{"id": 1, "label": continue_label}],
-                }
-            )
-
-        def _await_date(option: int) -> None:
-            _handle(option)
-
-        self.apply_choice = _await_date  # type: ignore[assignment]
-        self._pending_date = False
-        return payload
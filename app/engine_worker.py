@@ -0,0 +1,255 @@
+"""Run the ``EngineAdapter`` on its own thread.
+
+Game logic and YAML parsing happen on a dedicated ``QThread``; the GUI
+thread only posts requests. The adapter keeps emitting on the shared ``Bus``
+from the engine thread, so Qt queues every engine→UI signal back onto the
+GUI thread. Saves are snapshotted on the engine thread and written to
+their slot (see ``app.save_slots``) by an ``AutosaveWriter``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+
+from app.autosave import FLUSH_TIMEOUT_S, SAVE_PATH, AutosaveWriter
+from app.bus import Bus
+from app.save_slots import AUTOSAVE_SLOT, SaveSlots
+from app.startup import trace
+
+# Show the busy indicator only when a request takes longer than this.
+BUSY_THRESHOLD_MS = 250
+SHUTDOWN_TIMEOUT_MS = 2000
+
+_logger = logging.getLogger(__name__)
+
+
+class EngineWorker(QObject):
+    """Owns the adapter; every slot runs on the engine thread."""
+
+    done = Signal(int, str, float)    # (request, method, elapsed ms)
+    failed = Signal(int, str, str)    # (request, method, error message)
+
+    def __init__(self, bus: Bus, slots: SaveSlots):
+        super().__init__()
+        self.bus = bus
+        self.adapter = None
+        self.slots = slots
+        self.writer = AutosaveWriter(on_error=self._write_failed)
+
+    def _load_path(self, slot: int) -> str:
+        path = self.slots.slot_path(slot)
+        if slot == AUTOSAVE_SLOT and not os.path.exists(path):
+            return SAVE_PATH  # single save file from before slots existed
+        return path
+
+    @Slot(int, object)
+    def start(self, request: int, options: Dict[str, Any]) -> None:
+        started = time.perf_counter()
+        try:
+            with trace.phase("engine_init"):
+                from app.engine_adapter import EngineAdapter  # heavy import
+
+                adapter = EngineAdapter(
+                    self.bus,
+                    seed=options.get("seed"),
+                    character=options.get("character"),
+                    assets=options.get("assets"),
+                )
+                loaded = False
+                if options.get("seed") is None:
+                    self.writer.flush()  # don't read a save that is about to change
+                    loaded = adapter.load(self._load_path(AUTOSAVE_SLOT))
+                if not loaded:
+                    adapter.advance_dialogue()
+        except Exception as exc:
+            _logger.exception("Failed to initialise engine")
+            self.adapter = None
+            self.failed.emit(request, "start", str(exc))
+            return
+        self.adapter = adapter
+        self.done.emit(request, "start", (time.perf_counter() - started) * 1e3)
+
+    @Slot(int, str, object)
+    def call(self, request: int, method: str, args: Tuple[Any, ...]) -> None:
+        started = time.perf_counter()
+        if self.adapter is not None:
+            try:
+                getattr(self.adapter, method)(*args)
+            except Exception as exc:
+                _logger.exception("Engine interaction failed")
+                self.failed.emit(request, method, str(exc))
+                return
+        self.done.emit(request, method, (time.perf_counter() - started) * 1e3)
+
+    @Slot(int, int, bool)
+    def save(self, request: int, slot: int, immediate: bool) -> None:
+        started = time.perf_counter()
+        if self.adapter is not None:
+            try:
+                snapshot = self.adapter.snapshot()
+                saved_at = time.time()
+                self.writer.submit(
+                    self.slots.slot_path(slot),
+                    snapshot,
+                    immediate=immediate,
+                    then=lambda: self.slots.record(slot, snapshot, saved_at),
+                )
+            except Exception as exc:
+                _logger.exception("Could not snapshot the game")
+                self.failed.emit(request, "save", str(exc))
+                return
+        self.done.emit(request, "save", (time.perf_counter() - started) * 1e3)
+
+    @Slot(int, int)
+    def load(self, request: int, slot: int) -> None:
+        started = time.perf_counter()
+        self.writer.flush()  # the slot may have a write pending
+        if self.adapter is not None:
+            try:
+                self.adapter.load(self._load_path(slot))
+            except Exception as exc:
+                _logger.exception("Could not load slot %d", slot)
+                self.failed.emit(request, "load", str(exc))
+                return
+        self.done.emit(request, "load", (time.perf_counter() - started) * 1e3)
+
+    @Slot()
+    def stop(self) -> None:
+        if not self.writer.close(FLUSH_TIMEOUT_S):
+            _logger.warning("Save file not flushed within %.1fs", FLUSH_TIMEOUT_S)
+        QThread.currentThread().quit()
+
+    def _write_failed(self, path: str, exc: Exception) -> None:
+        # runs on the writer thread; not tied to any request
+        self.failed.emit(0, "save", f"Could not save to {path}: {exc}")
+
+
+class EngineHost(QObject):
+    """GUI-side handle on the engine thread.
+
+    Requests are queued in order. ``busy_changed(True)`` fires only once the
+    oldest outstanding request has been running for ``busy_threshold_ms``;
+    ``idle`` fires whenever the queue drains.
+    """
+
+    busy_changed = Signal(bool)
+    idle = Signal()
+    finished = Signal(int, str, float)  # (request, method, elapsed ms on the engine thread)
+    failed = Signal(int, str, str)      # (request, method, error message)
+
+    _start_requested = Signal(int, object)
+    _call_requested = Signal(int, str, object)
+    _save_requested = Signal(int, int, bool)
+    _load_requested = Signal(int, int)
+    _stop_requested = Signal()
+
+    def __init__(
+        self,
+        bus: Bus,
+        parent=None,
+        *,
+        slots: Optional[SaveSlots] = None,
+        busy_threshold_ms: int = BUSY_THRESHOLD_MS,
+    ):
+        super().__init__(parent)
+        self.slots = slots or SaveSlots()
+        self._pending: Dict[int, str] = {}
+        self._next_request = 0
+        self._busy = False
+        self._busy_timer = QTimer(self, singleShot=True, interval=busy_threshold_ms)
+        self._busy_timer.timeout.connect(lambda: self._set_busy(True))
+
+        self._thread = QThread(self)
+        self._thread.setObjectName("engine")
+        self._worker = EngineWorker(bus, self.slots)
+        self._worker.moveToThread(self._thread)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._start_requested.connect(self._worker.start)
+        self._call_requested.connect(self._worker.call)
+        self._save_requested.connect(self._worker.save)
+        self._load_requested.connect(self._worker.load)
+        self._stop_requested.connect(self._worker.stop)
+        self._worker.done.connect(self._done)
+        self._worker.failed.connect(self._failed)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def busy(self) -> bool:
+        return self._busy
+
+    def start(
+        self,
+        seed: Optional[int] = None,
+        character: Optional[Dict[str, Any]] = None,
+        assets: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """(Re)create the adapter; a saved game is loaded when ``seed`` is None."""
+        request = self._submit("start")
+        self._start_requested.emit(
+            request, {"seed": seed, "character": character, "assets": assets}
+        )
+        return request
+
+    def call(self, method: str, *args: Any) -> int:
+        request = self._submit(method)
+        self._call_requested.emit(request, method, args)
+        return request
+
+    def save(self, slot: int = AUTOSAVE_SLOT, *, immediate: bool = False) -> int:
+        """Snapshot the game into ``slot``; the file is written within
+        ``DEBOUNCE_S`` (or at once) and then indexed."""
+        request = self._submit("save")
+        self._save_requested.emit(request, slot, immediate)
+        return request
+
+    def load(self, slot: int = AUTOSAVE_SLOT) -> int:
+        request = self._submit("load")
+        self._load_requested.emit(request, slot)
+        return request
+
+    def shutdown(self, timeout_ms: int = SHUTDOWN_TIMEOUT_MS) -> bool:
+        """Finish queued requests, flush pending saves and stop; False on timeout."""
+        if not self._thread.isRunning():
+            return True
+        self._stop_requested.emit()
+        return self._thread.wait(timeout_ms)
+
+    def _submit(self, method: str) -> int:
+        self._next_request += 1
+        self._pending[self._next_request] = method
+        if not self._busy_timer.isActive() and not self._busy:
+            self._busy_timer.start()
+        return self._next_request
+
+    def _settle(self, request: int) -> None:
+        if self._pending.pop(request, None) is None:
+            return
+        if self._pending:
+            if not self._busy:
+                self._busy_timer.start()  # time the next request afresh
+            return
+        self._busy_timer.stop()
+        self._set_busy(False)
+        self.idle.emit()
+
+    def _set_busy(self, busy: bool) -> None:
+        if busy != self._busy:
+            self._busy = busy
+            self.busy_changed.emit(busy)
+
+    def _done(self, request: int, method: str, elapsed_ms: float) -> None:
+        self._settle(request)
+        self.finished.emit(request, method, elapsed_ms)
+
+    def _failed(self, request: int, method: str, message: str) -> None:
+        self._settle(request)
+        self.failed.emit(request, method, message)
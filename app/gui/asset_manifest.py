@@ -0,0 +1,105 @@
+"""Runtime lookup of the pre-scaled variants built by ``tools.build_assets``.
+
+The manifest maps each source path to a content hash, and each hash to the
+variants written for it. An entry is only trusted while the source file's
+size and mtime still match what the build saw; otherwise callers fall back
+to decoding the original.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage, QPainter
+
+ASSET_CACHE_DIR = os.path.join(".cache", "assets")
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+_logger = logging.getLogger(__name__)
+
+
+class AssetManifest(object):
+    def __init__(self, data: Optional[Dict[str, Any]] = None, root: str = ASSET_CACHE_DIR):
+        data = data or {}
+        self.root = root
+        self._sources: Dict[str, Dict[str, Any]] = data.get("sources", {})
+        self._images: Dict[str, Dict[str, Any]] = data.get("images", {})
+
+    def __bool__(self) -> bool:
+        return bool(self._sources)
+
+    def _entry(self, path: str) -> Optional[Dict[str, Any]]:
+        source = self._sources.get(os.path.normpath(path))
+        if source is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if st.st_size != source["size"] or st.st_mtime_ns != source["mtime_ns"]:
+            return None
+        return self._images.get(source["hash"])
+
+    def read(self, path: str, size: QSize) -> Optional[QImage]:
+        """Return the smallest variant of ``path`` at least ``size`` large.
+
+        Trimmed variants are padded back onto a transparent canvas so the
+        result lines up exactly with the original image scaled to that size.
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        canvas_w, canvas_h = entry["canvas"]
+        candidates = [
+            v for v in entry["variants"]
+            if math.ceil(canvas_w * v["scale"]) >= size.width()
+            and math.ceil(canvas_h * v["scale"]) >= size.height()
+        ]
+        if not candidates:
+            return None
+        variant = min(candidates, key=lambda v: v["scale"])
+        image = QImage(os.path.join(self.root, variant["file"]))
+        if image.isNull():
+            return None
+        x, y, w, h = entry["trim"]
+        if (x, y, w, h) == (0, 0, canvas_w, canvas_h):
+            return image
+        scale = variant["scale"]
+        padded = QImage(
+            math.ceil(canvas_w * scale), math.ceil(canvas_h * scale), QImage.Format_ARGB32_Premultiplied
+        )
+        padded.fill(Qt.transparent)
+        painter = QPainter(padded)
+        painter.drawImage(round(x * scale), round(y * scale), image)
+        painter.end()
+        return padded
+
+
+_loaded: Optional[AssetManifest] = None
+_lock = threading.Lock()
+
+
+def load_manifest(root: str = ASSET_CACHE_DIR) -> AssetManifest:
+    """Load (once) the manifest under ``root``; empty if none was built."""
+    global _loaded
+    with _lock:
+        if _loaded is None or _loaded.root != root:
+            data: Dict[str, Any] = {}
+            try:
+                with open(os.path.join(root, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != MANIFEST_VERSION:
+                    data = {}
+            except FileNotFoundError:
+                pass
+            except Exception:
+                _logger.warning("Ignoring unreadable asset manifest in %s", root, exc_info=True)
+            _loaded = AssetManifest(data, root)
+        return _loaded
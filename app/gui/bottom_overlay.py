@@ -1,18 +1,94 @@
-from PySide6.QtCore import QEasingCurve, QPropertyAnimation, QRect, Qt
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractAnimation, QEasingCurve, QEvent, QPropertyAnimation, QRect, QStringListModel, Qt
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
     QPushButton,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QCompleter,
+    QLineEdit,
 )
 
+from app.gui.toast_history import ToastHistoryModel, search_proxy
+from string_table import S, StringTable, load_strings
+
+
+class CommandLine(QLineEdit):
+    """Free-text command entry completed from the engine's vocabulary trie."""
+
+    def __init__(self, bus, strings: Optional[StringTable] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bus = bus
+        strings = strings or load_strings()
+        self.setObjectName("command-line")
+        self.setPlaceholderText(strings[S.CMD_PLACEHOLDER])
+        self._model = QStringListModel(self)
+        self._completer = QCompleter(self._model, self)
+        # the engine has already filtered and ranked the candidates
+        self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer.setWidget(self)
+        self._completer.activated.connect(self.setText)
+
+        self.textEdited.connect(self.bus.completion_requested.emit)
+        self.returnPressed.connect(self._submit)
+        self.bus.completions_ready.connect(self._show_completions)
+
+    def _show_completions(self, completions):
+        self._model.setStringList(completions)
+        if completions and self.hasFocus() and self.text():
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def _accept_first(self):
+        completions = self._model.stringList()
+        if completions:
+            self.setText(completions[0])
+            self.bus.completion_requested.emit(self.text())
+
+    def _submit(self):
+        text = self.text().strip()
+        self.clear()
+        self._completer.popup().hide()
+        if text:
+            self.bus.command_entered.emit(text)
+
+    def event(self, event):  # type: ignore[override]
+        # Tab completes here instead of moving focus or toggling a pane.
+        if event.type() == QEvent.ShortcutOverride and event.key() == Qt.Key_Tab:
+            event.accept()
+            return True
+        if event.type() == QEvent.KeyPress and event.key() == Qt.Key_Tab:
+            self._accept_first()
+            return True
+        return super().event(event)
+
+
 class BottomOverlay(QWidget):
-    def __init__(self, bus, *args, **kwargs):
+    """Dialogue panel: speaker, text, choice buttons, toasts and command line.
+
+    Choice buttons are pooled: a payload relabels and shows/hides existing
+    buttons rather than rebuilding them, and a payload identical to the one
+    on screen is ignored.
+
+    The toast history is a view over a shared ``ToastHistoryModel`` (one
+    is created if none is passed), filtered by the search box above it.
+    """
+
+    def __init__(
+        self,
+        bus,
+        *args,
+        history: Optional[ToastHistoryModel] = None,
+        strings: Optional[StringTable] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.bus = bus
+        strings = strings or load_strings()
         self.setObjectName("bottom-overlay")
         self.setStyleSheet("""
         #bottom-overlay { background: rgba(14,17,20,220); border-top: 1px solid #2a2f36; }
@@ -21,22 +97,44 @@ class BottomOverlay(QWidget):
         QLabel#text { color:#eef; }
         QPushButton { padding:8px 12px; border:1px solid #3a3f46; background:#1b2027; color:#dde; }
         QPushButton:hover { border-color:#9ad1cc; }
+        QLineEdit#command-line, QLineEdit#history-search { padding:6px 8px; border:1px solid #3a3f46; background:#0e1114; color:#dde; }
         """)
         self.toast = QLabel(wordWrap=True, objectName="toast")
         self.toast.setVisible(False)
-        self.history = QListWidget()
+        if history is None:
+            history = ToastHistoryModel(parent=self)
+            self.bus.toast_logged.connect(history.append)
+            self.bus.toast_history_reset.connect(history.clear)
+        self.history_model = history
+        self._history_filter = search_proxy(history, self)
+        self.history_search = QLineEdit(objectName="history-search")
+        self.history_search.setPlaceholderText(strings[S.HISTORY_SEARCH_PLACEHOLDER])
+        self.history_search.setClearButtonEnabled(True)
+        self.history_search.textChanged.connect(self._history_filter.setFilterFixedString)
+        self.history_search.setVisible(False)
+        self.history = QListView()
         self.history.setObjectName("toast-history")
+        self.history.setModel(self._history_filter)
+        self.history.setUniformItemSizes(True)
+        self.history.setWordWrap(False)
         self.history.setVisible(False)
+        history.rowsInserted.connect(self._history_appended)
         self.speaker = QLabel(objectName="speaker")
         self.text = QLabel(wordWrap=True, objectName="text")
         self.choices = QHBoxLayout()
+        self._choice_buttons: List[QPushButton] = []
+        self._choice_ids: List[Any] = []
+        self._payload: Optional[Dict[str, Any]] = None
+        self.command = CommandLine(bus, strings)
         v = QVBoxLayout(self)
         v.setContentsMargins(16,12,16,12)
         v.addWidget(self.toast)
+        v.addWidget(self.history_search)
         v.addWidget(self.history)
         v.addWidget(self.speaker)
         v.addWidget(self.text)
         v.addLayout(self.choices)
+        v.addWidget(self.command)
         self.setVisible(False)
         self._anim = QPropertyAnimation(self, b"geometry", duration=180)
         self._anim.setEasingCurve(QEasingCurve.OutCubic)
@@ -44,35 +142,62 @@ class BottomOverlay(QWidget):
 
         self.bus.dialogue_ready.connect(self.show_dialogue)
         self.bus.toast.connect(self.show_toast)
-        self.bus.toast_history.connect(self._render_history)
 
     def resize_to(self, rect: QRect, height_px: int = 220):
         self.setGeometry(0, rect.height(), rect.width(), height_px)
 
     def show_panel(self, rect: QRect):
+        end = QRect(0, rect.height()-self.height(), rect.width(), self.height())
+        if self.isVisible() and (
+            self.geometry() == end
+            or (self._anim.state() == QAbstractAnimation.Running and self._anim.endValue() == end)
+        ):
+            return  # already shown or sliding in; don't restart the animation
         self.setVisible(True)
         self._anim.stop()
         self._anim.setStartValue(QRect(0, rect.height(), rect.width(), self.height()))
-        self._anim.setEndValue(QRect(0, rect.height()-self.height(), rect.width(), self.height()))
+        self._anim.setEndValue(end)
         self._anim.start()
 
     def clear_choices(self):
-        while self.choices.count():
-            item = self.choices.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        for button in self._choice_buttons:
+            button.setVisible(False)
+        self._choice_ids = []
+        self._payload = None
 
-    def show_dialogue(self, payload: dict):
-        self.speaker.setText(payload.get("speaker", ""))
-        self.text.setText(payload.get("text", ""))
-        self.clear_choices()
-        for opt in payload.get("options", []):
-            b = QPushButton(opt["label"])
-            b.clicked.connect(lambda _, oid=opt["id"]: self.bus.option_chosen.emit(oid))
+    def _choice_button(self, index: int) -> QPushButton:
+        while len(self._choice_buttons) <= index:
+            i = len(self._choice_buttons)
+            b = QPushButton(self)
+            b.clicked.connect(lambda _, i=i: self._choose(i))
             self.choices.addWidget(b)
+            self._choice_buttons.append(b)
+        return self._choice_buttons[index]
+
+    def _choose(self, index: int):
+        if index < len(self._choice_ids):
+            self.bus.option_chosen.emit(self._choice_ids[index])
+
+    def show_dialogue(self, payload: dict):
+        if payload != self._payload:
+            self._payload = payload
+            self._set_text(self.speaker, payload.get("speaker", ""))
+            self._set_text(self.text, payload.get("text", ""))
+            options = payload.get("options", [])
+            self._choice_ids = [opt["id"] for opt in options]
+            for i, opt in enumerate(options):
+                b = self._choice_button(i)
+                self._set_text(b, opt["label"])
+                b.setVisible(True)
+            for b in self._choice_buttons[len(options):]:
+                b.setVisible(False)
         self.show_panel(self.parent().rect())
 
+    @staticmethod
+    def _set_text(widget, text: str):
+        if widget.text() != text:
+            widget.setText(text)
+
     def show_toast(self, message: str):
         self.toast.setVisible(bool(message))
         self.toast.setText(message)
@@ -83,19 +208,13 @@ class BottomOverlay(QWidget):
         if self.history.isVisible():
             self.history.scrollToBottom()
 
-    def _render_history(self, entries):
-        self.history.clear()
-        if not entries:
-            item = QListWidgetItem("—", self.history)
-            item.setFlags(Qt.NoItemFlags)
-        else:
-            for entry in entries:
-                QListWidgetItem(entry, self.history)
-        if self._history_visible:
-            self.history.setVisible(True)
+    def _history_appended(self, *_):
+        if self._history_visible and not self.history_search.text():
+            self.history.scrollToBottom()
 
     def toggle_history(self):
         self._history_visible = not self._history_visible
+        self.history_search.setVisible(self._history_visible)
         self.history.setVisible(self._history_visible)
         if self._history_visible:
             parent = self.parent()
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -11,45 +11,40 @@ from PySide6.QtWidgets import (
     QProgressBar,
 )
 
+from string_table import S, StringTable, load_strings
+
 
 class CharacterPane(QWidget):
-    def __init__(self, *args, ui_strings: Optional[Dict[str, Any]] = None, **kwargs):
+    def __init__(self, *args, strings: Optional[StringTable] = None, **kwargs):
         super().__init__(*args, **kwargs)
-        ui = ui_strings or {}
-        self._placeholder = ui.get("placeholder", "—")
-        self._list_join = ui.get("list_join", ", ")
-        self._level_format = ui.get("level_format", "Level {level}")
-        self._hp_format = ui.get("hp_format", "HP %v")
-        self._mp_format = ui.get("mp_format", "MP %v")
-        self._stamina_format = ui.get("stamina_format", "STA %v")
-        self._inventory_format = ui.get(
-            "inventory_entry_format", "{name} ×{qty}"
-        )
+        self._strings = strings = strings or load_strings()
+        self._placeholder = strings[S.CHAR_PLACEHOLDER]
+        self._list_join = strings[S.CHAR_LIST_JOIN]
 
         root = QVBoxLayout(self)
         self.name_lbl = QLabel(self._placeholder)
-        self.level_lbl = QLabel(self._level_format.format(level=1))
+        self.level_lbl = QLabel(strings.format(S.CHAR_LEVEL_FORMAT, level=1))
         bars = QGridLayout()
         self.hp = QProgressBar()
-        self.hp.setFormat(self._hp_format)
+        self.hp.setFormat(strings[S.CHAR_HP_FORMAT])
         self.mp = QProgressBar()
-        self.mp.setFormat(self._mp_format)
+        self.mp.setFormat(strings[S.CHAR_MP_FORMAT])
         self.sta = QProgressBar()
-        self.sta.setFormat(self._stamina_format)
+        self.sta.setFormat(strings[S.CHAR_STAMINA_FORMAT])
         bars.addWidget(self.hp, 0, 0)
         bars.addWidget(self.mp, 0, 1)
         bars.addWidget(self.sta, 0, 2)
 
-        self.attrs_lbl = QLabel(f"<b>{ui.get('attributes_title', 'Attributes')}</b>")
+        self.attrs_lbl = QLabel(f"<b>{strings[S.CHAR_ATTRIBUTES_TITLE]}</b>")
         self.attrs = QLabel(self._placeholder)
-        self.affinity_lbl = QLabel(f"<b>{ui.get('affinity_title', 'Affinity')}</b>")
+        self.affinity_lbl = QLabel(f"<b>{strings[S.CHAR_AFFINITY_TITLE]}</b>")
         self.affinity = QListWidget()
-        self.skills_lbl = QLabel(f"<b>{ui.get('skills_title', 'Skills')}</b>")
+        self.skills_lbl = QLabel(f"<b>{strings[S.CHAR_SKILLS_TITLE]}</b>")
         self.skills = QLabel(self._placeholder)
-        self.cond_lbl = QLabel(f"<b>{ui.get('conditions_title', 'Conditions')}</b>")
+        self.cond_lbl = QLabel(f"<b>{strings[S.CHAR_CONDITIONS_TITLE]}</b>")
         self.cond = QLabel(self._placeholder)
 
-        self.inv_lbl = QLabel(f"<b>{ui.get('inventory_title', 'Inventory')}</b>")
+        self.inv_lbl = QLabel(f"<b>{strings[S.CHAR_INVENTORY_TITLE]}</b>")
         self.inv = QListWidget()
 
         root.addWidget(self.name_lbl)
@@ -72,7 +67,9 @@ class CharacterPane(QWidget):
 
     def update_stats(self, s):
         self.name_lbl.setText(f"<b>{s.get('name', '')}</b>")
-        self.level_lbl.setText(self._level_format.format(level=s.get("level", 1)))
+        self.level_lbl.setText(
+            self._strings.format(S.CHAR_LEVEL_FORMAT, level=s.get("level", 1))
+        )
         self.hp.setMaximum(max(s.get("hp", 1), 1))
         self.hp.setValue(s.get("hp", 1))
         self.mp.setMaximum(max(s.get("mp", 0), 1))
@@ -106,6 +103,6 @@ class CharacterPane(QWidget):
             name = it.get("name", it.get("id", "item"))
             qty = it.get("qty", 1)
             QListWidgetItem(
-                self._inventory_format.format(name=name, qty=qty),
+                self._strings.format(S.CHAR_INVENTORY_ENTRY, name=name, qty=qty),
                 self.inv,
             )
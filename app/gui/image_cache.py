@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage, QImageReader
+
+from app.gui.asset_manifest import load_manifest
+
+DEFAULT_BUDGET_BYTES = 96 * 1024 * 1024
+
+# Decode scales are rounded up to multiples of this, so small window
+# resizes reuse the cached decode instead of re-reading the file.
+SCALE_STEP = 1 / 8
+
+
+def _image_bytes(image: QImage) -> int:
+    return image.sizeInBytes()
+
+
+class _Entry(NamedTuple):
+    image: QImage
+    native: QSize  # full-resolution size of the file
+
+    def covers(self, size: QSize) -> bool:
+        image = self.image
+        return image.size() == self.native or (
+            image.width() >= size.width() and image.height() >= size.height()
+        )
+
+
+def needed_size(native: QSize, target: Optional[QSize], mode=Qt.KeepAspectRatioByExpanding) -> QSize:
+    """Smallest size of ``native`` that scales to ``target`` without upsampling."""
+    if target is None or target.isEmpty() or native.isEmpty():
+        return native
+    return native.scaled(target, mode).boundedTo(native)
+
+
+def decode_size(native: QSize, target: Optional[QSize], mode=Qt.KeepAspectRatioByExpanding) -> QSize:
+    """``needed_size`` rounded up to the next decode scale step."""
+    if target is None or target.isEmpty() or native.isEmpty():
+        return native
+    needed = needed_size(native, target, mode)
+    scale = max(needed.width() / native.width(), needed.height() / native.height())
+    scale = math.ceil(scale / SCALE_STEP) * SCALE_STEP
+    if scale >= 1:
+        return native
+    return QSize(
+        max(1, math.ceil(native.width() * scale)),
+        max(1, math.ceil(native.height() * scale)),
+    )
+
+
+def read_image(
+    path: str, target: Optional[QSize] = None, mode=Qt.KeepAspectRatioByExpanding
+) -> Tuple[QImage, QSize]:
+    """Decode ``path`` at the smallest size that still covers ``target``.
+
+    A pre-scaled variant from the asset manifest is used when one is large
+    enough. Returns ``(image, native_size)``; the image is null if the file
+    could not be read.
+    """
+    reader = QImageReader(path)
+    native = reader.size()
+    variant = load_manifest().read(path, needed_size(native, target, mode))
+    if variant is not None:
+        return variant, native
+    size = decode_size(native, target, mode)
+    if size != native:
+        reader.setScaledSize(size)
+    image = reader.read()
+    if native.isEmpty():
+        native = image.size()
+    return image, native
+
+
+class ImageCache:
+    """Byte-budgeted LRU of decoded images keyed by resolved file path.
+
+    Images are kept as ``QImage`` so they can be scaled off the GUI thread;
+    callers convert only the (small) scaled result to a ``QPixmap``. All
+    access is serialised by a lock because prefetch workers insert entries.
+
+    Callers pass the size they will display an image at, and files are
+    decoded straight to (roughly) that size with ``QImageReader``. A cached
+    decode is reused while it is large enough and replaced by a larger one
+    only when the window outgrows it.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str) -> str:
+        return os.path.realpath(path)
+
+    def image(
+        self, path: str, target: Optional[QSize] = None, mode=Qt.KeepAspectRatioByExpanding
+    ) -> Optional[QImage]:
+        """Return ``path`` decoded at least large enough for ``target``.
+
+        Without a target the image is decoded at full resolution.
+        """
+        key = self.key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.covers(needed_size(entry.native, target, mode)):
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.image
+            self.misses += 1
+        image, native = read_image(path, target, mode)
+        if image.isNull():
+            return None
+        return self.put(path, image, native)
+
+    def peek(
+        self, path: str, target: Optional[QSize] = None, mode=Qt.KeepAspectRatioByExpanding
+    ) -> Optional[QImage]:
+        """Like ``image()`` but never decodes; ``None`` unless a large enough copy is cached."""
+        key = self.key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.covers(needed_size(entry.native, target, mode)):
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.image
+            self.misses += 1
+        return None
+
+    def put(self, path: str, image: QImage, native: Optional[QSize] = None) -> QImage:
+        """Store an image decoded elsewhere (e.g. on a prefetch worker).
+
+        If a larger decode of the same file is already cached it is kept
+        and returned instead.
+        """
+        key = self.key(path)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= _image_bytes(previous.image)
+                native = native or previous.native
+                if previous.image.width() > image.width():
+                    image = previous.image
+            self._insert(key, _Entry(image, native or image.size()))
+            return image
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            return self.key(path) in self._entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+    def _insert(self, key: str, entry: _Entry) -> None:
+        self._bytes += _image_bytes(entry.image)
+        self._entries[key] = entry
+        # keep at least the newest entry even if it alone exceeds the budget
+        while self._bytes > self.budget_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _image_bytes(evicted.image)
+
+
+_shared: Optional[ImageCache] = None
+
+
+def shared_cache() -> ImageCache:
+    """Process-wide cache used by every scene widget."""
+    global _shared
+    if _shared is None:
+        _shared = ImageCache()
+    return _shared
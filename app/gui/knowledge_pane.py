@@ -1,56 +1,116 @@
-from typing import Any, Dict, Optional
+from typing import Dict, List, Optional
 
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QTabWidget,
     QLabel,
+    QLineEdit,
 )
 
+from knowledge_index import SECTIONS, KnowledgeIndex
+from string_table import S, StringTable, load_strings
+
+
+class KnowledgeListModel(QAbstractListModel):
+    """Rows of one knowledge section; display text is built on demand."""
+
+    def __init__(self, section: str, joiner: str, parent=None):
+        super().__init__(parent)
+        self.section = section
+        self._joiner = joiner
+        self._index: Optional[KnowledgeIndex] = None
+        self._rows: List[int] = []
+        self._text: Dict[int, str] = {}
+
+    def set_rows(self, index: KnowledgeIndex, rows: List[int]) -> None:
+        self.beginResetModel()
+        if index is not self._index:
+            self._text.clear()
+        self._index = index
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole) or not 0 <= index.row() < len(self._rows):
+            return None
+        number = self._rows[index.row()]
+        text = self._text.get(number)
+        if text is None:
+            text = self._text[number] = self._index.display_text(number, self.section, self._joiner)
+        return text
+
+
 class KnowledgePane(QWidget):
-    def __init__(self, *args, ui_strings: Optional[Dict[str, Any]] = None, **kwargs):
+    """Tabbed lore browser with a full-text search box.
+
+    ``knowledge_updated`` only rebuilds the search index; a tab's rows are
+    computed when that tab is shown (or re-filtered while it is shown).
+    """
+
+    def __init__(self, *args, strings: Optional[StringTable] = None, **kwargs):
         super().__init__(*args, **kwargs)
-        ui = ui_strings or {}
-        self._joiner = ui.get("entry_joiner", " — ")
+        self._strings = strings = strings or load_strings()
+        self._joiner = strings[S.KNOW_ENTRY_JOINER]
         root = QVBoxLayout(self)
+        self.search = QLineEdit()
+        self.search.setPlaceholderText(strings[S.KNOW_SEARCH_PLACEHOLDER])
+        self.search.setClearButtonEnabled(True)
         self.tabs = QTabWidget()
-        self.notes = QListWidget()
-        self.factions = QListWidget()
-        self.sites = QListWidget()
-        self.tech = QListWidget()
-        self.status = QLabel(ui.get("status_placeholder", ""))
-        self._travel_format = ui.get("travel_format", "Going to: {destination}")
-        self.tabs.addTab(self.notes, ui.get("notes_tab", "Notes"))
-        self.tabs.addTab(self.factions, ui.get("factions_tab", "Factions & Enclaves"))
-        self.tabs.addTab(self.sites, ui.get("sites_tab", "Sites & Rumours"))
-        self.tabs.addTab(self.tech, ui.get("tech_tab", "Tech & Lore"))
+        self._models: List[KnowledgeListModel] = []
+        self._stale: List[bool] = []
+        for section, title in zip(
+            SECTIONS,
+            (S.KNOW_NOTES_TAB, S.KNOW_FACTIONS_TAB, S.KNOW_SITES_TAB, S.KNOW_TECH_TAB),
+        ):
+            model = KnowledgeListModel(section, self._joiner, self)
+            view = QListView()
+            view.setModel(model)
+            view.setUniformItemSizes(True)
+            setattr(self, section, view)
+            self._models.append(model)
+            self._stale.append(False)
+            self.tabs.addTab(view, strings[title])
+        self.status = QLabel(strings[S.KNOW_STATUS_PLACEHOLDER])
+        root.addWidget(self.search)
         root.addWidget(self.tabs)
         root.addWidget(self.status)
 
+        self._index = KnowledgeIndex({})
+        self._matches = None
+        self.search.textChanged.connect(self._filter)
+        self.tabs.currentChanged.connect(self._populate)
+
     def bind_bus(self, bus):
         bus.knowledge_updated.connect(self.update_knowledge)
         bus.travel_chosen.connect(self.update_status)
 
     def update_knowledge(self, k):
-        def fill(lst, items, key_order):
-            lst.clear()
-            for e in items:
-                parts = [
-                    str(e.get(key, ""))
-                    for key in key_order
-                    if e.get(key) is not None
-                ]
-                QListWidgetItem(
-                    self._joiner.join(p for p in parts if p),
-                    lst,
-                )
-
-        fill(self.notes, k.get("notes", []), ["title", "text"])
-        fill(self.factions, k.get("factions", []), ["name", "summary"])
-        fill(self.sites, k.get("sites", []), ["name", "summary"])
-        fill(self.tech, k.get("tech", []), ["name", "summary"])
+        self._index = KnowledgeIndex(k)
+        self._matches = self._index.search(self.search.text())
+        self._invalidate()
+
+    def _filter(self, text: str):
+        self._matches = self._index.search(text)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._stale = [True] * len(self._models)
+        self._populate(self.tabs.currentIndex())
+
+    def _populate(self, tab: int):
+        if not 0 <= tab < len(self._models) or not self._stale[tab]:
+            return
+        model = self._models[tab]
+        model.set_rows(self._index, self._index.section_rows(model.section, self._matches))
+        self._stale[tab] = False
 
     def update_status(self, destination: str):
-        self.status.setText(self._travel_format.format(destination=destination))
+        self.status.setText(
+            self._strings.format(S.KNOW_TRAVEL_FORMAT, destination=destination)
+        )
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Qt
+from PySide6.QtWidgets import QApplication, QLabel
+
+# Bus signals that start a measured action, and those the engine answers with.
+INPUT_SIGNALS = ("option_chosen", "travel_chosen", "talk_to", "command_entered", "pause_elapsed")
+OUTPUT_SIGNALS = (
+    "scene_changed",
+    "dialogue_ready",
+    "nav_ready",
+    "state_changed",
+    "stats_updated",
+    "toast",
+    "toast_logged",
+)
+EXPORT_PATH = os.path.join(".cache", "latency.json")
+
+
+class Histogram(object):
+    """Log-bucketed latency counts plus a rolling window for percentiles."""
+
+    # 0.25 ms .. ~4 s, doubling; the last bucket catches everything above
+    BOUNDS_MS = tuple(0.25 * 2 ** i for i in range(15))
+
+    def __init__(self, window: int = 512):
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total = 0
+
+    def add(self, ms: float) -> None:
+        self.recent.append(ms)
+        self.counts[bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.total += 1
+
+    def percentiles(self, points=(50, 95, 99)) -> Dict[str, float]:
+        ordered = sorted(self.recent)
+        if not ordered:
+            return {f"p{p}": 0.0 for p in points}
+        last = len(ordered) - 1
+        return {f"p{p}": ordered[min(last, round(last * p / 100))] for p in points}
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.total,
+            "rolling": self.percentiles(),
+            "bucket_upper_ms": list(self.BOUNDS_MS) + [None],
+            "buckets": list(self.counts),
+        }
+
+
+class LatencyTracker(QObject):
+    """Time each player action from its Bus input signal to the first paint
+    after the engine has answered it.
+
+    The window reports the engine request an action caused (``expect``) and
+    when the engine thread finished it (``answered``); paints before that
+    belong to something else. Per action it records the total
+    (``<action>→paint``) and when each
+    engine→UI signal first reached the GUI thread (``<action>:<signal>``).
+    The window adds ``engine:<method>``, the time a request spent on the
+    engine thread. Independently, ``ui:<signal>`` is the
+    time the widgets connected to a signal took to handle it; that needs
+    ``finish_wiring()`` once every widget has connected.
+    """
+
+    def __init__(self, bus, parent=None):
+        super().__init__(parent)
+        self.bus = bus
+        self.histograms: Dict[str, Histogram] = {}
+        self._action: Optional[str] = None
+        self._request: Optional[int] = None
+        self._answered = False
+        self._started = 0.0
+        self._seen: set = set()
+        self._delivering: Dict[str, List[float]] = {}
+        self._filtering = False
+        for name in INPUT_SIGNALS:
+            getattr(bus, name).connect(lambda *_, n=name: self._begin(n))
+        for name in OUTPUT_SIGNALS:
+            getattr(bus, name).connect(lambda *_, n=name: self._before(n))
+
+    def finish_wiring(self) -> None:
+        for name in OUTPUT_SIGNALS:
+            getattr(self.bus, name).connect(lambda *_, n=name: self._after(n))
+
+    def record(self, metric: str, ms: float) -> None:
+        hist = self.histograms.get(metric)
+        if hist is None:
+            hist = self.histograms[metric] = Histogram()
+        hist.add(ms)
+
+    def expect(self, request: int) -> None:
+        """The current action is answered once engine ``request`` finishes."""
+        if self._action is not None and self._request is None:
+            self._request = request
+
+    def answered(self, request: int) -> None:
+        if request == self._request:
+            self._answered = True
+
+    def _begin(self, action: str) -> None:
+        self._action = action
+        self._request = None
+        self._answered = False
+        self._started = time.perf_counter()
+        self._seen.clear()
+        if not self._filtering:
+            app = QApplication.instance()
+            if app is not None:
+                app.installEventFilter(self)
+                self._filtering = True
+
+    def _before(self, signal: str) -> None:
+        now = time.perf_counter()
+        self._delivering.setdefault(signal, []).append(now)
+        if self._action is not None and signal not in self._seen:
+            self._seen.add(signal)
+            self.record(f"{self._action}:{signal}", (now - self._started) * 1e3)
+
+    def _after(self, signal: str) -> None:
+        starts = self._delivering.get(signal)
+        if starts:
+            self.record(f"ui:{signal}", (time.perf_counter() - starts.pop()) * 1e3)
+
+    def eventFilter(self, obj, event):  # type: ignore[override]
+        if event.type() == QEvent.Paint and self._action is not None and self._answered:
+            self.record(f"{self._action}→paint", (time.perf_counter() - self._started) * 1e3)
+            self._action = None
+            QApplication.instance().removeEventFilter(self)
+            self._filtering = False
+        return False
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        return {name: hist.as_dict() for name, hist in sorted(self.histograms.items())}
+
+    def export(self, path: str = EXPORT_PATH) -> str:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"unit": "ms", "metrics": self.snapshot()}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+        return path
+
+
+class LatencyOverlay(QLabel):
+    """Debug readout of rolling p50/p95/p99 per metric; refreshes while shown."""
+
+    def __init__(self, tracker: LatencyTracker, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self.setObjectName("latency-overlay")
+        self.setStyleSheet(
+            "#latency-overlay { background: rgba(0,0,0,190); color:#9ad1cc;"
+            " font-family: monospace; font-size: 11px; padding:6px; }"
+        )
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setVisible(False)
+        self._timer = QTimer(self, interval=500)
+        self._timer.timeout.connect(self.refresh)
+
+    def toggle(self) -> None:
+        visible = not self.isVisible()
+        self.setVisible(visible)
+        if visible:
+            self.refresh()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def refresh(self) -> None:
+        lines = [f"{'metric':30} {'n':>5} {'p50':>7} {'p95':>7} {'p99':>7}"]
+        for name, hist in sorted(self.tracker.histograms.items()):
+            p = hist.percentiles()
+            lines.append(
+                f"{name[:30]:30} {hist.total:5d} {p['p50']:7.2f} {p['p95']:7.2f} {p['p99']:7.2f}"
+            )
+        if len(lines) == 1:
+            lines.append("no actions yet")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(parent.width() - self.width() - 12, 72)
@@ -1,108 +1,125 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, Optional, Set
 
 import logging
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer, Qt, Signal
 from PySide6.QtGui import QAction, QKeySequence, QShortcut
 from PySide6.QtWidgets import QLabel, QInputDialog, QWidget
 
 from app.bus import Bus
-from app.engine_adapter import EngineAdapter
+from app.engine_worker import EngineHost
 from app.gui.bottom_overlay import BottomOverlay
 from app.gui.character_pane import CharacterPane
 from app.gui.knowledge_pane import KnowledgePane
+from app.gui.latency import LatencyOverlay, LatencyTracker
 from app.gui.nav_overlay import NavOverlay
+from app.gui.prefetch import Prefetcher
+from app.gui.save_slots_dialog import SaveSlotDialog
 from app.gui.scene import CenterScene
 from app.gui.sliding_pane import SlidingPane
-from app.loaders import load_character, load_knowledge
-from script_loader import load_script
+from app.gui.thumbnails import Thumbnailer
+from app.gui.toast_history import ToastHistoryModel
+from app.save_slots import AUTOSAVE_SLOT
+from app.startup import DataLoader, trace
+from string_table import S, load_strings
+
+# Data the engine cannot start without.
+ENGINE_INPUTS = ("script", "character", "assets")
+# Engine requests that change saved state and so schedule an autosave.
+AUTOSAVE_AFTER = ("apply_choice", "resume", "travel_to", "focus", "run_command")
 
 
 class MainWindow(QWidget):
-    def __init__(self, seed: Optional[int] = None):
+    """Game window.
+
+    Data files load concurrently on worker threads and fill the panes as
+    they arrive. With ``deferred=True`` the window can be shown before any
+    of them are read and the engine starts only after the first paint;
+    otherwise the constructor waits for the data and requests the engine
+    start itself. Either way the engine runs on its own thread (see
+    ``app.engine_worker``) and answers through the bus. With ``autosave``
+    the game is saved in the background after state changes and on close.
+    """
+
+    started = Signal()  # engine initialised (or failed to) for the first time
+
+    def __init__(
+        self, seed: Optional[int] = None, *, deferred: bool = False, autosave: bool = True
+    ):
         super().__init__()
         self.setMinimumSize(1280, 720)
         self.bus = Bus()
         self._logger = logging.getLogger(__name__)
-
-        self.script = load_script()
-        self.ui_strings = self.script.get("ui", {})
-        main_ui = self.ui_strings.get("main_window", {})
-        self.setWindowTitle(main_ui.get("title", "CRPG–VN Hybrid (Long Twilight)"))
+        # connected first so it sees every input before the handlers run
+        self.latency = LatencyTracker(self.bus, self)
+
+        self._data: Dict[str, Any] = {}
+        self._failed: Set[str] = set()
+        self._loader = DataLoader(parent=self)
+        # queued even when a loader finishes on this thread, so results
+        # never arrive before the widgets below exist
+        self._loader.loaded.connect(self._data_loaded, Qt.QueuedConnection)
+        self._loader.failed.connect(self._data_failed, Qt.QueuedConnection)
+        self._loader.start()
+
+        with trace.phase("strings"):
+            self.strings = load_strings()
+        self.setWindowTitle(self.strings[S.WINDOW_TITLE])
 
         # Center scene (background + sprite)
         self.scene = CenterScene(self)
         self.bus.scene_changed.connect(self._update_scene)
+        self.prefetcher = Prefetcher(parent=self)
+        self.bus.prefetch_hint.connect(self.prefetcher.prefetch)
+        self.thumbnailer = Thumbnailer(parent=self)
 
         # UI overlays
-        self.nav = NavOverlay(
-            self.bus,
-            ui_strings=self.ui_strings.get("nav_overlay"),
-            parent=self,
-        )
+        self.nav = NavOverlay(self.bus, strings=self.strings, parent=self)
 
         # Panes
-        char_data = load_character()
-        know_data = load_knowledge()
-
         self.left = SlidingPane(
             "left",
             width_px=360,
-            title=char_data.get("name", "You"),
+            title=self.strings[S.PLAYER_FALLBACK_NAME],
             parent=self,
         )
-        knowledge_title = main_ui.get("knowledge_title", "Knowledge")
         self.right = SlidingPane(
             "right",
             width_px=420,
-            title=knowledge_title,
+            title=self.strings[S.KNOWLEDGE_TITLE],
             parent=self,
         )
 
-        self._summary_title = QLabel("<b>Stats</b>", parent=self.left)
-        self._summary_title.setStyleSheet("color:#9ad1cc;")
-        self._summary = QLabel("MC: —\nTalking to: —\nOpinion: —\nKnown: —", parent=self.left)
-        self._summary.setStyleSheet("color:#dde;")
-        self._summary.setWordWrap(True)
-        self._summary.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.left.content.addWidget(self._summary_title)
-        self.left.content.addWidget(self._summary)
-
-        self.char_pane = CharacterPane(
-            parent=self.left,
-            ui_strings=self.ui_strings.get("character_pane"),
-        )
-        self.char_pane.bind_bus(self.bus)
-        self.left.content.addWidget(self.char_pane)
-
-        self._recent_title = QLabel("<b>Recent</b>", parent=self.right)
-        self._recent_title.setStyleSheet("color:#9ad1cc;")
-        self._recent = QLabel("—", parent=self.right)
-        self._recent.setStyleSheet("color:#dde;")
-        self._recent.setWordWrap(True)
-        self._recent.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.right.content.addWidget(self._recent_title)
-        self.right.content.addWidget(self._recent)
-
-        self.know_pane = KnowledgePane(
-            parent=self.right,
-            ui_strings=self.ui_strings.get("knowledge_pane"),
-        )
-        self.know_pane.bind_bus(self.bus)
-        self.right.content.addWidget(self.know_pane)
-
-        self.bus.stats_updated.connect(self._update_summary)
-        self.bus.toast_history.connect(self._update_recent)
+        # Pane contents are built on first open; until then only the latest
+        # payload of each kind is kept.
+        self.char_pane: Optional[CharacterPane] = None
+        self.know_pane: Optional[KnowledgePane] = None
+        self._summary: Optional[QLabel] = None
+        self._recent: Optional[QLabel] = None
+        self._pane_payloads: Dict[str, Any] = {}
+        self.bus.stats_updated.connect(lambda s: self._buffer_payload("stats", s))
+        self.bus.inventory_updated.connect(lambda i: self._buffer_payload("inventory", i))
+        self.bus.knowledge_updated.connect(lambda k: self._buffer_payload("knowledge", k))
+
+        self.toast_history = ToastHistoryModel(parent=self)
+        self.bus.toast_logged.connect(self.toast_history.append)
+        self.bus.toast_history_reset.connect(self.toast_history.clear)
+        self.toast_history.rowsInserted.connect(self._update_recent)
+        self.toast_history.modelReset.connect(self._update_recent)
 
         # Bottom overlay
-        self.overlay = BottomOverlay(self.bus, parent=self)
-
-        # Seed panes
-        self._emit_character(char_data)
-        self.bus.inventory_updated.emit(char_data.get("inventory", []))
-        self.bus.knowledge_updated.emit(know_data)
+        self.overlay = BottomOverlay(
+            self.bus, parent=self, history=self.toast_history, strings=self.strings
+        )
+        self.latency_overlay = LatencyOverlay(self.latency, parent=self)
+        self.busy_label = QLabel(self.strings[S.BUSY_LABEL], parent=self)
+        self.busy_label.setStyleSheet(
+            "background: rgba(0,0,0,170); color:#9ad1cc; padding:4px 10px; border-radius:4px;"
+        )
+        self.busy_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.busy_label.setVisible(False)
 
         # Hotkeys
         self._bind_hotkeys()
@@ -110,6 +127,10 @@ class MainWindow(QWidget):
         # Signal plumbing
         self.bus.travel_chosen.connect(self._travel)
         self.bus.talk_to.connect(self._talk)
+        self.bus.command_entered.connect(self._command)
+        self.bus.completion_requested.connect(self._complete)
+
+        self.latency.finish_wiring()
 
         # Deterministic seed controls
         self.setContextMenuPolicy(Qt.ActionsContextMenu)
@@ -117,24 +138,83 @@ class MainWindow(QWidget):
         self._deterministic_action = self._create_deterministic_action()
 
         # Engine setup
-        self.engine: Optional[EngineAdapter] = None
-        self._init_engine(seed)
+        self.engine: Optional[EngineHost] = None
+        self._dialogue_turn: Optional[int] = None
+        self._autosave = autosave
+        self._start_seed = seed
+        self._painted = False
+        self._started = False
+        if not deferred:
+            for name in ("character", "knowledge", *ENGINE_INPUTS):
+                if name in self._data or name in self._failed:
+                    continue
+                try:
+                    data = self._loader.result(name)
+                except Exception as exc:
+                    self._data_failed(name, str(exc))
+                else:
+                    self._data_loaded(name, data)
+            self._painted = True  # don't wait for a paint that may never come
+            self._maybe_start()
+
+    # -------- startup --------
+    def _data_loaded(self, name: str, data: Any) -> None:
+        if name in self._data or name in self._failed:
+            return  # already taken synchronously
+        self._data[name] = data
+        if name == "character":
+            name = data.get("name", self.strings[S.PLAYER_FALLBACK_NAME])
+            self.left.title.setText(f"<b>{name}</b>")
+            self._emit_character(data)
+            self.bus.inventory_updated.emit(data.get("inventory", []))
+        elif name == "knowledge":
+            self.bus.knowledge_updated.emit(data)
+        self._maybe_start()
+
+    def _data_failed(self, name: str, message: str) -> None:
+        if name in self._data or name in self._failed:
+            return  # already reported synchronously
+        self._failed.add(name)
+        self._logger.error("Failed to load %s: %s", name, message)
+        msg = self.strings.format(S.LOAD_FAILED, name=name, message=message)
+        if name in ENGINE_INPUTS:
+            self._startup_failed(msg)
+        else:
+            self.bus.toast.emit(msg)
+
+    def paintEvent(self, event):  # type: ignore[override]
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            trace.mark("first_paint")
+            # let this frame reach the screen before starting the engine
+            QTimer.singleShot(0, self._maybe_start)
+
+    def _startup_failed(self, msg: str) -> None:
+        """Report a fatal startup error and finish startup without an engine;
+        the window stays up but every engine request is a no-op."""
+        self.bus.toast.emit(msg)
+        try:
+            from PySide6.QtWidgets import QMessageBox
+
+            QMessageBox.critical(self, self.strings[S.STARTUP_ERROR_TITLE], msg)
+        except Exception:
+            pass
+        self._started = True
+        # may run inside the constructor, before anyone could connect to started
+        QTimer.singleShot(0, self._engine_started)
+
+    def _maybe_start(self) -> None:
+        if self._started or not self._painted:
+            return
+        if any(name not in self._data for name in ENGINE_INPUTS):
+            return
+        self._started = True
+        self._init_engine(self._start_seed)
 
     def _create_deterministic_action(self) -> QAction:
-        determinism_ui = self.ui_strings.get("determinism", {})
-        label = determinism_ui.get("action_label")
-        if not label:
-            label = self.ui_strings.get("main_window", {}).get(
-                "deterministic_seed_action",
-                "Deterministic Seed",
-            )
-        action = QAction(label, self)
-        shortcut = determinism_ui.get("deterministic_seed_shortcut")
-        if not shortcut:
-            shortcut = self.ui_strings.get("main_window", {}).get(
-                "deterministic_seed_shortcut",
-                "Ctrl+D",
-            )
+        action = QAction(self.strings[S.SEED_ACTION], self)
+        shortcut = self.strings[S.SEED_SHORTCUT]
         if shortcut:
             action.setShortcut(shortcut)
         action.triggered.connect(self._prompt_deterministic_seed)
@@ -142,44 +222,58 @@ class MainWindow(QWidget):
         return action
 
     def _prompt_deterministic_seed(self) -> None:
-        determinism_ui = self.ui_strings.get("determinism", {})
-        title = determinism_ui.get("dialog_title", "Deterministic Seed")
-        prompt = determinism_ui.get(
-            "dialog_prompt", "Enter a seed for deterministic simulation:"
-        )
         current = self._seed if self._seed is not None else 0
-        seed, ok = QInputDialog.getInt(self, title, prompt, current)
+        seed, ok = QInputDialog.getInt(
+            self,
+            self.strings[S.SEED_DIALOG_TITLE],
+            self.strings[S.SEED_DIALOG_PROMPT],
+            current,
+        )
         if ok:
             self._seed = seed
             self._init_engine(seed)
-            toast = determinism_ui.get("toast", "")
+            toast = self.strings.format(S.SEED_TOAST, seed=seed)
             if toast:
-                self.bus.toast.emit(toast.format(seed=seed))
+                self.bus.toast.emit(toast)
 
     def _init_engine(self, seed: Optional[int]) -> None:
         self._seed = seed
-        try:
-            self.engine = EngineAdapter(self.bus, seed=seed)
-            loaded = False
-            if seed is None:
-                loaded = self.engine.load()
-            if not loaded:
-                self.engine.advance_dialogue()
-        except Exception as exc:  # pragma: no cover - UI safety net
-            self._logger.exception("Failed to initialise engine")
-            msg = f"Engine initialisation failed:\n{exc}"
-            self.bus.toast.emit(msg)
-            try:
-                from PySide6.QtWidgets import QMessageBox
-
-                QMessageBox.critical(self, "Startup Error", msg)
-            except Exception:
-                pass
-            self.engine = None
+        if self.engine is None:
+            self.engine = EngineHost(self.bus, parent=self)
+            self.engine.finished.connect(self._engine_finished)
+            self.engine.failed.connect(self._engine_failed)
+            self.engine.busy_changed.connect(self._show_busy)
+        self.engine.start(seed, self._data.get("character"), self._data.get("assets"))
+
+    def _engine_finished(self, request: int, method: str, elapsed_ms: float) -> None:
+        self.latency.record(f"engine:{method}", elapsed_ms)
+        self.latency.answered(request)
+        if method == "start":
+            self._engine_started()
+        elif method in AUTOSAVE_AFTER and self._autosave:
+            self._save_to(AUTOSAVE_SLOT, immediate=False)
+
+    def _engine_failed(self, request: int, method: str, message: str) -> None:
+        self.latency.answered(request)
+        if method != "start":
+            self.bus.toast.emit(message)
+            return
+        self._startup_failed(self.strings.format(S.ENGINE_INIT_FAILED, message=message))
+
+    def _engine_started(self) -> None:
+        if "engine_ready" not in trace.marks:
+            trace.mark("engine_ready")
+            self.started.emit()
+
+    def _show_busy(self, busy: bool) -> None:
+        if busy:
+            self.busy_label.adjustSize()
+            self.busy_label.raise_()
+        self.busy_label.setVisible(busy)
 
     def _emit_character(self, c):
         snap = {
-            "name": c.get("name", "You"),
+            "name": c.get("name", self.strings[S.PLAYER_FALLBACK_NAME]),
             "level": c.get("level", 1),
             "hp": c.get("hp", 1),
             "mp": c.get("mp", 0),
@@ -197,7 +291,11 @@ class MainWindow(QWidget):
         QShortcut(QKeySequence("Space"), self, activated=self.advance)
         QShortcut(QKeySequence("Ctrl+S"), self, activated=self._save)
         QShortcut(QKeySequence("Ctrl+L"), self, activated=self._load)
+        QShortcut(QKeySequence("Ctrl+Shift+S"), self, activated=lambda: self._open_slots(saving=True))
+        QShortcut(QKeySequence("Ctrl+Shift+L"), self, activated=lambda: self._open_slots(saving=False))
         QShortcut(QKeySequence("H"), self, activated=self.toggle_history)
+        QShortcut(QKeySequence("F3"), self, activated=self.latency_overlay.toggle)
+        QShortcut(QKeySequence("Shift+F3"), self, activated=self._export_latency)
         # numeric choices 1..9
         for n in range(1, 10):
             QShortcut(
@@ -207,6 +305,8 @@ class MainWindow(QWidget):
             )
 
         self.bus.option_chosen.connect(self.choose)
+        self.bus.dialogue_ready.connect(self._dialogue_shown)
+        self.bus.pause_elapsed.connect(self._resume)
 
     def _update_scene(self, payload: dict):
         self.scene.set_background(payload.get("bg"))
@@ -216,42 +316,122 @@ class MainWindow(QWidget):
         r = self.rect()
         # layout: scene fills, panes float, overlay at bottom
         self.scene.setGeometry(0, 0, r.width(), r.height())
+        self.prefetcher.target_size = r.size()
         self.left.reposition(r)
         self.right.reposition(r)
         self.nav.setGeometry(0, 0, r.width(), 64)
+        self.busy_label.move(12, 72)
         self.overlay.resize_to(r, 240)
 
     def toggle_left(self):
+        if self.char_pane is None:
+            self._build_left_pane()
         self.left.toggle(self.rect())
 
     def toggle_right(self):
+        if self.know_pane is None:
+            self._build_right_pane()
         self.right.toggle(self.rect())
 
+    def _buffer_payload(self, kind: str, payload: Any) -> None:
+        self._pane_payloads[kind] = payload
+
+    def _build_left_pane(self) -> None:
+        with trace.phase("build_left_pane"):
+            summary_title = QLabel(f"<b>{self.strings[S.STATS_TITLE]}</b>", parent=self.left)
+            summary_title.setStyleSheet("color:#9ad1cc;")
+            self._summary = QLabel("MC: —\nTalking to: —\nOpinion: —\nKnown: —", parent=self.left)
+            self._summary.setStyleSheet("color:#dde;")
+            self._summary.setWordWrap(True)
+            self._summary.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            self.left.content.addWidget(summary_title)
+            self.left.content.addWidget(self._summary)
+
+            self.char_pane = CharacterPane(parent=self.left, strings=self.strings)
+            self.left.content.addWidget(self.char_pane)
+
+            if "stats" in self._pane_payloads:
+                self._update_summary(self._pane_payloads["stats"])
+                self.char_pane.update_stats(self._pane_payloads["stats"])
+            if "inventory" in self._pane_payloads:
+                self.char_pane.update_inventory(self._pane_payloads["inventory"])
+            self.char_pane.bind_bus(self.bus)
+            self.bus.stats_updated.connect(self._update_summary)
+
+    def _build_right_pane(self) -> None:
+        with trace.phase("build_right_pane"):
+            recent_title = QLabel(f"<b>{self.strings[S.RECENT_TITLE]}</b>", parent=self.right)
+            recent_title.setStyleSheet("color:#9ad1cc;")
+            self._recent = QLabel("—", parent=self.right)
+            self._recent.setStyleSheet("color:#dde;")
+            self._recent.setWordWrap(True)
+            self._recent.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            self.right.content.addWidget(recent_title)
+            self.right.content.addWidget(self._recent)
+
+            self.know_pane = KnowledgePane(parent=self.right, strings=self.strings)
+            self.right.content.addWidget(self.know_pane)
+
+            if "knowledge" in self._pane_payloads:
+                self.know_pane.update_knowledge(self._pane_payloads["knowledge"])
+            self.know_pane.bind_bus(self.bus)
+            self._update_recent()
+
     def advance(self):
-        if self.engine:
-            self._safe_call(self.engine.advance_dialogue)
+        self._call("advance_dialogue")
 
     def choose(self, option_id: int):
-        if self.engine:
-            self._safe_call(self.engine.apply_choice, option_id)
+        # tagged with the payload the player saw, so the engine can drop it
+        # if the dialogue has moved on since
+        self._call("apply_choice", option_id, self._dialogue_turn)
+
+    def _dialogue_shown(self, payload: dict):
+        self._dialogue_turn = payload.get("turn")
+
+    def _resume(self, turn: int):
+        self._call("resume", turn)
 
     def _travel(self, exit_key: str):
-        if self.engine:
-            self._safe_call(self.engine.travel_to, exit_key)
+        self._call("travel_to", exit_key)
 
     def toggle_history(self):
         self.overlay.toggle_history()
 
     def _talk(self, girl_name: str):
-        if self.engine:
-            self._safe_call(self.engine.focus, girl_name)
+        self._call("focus", girl_name)
+
+    def _command(self, text: str):
+        self._call("run_command", text)
+
+    def _complete(self, text: str):
+        self._call("complete", text)
 
     def _save(self):
-        if self.engine:
-            self._safe_call(self.engine.save)
+        self._save_to(AUTOSAVE_SLOT, immediate=True)
+
+    def _save_to(self, slot: int, *, immediate: bool) -> None:
+        if self.engine is None:
+            return
+        self.engine.save(slot, immediate=immediate)
+        path = self.engine.slots.thumbnail_path(slot)
+        if immediate:
+            self.thumbnailer.render(self.scene, path)
+        else:
+            self.thumbnailer.schedule(self.scene, path)
+
+    def _open_slots(self, *, saving: bool) -> None:
+        if self.engine is None:
+            return
+        dialog = SaveSlotDialog(self.engine.slots, saving=saving, strings=self.strings, parent=self)
+        if dialog.exec() != SaveSlotDialog.Accepted or dialog.chosen_slot is None:
+            return
+        if saving:
+            self._save_to(dialog.chosen_slot, immediate=True)
+        else:
+            self.engine.load(dialog.chosen_slot)
 
     def _update_summary(self, stats: dict):
-        name = stats.get("name", "You")
+        name = stats.get("name", self.strings[S.PLAYER_FALLBACK_NAME])
         focused_raw = stats.get("focused_girl")
         focused = focused_raw.title() if isinstance(focused_raw, str) else "—"
         opinion = stats.get("focused_opinion")
@@ -266,30 +446,33 @@ class MainWindow(QWidget):
         ]
         self._summary.setText("\n".join(lines))
 
-    def _update_recent(self, entries):
-        if not entries:
-            text = "—"
-        else:
-            recent = entries[-5:]
-            text = "\n\n".join(recent)
-        self._recent.setText(text)
+    def _update_recent(self, *_):
+        if self._recent is None:
+            return
+        recent = self.toast_history.tail(5)
+        self._recent.setText("\n\n".join(recent) if recent else "—")
 
     def closeEvent(self, event):
-        if self.engine:
-            try:
-                self.engine.save()
-            except Exception:  # pragma: no cover - best effort persistence
-                self._logger.exception("Failed to save state")
+        if self.engine is not None:
+            if self._autosave:
+                self.engine.save(immediate=True)
+            if not self.engine.shutdown():
+                self._logger.warning("Engine thread did not stop in time; state may be unsaved")
         super().closeEvent(event)
 
     def _load(self):
-        if self.engine:
-            self._safe_call(self.engine.load)
+        if self.engine is not None:
+            self.engine.load(AUTOSAVE_SLOT)
 
-    def _safe_call(self, func, *args, **kwargs):
+    def _export_latency(self):
         try:
-            return func(*args, **kwargs)
-        except Exception as exc:  # pragma: no cover - UI safety net
-            self._logger.exception("Engine interaction failed")
-            self.bus.toast.emit(str(exc))
-            return None
+            path = self.latency.export()
+        except OSError as exc:
+            self.bus.toast.emit(self.strings.format(S.LATENCY_EXPORT_FAILED, error=exc))
+        else:
+            self.bus.toast.emit(self.strings.format(S.LATENCY_EXPORTED, path=path))
+
+    def _call(self, method: str, *args) -> None:
+        # Queued to the engine thread; errors come back through _engine_failed.
+        if self.engine is not None:
+            self.latency.expect(self.engine.call(method, *args))
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -9,12 +9,21 @@ from PySide6.QtWidgets import (
     QComboBox,
 )
 
+from string_table import S, StringTable, load_strings
+
 
 class NavOverlay(QWidget):
-    def __init__(self, bus, ui_strings: Optional[Dict[str, str]] = None, *args, **kwargs):
+    """Top bar with the location, exit buttons and the talk-to picker.
+
+    ``nav_ready`` arrives after every dialogue step, so each part of the
+    payload is compared with what is shown and only changed widgets are
+    touched; exit buttons are pooled and relabelled in place.
+    """
+
+    def __init__(self, bus, strings: Optional[StringTable] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.bus = bus
-        ui = ui_strings or {}
+        strings = strings or load_strings()
         self.setObjectName("nav-overlay")
         self.setStyleSheet(
             "#nav-overlay { background: rgba(14,17,20,220); border-bottom:1px solid #2a2f36; }"
@@ -26,7 +35,7 @@ class NavOverlay(QWidget):
         row = QHBoxLayout()
         root.addLayout(row)
 
-        self._placeholder = ui.get("location_placeholder", "—")
+        self._placeholder = strings[S.NAV_LOCATION_PLACEHOLDER]
         self.loc = QLabel(self._placeholder)
         row.addWidget(self.loc)
 
@@ -34,12 +43,16 @@ class NavOverlay(QWidget):
 
         self.exits_bar = QHBoxLayout()
         row.addLayout(self.exits_bar)
+        self._exit_buttons: List[QPushButton] = []
+        self._exits: List[Dict[str, Any]] = []
+        self._characters: List[str] = []
+        self._location: Optional[str] = None
 
-        self.who_lbl = QLabel(ui.get("talk_label", " Talk: "))
+        self.who_lbl = QLabel(strings[S.NAV_TALK_LABEL])
         row.addWidget(self.who_lbl)
         self.who = QComboBox()
         row.addWidget(self.who)
-        talk_btn = QPushButton(ui.get("talk_button", "Talk"))
+        talk_btn = QPushButton(strings[S.NAV_TALK_BUTTON])
         row.addWidget(talk_btn)
 
         talk_btn.clicked.connect(self._emit_talk)
@@ -50,23 +63,41 @@ class NavOverlay(QWidget):
         if name:
             self.bus.talk_to.emit(name)
 
-    def _clear_exits(self):
-        while self.exits_bar.count():
-            item = self.exits_bar.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+    def _exit_button(self, index: int) -> QPushButton:
+        while len(self._exit_buttons) <= index:
+            i = len(self._exit_buttons)
+            button = QPushButton(self)
+            button.clicked.connect(lambda _=False, i=i: self._travel(i))
+            self.exits_bar.addWidget(button)
+            self._exit_buttons.append(button)
+        return self._exit_buttons[index]
+
+    def _travel(self, index: int):
+        if index < len(self._exits):
+            self.bus.travel_chosen.emit(self._exits[index]["id"])
 
     def _render(self, payload: dict):
         loc_label = payload.get("location") or self._placeholder
-        self.loc.setText(f"<b>{loc_label}</b>")
-        self._clear_exits()
-        for exit_payload in payload.get("exits", []):
-            button = QPushButton(exit_payload["label"])
-            button.clicked.connect(
-                lambda _=False, exit_id=exit_payload["id"]: self.bus.travel_chosen.emit(exit_id)
-            )
-            self.exits_bar.addWidget(button)
-        self.who.clear()
-        for name in payload.get("characters", []):
-            self.who.addItem(name)
+        if loc_label != self._location:
+            self._location = loc_label
+            self.loc.setText(f"<b>{loc_label}</b>")
+
+        exits = list(payload.get("exits", []))
+        if exits != self._exits:
+            for i, exit_payload in enumerate(exits):
+                button = self._exit_button(i)
+                if i >= len(self._exits) or self._exits[i]["label"] != exit_payload["label"]:
+                    button.setText(exit_payload["label"])
+                button.setVisible(True)
+            for button in self._exit_buttons[len(exits):]:
+                button.setVisible(False)
+            self._exits = exits
+
+        characters = list(payload.get("characters", []))
+        if characters != self._characters:
+            current = self.who.currentText()
+            self.who.clear()
+            self.who.addItems(characters)
+            if current in characters:
+                self.who.setCurrentText(current)
+            self._characters = characters
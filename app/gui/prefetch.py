@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterable, Set
+
+from PySide6.QtCore import QObject, QRunnable, QSize, QThreadPool
+
+from app.gui.image_cache import ImageCache, read_image, shared_cache
+
+# Below the default (0) so on-screen scaling jobs run first.
+PREFETCH_PRIORITY = -1
+
+
+class _DecodeJob(QRunnable):
+    """Decode one image on a pool thread and store it in the cache."""
+
+    def __init__(self, prefetcher: "Prefetcher", path: str, target: QSize | None):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.path = path
+        self.target = target
+
+    def run(self) -> None:
+        try:
+            image, native = read_image(self.path, self.target)
+            if not image.isNull():
+                self.prefetcher.cache.put(self.path, image, native)
+        finally:
+            self.prefetcher._finished(self.path)
+
+
+class Prefetcher(QObject):
+    """Warm the image cache with assets the player is likely to need next.
+
+    Connected to ``Bus.prefetch_hint``; paths already cached or already being
+    decoded are skipped, so repeated hints are cheap. Images are decoded at
+    ``target_size`` (kept in step with the scene by the window), or at full
+    resolution while it is unknown.
+    """
+
+    def __init__(self, cache: ImageCache | None = None, pool: QThreadPool | None = None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or shared_cache()
+        self._pool = pool or QThreadPool.globalInstance()
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.target_size: QSize | None = None
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            if not path or path in self.cache:
+                continue
+            with self._lock:
+                if path in self._pending:
+                    continue
+                self._pending.add(path)
+            self.submitted += 1
+            self._pool.start(_DecodeJob(self, path, self.target_size), PREFETCH_PRIORITY)
+
+    def _finished(self, path: str) -> None:
+        with self._lock:
+            self._pending.discard(path)
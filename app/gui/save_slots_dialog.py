@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSize, Qt
+from PySide6.QtGui import QImageReader, QPixmap
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QListView, QVBoxLayout
+
+from app.save_slots import AUTOSAVE_SLOT, SaveSlots, SlotInfo
+from string_table import S, StringTable, load_strings
+
+ICON_SIZE = QSize(160, 90)
+SLOT_ROLE = Qt.UserRole + 1
+
+
+def _play_time(seconds: float) -> str:
+    minutes = int(seconds) // 60
+    return f"{minutes // 60}:{minutes % 60:02d}"
+
+
+class SlotListModel(QAbstractListModel):
+    """One row per indexed slot. Rows come from the index alone; text and
+    thumbnails are built when a row is first shown."""
+
+    def __init__(self, slots: SaveSlots, strings: StringTable, parent=None):
+        super().__init__(parent)
+        self._slots = slots
+        self._strings = strings
+        self._entries: List[SlotInfo] = slots.entries()
+        self._text: Dict[int, str] = {}
+        self._icons: Dict[int, QPixmap] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not 0 <= index.row() < len(self._entries):
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            text = self._text.get(entry.slot)
+            if text is None:
+                text = self._text[entry.slot] = self._describe(entry)
+            return text
+        if role == Qt.DecorationRole:
+            icon = self._icons.get(entry.slot)
+            if icon is None:
+                icon = self._icons[entry.slot] = self._thumbnail(entry)
+            return None if icon.isNull() else icon
+        if role == SLOT_ROLE:
+            return entry.slot
+        return None
+
+    def _describe(self, entry: SlotInfo) -> str:
+        strings = self._strings
+        if entry.slot == AUTOSAVE_SLOT:
+            name = strings[S.SLOTS_AUTOSAVE_NAME]
+        else:
+            name = strings.format(S.SLOTS_SLOT_NAME, slot=entry.slot)
+        return strings.format(
+            S.SLOTS_ENTRY_FORMAT,
+            name=name,
+            location=entry.location or "—",
+            girl=entry.focused.title() if entry.focused else "—",
+            saved_at=time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.saved_at)),
+            play_time=_play_time(entry.play_time_s),
+        )
+
+    def _thumbnail(self, entry: SlotInfo) -> QPixmap:
+        if not entry.thumbnail:
+            return QPixmap()
+        reader = QImageReader(os.path.join(self._slots.directory, entry.thumbnail))
+        native = reader.size()
+        if native.isValid():
+            reader.setScaledSize(native.scaled(ICON_SIZE, Qt.KeepAspectRatio))
+        image = reader.read()
+        return QPixmap() if image.isNull() else QPixmap.fromImage(image)
+
+
+class SaveSlotDialog(QDialog):
+    """Pick a slot to save into (an existing one or a new one) or to load.
+
+    After ``exec()`` returns ``Accepted``, ``chosen_slot`` holds the slot.
+    """
+
+    def __init__(
+        self,
+        slots: SaveSlots,
+        *,
+        saving: bool,
+        strings: Optional[StringTable] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        strings = strings or load_strings()
+        self.chosen_slot: Optional[int] = None
+        self.setWindowTitle(strings[S.SLOTS_SAVE_TITLE if saving else S.SLOTS_LOAD_TITLE])
+        self.resize(560, 480)
+
+        self.model = SlotListModel(slots, strings, self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setIconSize(ICON_SIZE)
+        self.view.doubleClicked.connect(self._choose_selected)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Cancel)
+        if saving:
+            new = buttons.addButton(strings[S.SLOTS_NEW_BUTTON], QDialogButtonBox.ActionRole)
+            new.clicked.connect(lambda: self._choose(slots.next_free()))
+        self._confirm = buttons.addButton(QDialogButtonBox.Save if saving else QDialogButtonBox.Open)
+        self._confirm.setEnabled(False)
+        self._confirm.clicked.connect(self._choose_selected)
+        buttons.rejected.connect(self.reject)
+        self.view.selectionModel().currentChanged.connect(
+            lambda current, _: self._confirm.setEnabled(current.isValid())
+        )
+
+        root = QVBoxLayout(self)
+        root.addWidget(self.view)
+        root.addWidget(buttons)
+
+    def _choose_selected(self, *_) -> None:
+        index = self.view.currentIndex()
+        if index.isValid():
+            self._choose(index.data(SLOT_ROLE))
+
+    def _choose(self, slot: int) -> None:
+        self.chosen_slot = slot
+        self.accept()
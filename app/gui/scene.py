@@ -1,15 +1,79 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from PySide6.QtCore import QObject, QRect, QRunnable, QSize, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QLabel, QWidget
 
+from app.gui.image_cache import ImageCache, shared_cache
+
+RESIZE_DEBOUNCE_MS = 80
+# Scaled pixmaps are near window size, so their cache is bounded by bytes.
+SCALED_CACHE_BUDGET_BYTES = 48 * 1024 * 1024
+
+# (layer, path, width, height)
+ScaledKey = Tuple[str, str, int, int]
+# (source image, aspect mode, label geometry, label alignment)
+SceneLayer = Tuple[QImage, Qt.AspectRatioMode, QRect, Qt.AlignmentFlag]
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class _ScaleSignals(QObject):
+    done = Signal(object, QImage, QImage)  # (token, source, scaled image)
+
+
+class _ScaleJob(QRunnable):
+    """Decode (if the cached copy is too small) and smooth-scale on a pool thread."""
+
+    def __init__(self, signals: _ScaleSignals, token, cache: ImageCache, path: str, size: QSize, mode):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.cache = cache
+        self.path = path
+        self.size = size
+        self.mode = mode
+
+    def run(self) -> None:
+        source = self.cache.image(self.path, self.size, self.mode)
+        if source is None:
+            return
+        scaled = source.scaled(self.size, self.mode, Qt.SmoothTransformation)
+        try:
+            self.signals.done.emit(self.token, source, scaled)
+        except RuntimeError:
+            pass  # application torn down while the job was running
+
 
 class CenterScene(QWidget):
-    """Widget that displays a background and a foreground sprite."""
+    """Widget that displays a background and a foreground sprite.
 
-    def __init__(self, *args, **kwargs):
+    Scaled images are cached per (image, target size), least recently used
+    first out once they exceed ``scaled_budget_bytes``. When a size has not
+    been scaled yet, a fast-transform placeholder is shown at once and the
+    smooth version is produced on a worker thread; resize-driven rescaling
+    is debounced so dragging the window only scales once it settles.
+    Sources are decoded at display size (see ``ImageCache``) on the worker
+    too: an image that is not cached yet appears once decoded, and a window
+    that grows past the cached decode triggers one larger decode while the
+    placeholder is upscaled from the smaller one.
+    """
+
+    def __init__(
+        self,
+        *args,
+        cache: ImageCache | None = None,
+        scaled_budget_bytes: int = SCALED_CACHE_BUDGET_BYTES,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        self._cache = cache or shared_cache()
+        self.scaled_budget_bytes = scaled_budget_bytes
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setStyleSheet("background:#0e1114;")
 
@@ -19,27 +83,41 @@ class CenterScene(QWidget):
         self.sprite = QLabel(self)
         self.sprite.setAlignment(Qt.AlignBottom | Qt.AlignHCenter)
 
-        self._bg_pix: QPixmap | None = None
-        self._sprite_pix: QPixmap | None = None
+        self._labels: Dict[str, QLabel] = {"bg": self.bg, "sprite": self.sprite}
+        self._modes = {"bg": Qt.KeepAspectRatioByExpanding, "sprite": Qt.KeepAspectRatio}
+        self._paths: Dict[str, str | None] = {"bg": None, "sprite": None}
+        self._images: Dict[str, QImage | None] = {"bg": None, "sprite": None}
+        self._generation: Dict[str, int] = {"bg": 0, "sprite": 0}
+        self._scaled: "OrderedDict[ScaledKey, QPixmap]" = OrderedDict()
+        self._scaled_bytes = 0
+
+        self._pool = QThreadPool.globalInstance()
+        # unparented: in-flight jobs keep it alive if the scene is destroyed first
+        self._signals = _ScaleSignals()
+        self._signals.done.connect(self._on_scaled)
+
+        self._debounce = QTimer(self, singleShot=True, interval=RESIZE_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._smooth_all)
 
     # -------------------- public API --------------------
     def set_background(self, path: str | None) -> None:
-        if not path:
-            self._bg_pix = None
-            self.bg.clear()
-            return
-        pixmap = QPixmap(path)
-        self._bg_pix = pixmap if not pixmap.isNull() else None
-        self._rescale()
+        self._set_layer("bg", path)
 
     def set_sprite(self, path: str | None) -> None:
-        if not path:
-            self._sprite_pix = None
-            self.sprite.clear()
-            return
-        pixmap = QPixmap(path)
-        self._sprite_pix = pixmap if not pixmap.isNull() else None
-        self._rescale()
+        self._set_layer("sprite", path)
+
+    def layers(self) -> List[SceneLayer]:
+        """The decoded images on screen, bottom first, with their placement.
+
+        ``QImage`` copies are implicitly shared, so the result can be painted
+        on another thread (see ``app.gui.thumbnails``).
+        """
+        result: List[SceneLayer] = []
+        for layer, label in self._labels.items():
+            image = self._images[layer]
+            if self._paths[layer] and image is not None:
+                result.append((image, self._modes[layer], label.geometry(), label.alignment()))
+        return result
 
     # -------------------- QWidget overrides --------------------
     def resizeEvent(self, event):  # type: ignore[override]
@@ -52,23 +130,79 @@ class CenterScene(QWidget):
             int(self.width() * 0.85),
             int(self.height() * 0.90),
         )
-        self._rescale()
+        for layer in self._labels:
+            self._show(layer, smooth_now=False)
+        self._debounce.start()
 
     # -------------------- helpers --------------------
-    def _rescale(self) -> None:
-        if self._bg_pix:
-            self.bg.setPixmap(
-                self._bg_pix.scaled(
-                    self.bg.size(),
-                    Qt.KeepAspectRatioByExpanding,
-                    Qt.SmoothTransformation,
-                )
-            )
-        if self._sprite_pix:
-            self.sprite.setPixmap(
-                self._sprite_pix.scaled(
-                    self.sprite.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-            )
+    def _set_layer(self, layer: str, path: str | None) -> None:
+        if path == self._paths[layer]:
+            return
+        self._paths[layer] = path
+        self._generation[layer] += 1
+        if not path:
+            self._images[layer] = None
+            self._labels[layer].clear()
+            return
+        self._images[layer] = None  # decoded in _show once the label has a size
+        self._show(layer, smooth_now=True)
+
+    def _scaled_key(self, layer: str) -> ScaledKey | None:
+        path = self._paths[layer]
+        size = self._labels[layer].size()
+        if not path or size.isEmpty():
+            return None
+        return (layer, path, size.width(), size.height())
+
+    def _show(self, layer: str, smooth_now: bool) -> None:
+        key = self._scaled_key(layer)
+        if key is None:
+            return
+        label = self._labels[layer]
+        cached = self._scaled.get(key)
+        if cached is not None:
+            self._scaled.move_to_end(key)
+            label.setPixmap(cached)
+            return
+        image = self._images[layer]
+        if image is None:
+            image = self._images[layer] = self._cache.peek(key[1], label.size(), self._modes[layer])
+            if image is None:
+                # not decoded yet: the worker decodes and scales in one go
+                if smooth_now:
+                    self._submit(layer, key)
+                return
+        placeholder = image.scaled(label.size(), self._modes[layer], Qt.FastTransformation)
+        label.setPixmap(QPixmap.fromImage(placeholder))
+        if smooth_now:
+            self._submit(layer, key)
+
+    def _smooth_all(self) -> None:
+        for layer in self._labels:
+            key = self._scaled_key(layer)
+            if key is not None and key not in self._scaled:
+                self._submit(layer, key)
+
+    def _submit(self, layer: str, key: ScaledKey) -> None:
+        token = (self._generation[layer], key)
+        size = QSize(key[2], key[3])
+        self._pool.start(_ScaleJob(self._signals, token, self._cache, key[1], size, self._modes[layer]))
+
+    def _on_scaled(self, token, source: QImage, image: QImage) -> None:
+        generation, key = token
+        layer = key[0]
+        if generation != self._generation[layer]:
+            return
+        self._images[layer] = source
+        pixmap = QPixmap.fromImage(image)
+        previous = self._scaled.pop(key, None)
+        if previous is not None:
+            self._scaled_bytes -= _pixmap_bytes(previous)
+        self._scaled[key] = pixmap
+        self._scaled_bytes += _pixmap_bytes(pixmap)
+        # keep at least the newest pixmap even if it alone exceeds the budget
+        while self._scaled_bytes > self.scaled_budget_bytes and len(self._scaled) > 1:
+            _, evicted = self._scaled.popitem(last=False)
+            self._scaled_bytes -= _pixmap_bytes(evicted)
+        if key == self._scaled_key(layer):
+            self._labels[layer].setPixmap(pixmap)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List, Set
+
+from PySide6.QtCore import QObject, QRect, QRunnable, QSize, Qt, QThreadPool, QTimer
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QStyle
+
+from app.gui.scene import CenterScene, SceneLayer
+
+THUMBNAIL_SIZE = QSize(320, 180)
+BACKGROUND = QColor("#0e1114")  # the scene's own background
+# Non-urgent requests for the same file are gathered for this long.
+SCHEDULE_DELAY_MS = 1000
+
+
+def render_thumbnail(
+    layers: List[SceneLayer], scene_size: QSize, size: QSize = THUMBNAIL_SIZE
+) -> QImage:
+    """Compose ``CenterScene.layers()`` the way the scene lays them out,
+    shrunk to fit ``size``. Safe to call off the GUI thread."""
+    out_size = scene_size.scaled(size, Qt.KeepAspectRatio) if not scene_size.isEmpty() else size
+    image = QImage(out_size, QImage.Format_RGB32)
+    image.fill(BACKGROUND)
+    if scene_size.isEmpty():
+        return image
+    sx = out_size.width() / scene_size.width()
+    sy = out_size.height() / scene_size.height()
+    painter = QPainter(image)
+    for source, mode, area, alignment in layers:
+        fitted = source.size().scaled(area.size(), mode)
+        placed = QStyle.alignedRect(Qt.LeftToRight, alignment, fitted, area)
+        target = QRect(
+            round(placed.x() * sx),
+            round(placed.y() * sy),
+            max(1, round(placed.width() * sx)),
+            max(1, round(placed.height() * sy)),
+        )
+        # scale the source first: drawImage's own filtering is bilinear and
+        # aliases badly at thumbnail ratios
+        scaled = source.scaled(target.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        painter.drawImage(target.topLeft(), scaled)
+    painter.end()
+    return image
+
+
+class _RenderJob(QRunnable):
+    """Render one thumbnail on a pool thread and write it atomically."""
+
+    def __init__(self, owner: "Thumbnailer", layers: List[SceneLayer], scene_size: QSize, path: str):
+        super().__init__()
+        self.owner = owner
+        self.layers = layers
+        self.scene_size = scene_size
+        self.path = path
+
+    def run(self) -> None:
+        try:
+            image = render_thumbnail(self.layers, self.scene_size)
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            if image.save(tmp, "PNG"):
+                os.replace(tmp, self.path)
+        except OSError:
+            pass  # a missing thumbnail only leaves a blank icon
+        finally:
+            self.owner._finished(self.path)
+
+
+class Thumbnailer(QObject):
+    """Write scene thumbnails for save slots.
+
+    The scene's layers are captured on the GUI thread when the render is
+    started; composing, scaling and PNG encoding happen on the pool. A path
+    already being rendered is skipped, and ``schedule`` gathers repeated
+    requests (autosaves) into one render after ``SCHEDULE_DELAY_MS``.
+    """
+
+    def __init__(self, pool: QThreadPool | None = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._scheduled: Dict[str, CenterScene] = {}
+        self._timer = QTimer(self, singleShot=True, interval=SCHEDULE_DELAY_MS)
+        self._timer.timeout.connect(self._render_scheduled)
+        self.rendered = 0
+
+    def render(self, scene: CenterScene, path: str) -> None:
+        self._scheduled.pop(path, None)
+        layers = scene.layers()
+        if not layers:
+            return
+        with self._lock:
+            if path in self._pending:
+                return
+            self._pending.add(path)
+        self.rendered += 1
+        self._pool.start(_RenderJob(self, layers, scene.size(), path))
+
+    def schedule(self, scene: CenterScene, path: str) -> None:
+        self._scheduled[path] = scene
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _render_scheduled(self) -> None:
+        scheduled, self._scheduled = self._scheduled, {}
+        for path, scene in scheduled.items():
+            self.render(scene, path)
+
+    def _finished(self, path: str) -> None:
+        with self._lock:
+            self._pending.discard(path)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+DEFAULT_CAPACITY = 10_000
+
+
+class ToastHistoryModel(QAbstractListModel):
+    """Append-only message log backed by a fixed-size ring buffer.
+
+    Connected to ``Bus.toast_logged``, each message becomes one inserted row
+    (dropping the oldest row once ``capacity`` is reached), so attached
+    views update incrementally instead of being rebuilt.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._ring: List[Optional[str]] = [None] * capacity
+        self._start = 0
+        self._count = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole) and 0 <= index.row() < self._count:
+            return self._ring[(self._start + index.row()) % self.capacity]
+        return None
+
+    def append(self, message: str) -> None:
+        if self._count == self.capacity:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._ring[self._start] = None
+            self._start = (self._start + 1) % self.capacity
+            self._count -= 1
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), self._count, self._count)
+        self._ring[(self._start + self._count) % self.capacity] = message
+        self._count += 1
+        self.endInsertRows()
+
+    def tail(self, n: int) -> List[str]:
+        """The newest ``n`` messages, oldest first."""
+        n = min(n, self._count)
+        return [
+            self._ring[(self._start + row) % self.capacity]  # type: ignore[misc]
+            for row in range(self._count - n, self._count)
+        ]
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._ring = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.endResetModel()
+
+
+def search_proxy(model: ToastHistoryModel, parent=None) -> QSortFilterProxyModel:
+    """Case-insensitive substring filter over ``model`` for the history search box."""
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+    return proxy
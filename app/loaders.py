@@ -1,13 +1,14 @@
-import os, yaml
+import os
 from typing import Any, Dict
 
+from parse_cache import load_yaml
+
 CHAR_PATH = os.path.join("game", "character.yaml")
 KNOW_PATH = os.path.join("game", "knowledge.yaml")
 ASSET_PATH = os.path.join("game", "assets.yaml")
 
 def _safe_load_yaml(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return load_yaml(path) or {}
 
 def load_character() -> Dict[str, Any]:
     data = _safe_load_yaml(CHAR_PATH)
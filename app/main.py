@@ -1,5 +1,9 @@
 """Application entry point."""
 
+import time
+
+_T0 = time.perf_counter()
+
 import argparse
 import logging
 from logging.handlers import RotatingFileHandler
@@ -49,14 +53,28 @@ def _import_qt_objects():
     return QApplication, MainWindow
 
 
+def _trace():
+    from app.startup import trace
+
+    trace.rebase(_T0)
+    return trace
+
+
 def _exec_qt_application(qt_args, seed=None):
     """Initialise and run the Qt application."""
 
-    QApplication, MainWindow = _import_qt_objects()
-
-    qt_app = QApplication([sys.argv[0], *qt_args])
-    win = MainWindow(seed=seed)
-    win.show()
+    trace = _trace()
+    with trace.phase("import_qt"):
+        QApplication, MainWindow = _import_qt_objects()
+
+    with trace.phase("qapplication"):
+        qt_app = QApplication([sys.argv[0], *qt_args])
+    with trace.phase("main_window"):
+        win = MainWindow(seed=seed, deferred=True)
+    # written once the engine is up, so the file covers the whole cold start
+    win.started.connect(lambda: trace.write())
+    with trace.phase("show"):
+        win.show()
 
     exec_method = getattr(qt_app, "exec", None) or getattr(qt_app, "exec_", None)
     if exec_method is None:
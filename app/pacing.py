@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QTimer
+
+from pacing import Callback, Pacer
+
+
+class QtPacer(Pacer):
+    """Schedule follow-ups on the Qt event loop instead of blocking it."""
+
+    def pause(self, beat: str, then: Callback = None) -> None:
+        if then is not None:
+            QTimer.singleShot(int(self.delay(beat) * 1000), then)
@@ -0,0 +1,159 @@
+"""Numbered save slots with a metadata index.
+
+Slot ``n`` is saved to ``saves/slot-NNN.yaml`` and its thumbnail to
+``saves/slot-NNN.png``. ``saves/index.json`` keeps one small record per
+slot: when it was saved, where, with whom, the play time, a hash of the
+state and the thumbnail file. A menu can therefore list every slot without
+opening any save file. Slot 0 is the autosave.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+from app.autosave import atomic_write
+
+SAVE_DIR = "saves"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+AUTOSAVE_SLOT = 0
+
+_SLOT_FILE = re.compile(r"^slot-(\d+)\.yaml$")
+_logger = logging.getLogger(__name__)
+
+
+def state_hash(snapshot: Mapping[str, Any]) -> str:
+    blob = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class SlotInfo:
+    slot: int
+    file: str
+    saved_at: float
+    location: Optional[str] = None
+    focused: Optional[str] = None
+    play_time_s: float = 0.0
+    state_hash: Optional[str] = None
+    thumbnail: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SaveSlots(object):
+    """Slot paths and the index. Thread-safe: the writer thread records
+    slots while the GUI lists them."""
+
+    def __init__(self, directory: str = SAVE_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[int, SlotInfo]] = None
+
+    def slot_path(self, slot: int) -> str:
+        return os.path.join(self.directory, f"slot-{slot:03d}.yaml")
+
+    def thumbnail_path(self, slot: int) -> str:
+        return os.path.join(self.directory, f"slot-{slot:03d}.png")
+
+    def entries(self) -> List[SlotInfo]:
+        with self._lock:
+            return [info for _, info in sorted(self._loaded().items())]
+
+    def get(self, slot: int) -> Optional[SlotInfo]:
+        with self._lock:
+            return self._loaded().get(slot)
+
+    def next_free(self) -> int:
+        with self._lock:
+            return max(self._loaded(), default=AUTOSAVE_SLOT) + 1
+
+    def record(
+        self, slot: int, snapshot: Mapping[str, Any], saved_at: Optional[float] = None
+    ) -> SlotInfo:
+        """Index ``snapshot`` as the contents of ``slot`` (already written to disk)."""
+        info = SlotInfo(
+            slot=slot,
+            file=os.path.basename(self.slot_path(slot)),
+            saved_at=time.time() if saved_at is None else saved_at,
+            location=snapshot.get("location"),
+            focused=snapshot.get("focused"),
+            play_time_s=float(snapshot.get("play_time_s") or 0.0),
+            state_hash=state_hash(snapshot),
+            thumbnail=os.path.basename(self.thumbnail_path(slot)),
+        )
+        with self._lock:
+            self._loaded()[slot] = info
+            self._write()
+        return info
+
+    def remove(self, slot: int) -> None:
+        with self._lock:
+            if self._loaded().pop(slot, None) is None:
+                return
+            self._write()
+        for path in (self.slot_path(slot), self.thumbnail_path(slot)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # called with the lock held
+    def _loaded(self) -> Dict[int, SlotInfo]:
+        if self._index is None:
+            self._index = self._read()
+        return self._index
+
+    def _read(self) -> Dict[int, SlotInfo]:
+        path = os.path.join(self.directory, INDEX_NAME)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                raise ValueError(f"unsupported index version {data.get('version')!r}")
+            return {int(slot): SlotInfo(**entry) for slot, entry in data["slots"].items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            _logger.warning("Save index %s is unreadable; rebuilding it", path, exc_info=True)
+        return self._scan()
+
+    def _scan(self) -> Dict[int, SlotInfo]:
+        """Index the slot files on disk by name and mtime, without parsing them."""
+        index: Dict[int, SlotInfo] = {}
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return index
+        for name in names:
+            match = _SLOT_FILE.match(name)
+            if match is None:
+                continue
+            slot = int(match.group(1))
+            thumbnail = os.path.basename(self.thumbnail_path(slot))
+            index[slot] = SlotInfo(
+                slot=slot,
+                file=name,
+                saved_at=os.path.getmtime(os.path.join(self.directory, name)),
+                thumbnail=thumbnail if thumbnail in names else None,
+            )
+        return index
+
+    def _write(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "slots": {str(slot): info.as_dict() for slot, info in sorted(self._index.items())},
+        }
+        atomic_write(
+            os.path.join(self.directory, INDEX_NAME),
+            lambda f: json.dump(data, f, indent=1, ensure_ascii=False),
+        )
@@ -0,0 +1,132 @@
+"""Cold-start tracing and concurrent loading of the game's data files."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+TRACE_PATH = os.path.join(".cache", "startup_trace.json")
+
+_logger = logging.getLogger(__name__)
+
+
+class StartupTrace(object):
+    """Per-phase timings, in milliseconds since the trace origin."""
+
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self.phases: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+
+    def rebase(self, t0: float) -> None:
+        """Measure from ``t0`` (a ``time.perf_counter()`` value) instead."""
+        self._t0 = t0
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._t0) * 1e3
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self._now()
+        try:
+            yield
+        finally:
+            end = self._now()
+            with self._lock:
+                self.phases.append({
+                    "name": name,
+                    "start_ms": round(start, 3),
+                    "duration_ms": round(end - start, 3),
+                    "thread": threading.current_thread().name,
+                })
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (the first occurrence wins)."""
+        with self._lock:
+            self.marks.setdefault(name, round(self._now(), 3))
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "phases": sorted(self.phases, key=lambda p: p["start_ms"]),
+                "marks": dict(self.marks),
+            }
+
+    def write(self, path: str = TRACE_PATH) -> None:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.as_dict(), f, indent=2)
+            os.replace(tmp, path)
+        except OSError:  # best effort: the trace is diagnostic only
+            _logger.warning("Could not write startup trace %s", path, exc_info=True)
+
+
+# Process-wide trace; app.main rebases it to the moment it was imported.
+trace = StartupTrace()
+
+
+def default_loaders() -> Dict[str, Callable[[], Any]]:
+    """The independent data files needed before the game can start."""
+    from app.loaders import load_assets, load_character, load_knowledge
+    from script_loader import load_script
+
+    return {
+        "script": load_script,
+        "character": load_character,
+        "knowledge": load_knowledge,
+        "assets": load_assets,
+    }
+
+
+class DataLoader(QObject):
+    """Run loaders on a thread pool and deliver each result on the GUI thread."""
+
+    loaded = Signal(str, object)      # (name, data)
+    failed = Signal(str, str)         # (name, error message)
+
+    def __init__(self, loaders: Optional[Mapping[str, Callable[[], Any]]] = None, parent=None):
+        super().__init__(parent)
+        self._loaders = dict(loaders or default_loaders())
+        self._futures: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._loaders) or 1, thread_name_prefix="startup-load"
+        )
+        for name, loader in self._loaders.items():
+            future = self._executor.submit(self._run, name, loader)
+            future.add_done_callback(lambda f, n=name: self._deliver(n, f))
+            self._futures[name] = future
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _run(name: str, loader: Callable[[], Any]) -> Any:
+        with trace.phase(f"load:{name}"):
+            return loader()
+
+    def _deliver(self, name: str, future: Future) -> None:
+        # runs on the worker; the queued signal hops to the GUI thread
+        try:
+            exc = future.exception()
+            if exc is not None:
+                self.failed.emit(name, str(exc))
+            else:
+                self.loaded.emit(name, future.result())
+        except RuntimeError:
+            pass  # loader object deleted during shutdown
+
+    def result(self, name: str) -> Any:
+        """Block until ``name`` has loaded (for callers that cannot wait for the signal)."""
+        return self._futures[name].result()
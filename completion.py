@@ -0,0 +1,160 @@
+"""Prefix-trie command completion shared by the CLI and the GUI."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Categories offered for the first word of a command and for the words that
+# follow it, in ranking order.
+LEADING_CATEGORIES: Tuple[str, ...] = ("verb", "command", "inactive_verb")
+TRAILING_CATEGORIES: Tuple[str, ...] = ("direction", "character", "noun", "location")
+# Verbs whose argument is known to come from particular categories.
+ARGUMENT_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "go": ("direction", "location"),
+    "leave": ("direction", "location"),
+    "talk": ("character",),
+    "look": ("noun",),
+}
+
+
+class _Node(object):
+    __slots__ = ("children", "categories", "ranked")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        # categories the word ending at this node belongs to
+        self.categories: Set[str] = set()
+        # cached ranked completions below this node, keyed by category order
+        self.ranked: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class CommandTrie(object):
+    """Prefix trie over vocabulary words, updated incrementally.
+
+    Words are tagged with the vocabulary category they came from. Ranked
+    completions are cached per node and only the nodes along an inserted or
+    removed word are invalidated, so typing a character costs a walk down the
+    trie plus, at worst, one collection of the subtree below the prefix.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._words: Dict[str, Set[str]] = {}
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word.lower())
+        return node is not None and bool(node.categories)
+
+    def __len__(self) -> int:
+        return sum(len(words) for words in self._words.values())
+
+    def words(self, category: str) -> Set[str]:
+        return set(self._words.get(category, ()))
+
+    def add(self, word: str, category: str) -> None:
+        word = word.lower()
+        if not word:
+            return
+        words = self._words.setdefault(category, set())
+        if word in words:
+            return
+        words.add(word)
+        node = self._root
+        node.ranked.clear()
+        for ch in word:
+            node = node.children.setdefault(ch, _Node())
+            node.ranked.clear()
+        node.categories.add(category)
+
+    def discard(self, word: str, category: str) -> None:
+        word = word.lower()
+        words = self._words.get(category)
+        if not words or word not in words:
+            return
+        words.discard(word)
+        path = [self._root]
+        for ch in word:
+            path.append(path[-1].children[ch])
+        path[-1].categories.discard(category)
+        for node in path:
+            node.ranked.clear()
+        # prune branches that no longer lead to any word
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.categories or node.children:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+
+    def sync(self, category: str, words: Iterable[str]) -> None:
+        """Make ``category`` hold exactly ``words``, touching only the difference."""
+
+        wanted = {w.lower() for w in words if w}
+        current = self._words.get(category, set())
+        for word in current - wanted:
+            self.discard(word, category)
+        for word in wanted - current:
+            self.add(word, category)
+
+    def complete(
+        self,
+        prefix: str,
+        categories: Sequence[str] = LEADING_CATEGORIES + TRAILING_CATEGORIES,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Return words starting with ``prefix`` ranked by category, length, name."""
+
+        node = self._find(prefix.lower())
+        if node is None:
+            return []
+        order = tuple(categories)
+        ranked = node.ranked.get(order)
+        if ranked is None:
+            ranked = self._rank(node, prefix.lower(), order)
+            node.ranked[order] = ranked
+        return list(ranked if limit is None else ranked[:limit])
+
+    # -------- internals --------
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def _rank(self, node: _Node, prefix: str, order: Tuple[str, ...]) -> Tuple[str, ...]:
+        rank_of = {category: i for i, category in enumerate(order)}
+        found: List[Tuple[int, int, str]] = []
+        stack = [(node, prefix)]
+        while stack:
+            current, word = stack.pop()
+            ranks = [rank_of[c] for c in current.categories if c in rank_of]
+            if ranks:
+                found.append((min(ranks), len(word), word))
+            for ch, child in current.children.items():
+                stack.append((child, word + ch))
+        found.sort()
+        return tuple(word for _, _, word in found)
+
+
+def complete_line(trie: CommandTrie, line: str, limit: Optional[int] = None) -> List[str]:
+    """Complete the last word of ``line`` and return whole candidate lines.
+
+    The first word is completed against verbs and commands; later words
+    against the categories the verb takes (directions, characters, nouns and
+    known locations when the verb is not listed). Multi-word
+    vocabulary (``"night life district"``) is matched against everything typed
+    after the verb.
+    """
+
+    head, _, tail = line.lstrip().rpartition(" ")
+    if not head:
+        return trie.complete(tail, LEADING_CATEGORIES, limit)
+    verb, _, rest = head.partition(" ")
+    categories = ARGUMENT_CATEGORIES.get(verb.lower(), TRAILING_CATEGORIES)
+    if rest:
+        # try the whole argument first so multi-word places complete as one
+        joined = trie.complete(f"{rest} {tail}", categories, limit)
+        if joined:
+            return [f"{verb} {word}" for word in joined]
+    return [f"{head} {word}" for word in trie.complete(tail, categories, limit)]
@@ -0,0 +1,420 @@
+"""Node-graph dialogue engine driven by the ``dialogue_graph`` script section.
+
+Each node lists options (edges). An option carries a label template, an
+optional ``when`` condition, a list of ``effects`` and an optional ``goto``
+naming the next node; an option without ``goto`` ends the turn. Conditions,
+labels and effects are compiled once into closures, so listing the options
+for a turn is a single pass over pre-built callables::
+
+    dialogue_graph:
+      start: level
+      nodes:
+        level:
+          text: "{dialogue.greeting}"
+          options:
+            - label: "{statement.introduction} {player}"
+              when: not known
+              effects: [acquaint, reply introduction]
+
+Conditions support ``known``, ``opinion``, ``level``, ``committed``,
+integers, comparisons, ``and``/``or``/``not`` and parentheses. Effects are
+``reply <key>``, ``say <dialogue key>``, ``opinion <delta>``, ``acquaint``
+and ``make_date``. A node with ``each: <dialogue list>`` repeats its options
+once per list entry, exposing the entry as ``{choice.<field>}``; a node with
+``pause`` is a beat the host shows and then continues past on its own.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from script_loader import load_script
+from string_table import Field, StringTableError, parse_template
+
+
+class DialogueGraphError(ValueError):
+    """Raised when the dialogue graph in the script cannot be compiled."""
+
+
+@dataclass
+class DialogueContext:
+    """Everything compiled conditions, labels and effects may look at."""
+
+    engine: Any
+    player: Any
+    girl: Any
+    level_number: int
+    level: Mapping[str, Any]
+    messages: Mapping[str, Any]
+    ui: Mapping[str, Any]
+    observe: Callable[[], str]
+    choice: Optional[Mapping[str, Any]] = None
+    date: Any = None
+
+
+@dataclass
+class Step:
+    """Result of choosing an option."""
+
+    reply: Optional[str] = None
+    ended: bool = False
+
+
+Predicate = Callable[[DialogueContext], Any]
+Render = Callable[[DialogueContext], str]
+Effect = Callable[[DialogueContext, Step], None]
+
+
+# -------- conditions --------
+_TOKEN = re.compile(r"\s*(?:(-?\d+)|(==|!=|>=|<=|>|<|\(|\))|([A-Za-z_]\w*))")
+
+_VARIABLES: Dict[str, Predicate] = {
+    "known": lambda ctx: ctx.girl.name in ctx.player.known_girls,
+    "opinion": lambda ctx: ctx.girl.opinion,
+    "level": lambda ctx: ctx.level_number,
+    "committed": lambda ctx: ctx.girl.committed_in,
+    "true": lambda ctx: True,
+    "false": lambda ctx: False,
+}
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+}
+
+
+def _tokenize(source: str) -> List[str]:
+    tokens: List[str] = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if match is None:
+            raise DialogueGraphError(f"Cannot parse condition {source!r} at {source[pos:]!r}")
+        tokens.append(match.group(match.lastindex))
+        pos = match.end()
+    return tokens
+
+
+def compile_condition(source: Any) -> Predicate:
+    """Compile a ``when`` expression into a ``ctx -> bool`` closure."""
+
+    if source is None or source is True:
+        return _VARIABLES["true"]
+    tokens = _tokenize(str(source))
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take() -> str:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise DialogueGraphError(f"Unexpected end of condition {source!r}")
+        pos += 1
+        return tokens[pos - 1]
+
+    def atom() -> Predicate:
+        token = take()
+        if token == "(":
+            inner = disjunction()
+            if take() != ")":
+                raise DialogueGraphError(f"Unbalanced parentheses in {source!r}")
+            return inner
+        if token.lstrip("-").isdigit():
+            value = int(token)
+            return lambda ctx: value
+        if token in _VARIABLES:
+            return _VARIABLES[token]
+        raise DialogueGraphError(f"Unknown name {token!r} in condition {source!r}")
+
+    def comparison() -> Predicate:
+        left = atom()
+        if peek() in _COMPARISONS:
+            op = _COMPARISONS[take()]
+            right = atom()
+            return lambda ctx: op(left(ctx), right(ctx))
+        return left
+
+    def negation() -> Predicate:
+        if peek() == "not":
+            take()
+            inner = negation()
+            return lambda ctx: not inner(ctx)
+        return comparison()
+
+    def conjunction() -> Predicate:
+        terms = [negation()]
+        while peek() == "and":
+            take()
+            terms.append(negation())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda ctx: all(term(ctx) for term in terms)
+
+    def disjunction() -> Predicate:
+        terms = [conjunction()]
+        while peek() == "or":
+            take()
+            terms.append(conjunction())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda ctx: any(term(ctx) for term in terms)
+
+    predicate = disjunction()
+    if pos != len(tokens):
+        raise DialogueGraphError(f"Unexpected {tokens[pos]!r} in condition {source!r}")
+    return predicate
+
+
+# -------- label templates --------
+def _path_getter(root: Callable[[DialogueContext], Any], path: Sequence[str]) -> Render:
+    def get(ctx: DialogueContext) -> str:
+        value = root(ctx)
+        for part in path:
+            value = value[part]
+        return str(value)
+
+    return get
+
+
+_FIELD_ROOTS: Dict[str, Callable[[DialogueContext], Any]] = {
+    "statement": lambda ctx: ctx.level["statement"],
+    "dialogue": lambda ctx: ctx.messages,
+    "choice": lambda ctx: ctx.choice,
+    "ui": lambda ctx: ctx.ui,
+}
+
+_FIELDS: Dict[str, Render] = {
+    "player": lambda ctx: ctx.player.name,
+    "girl": lambda ctx: ctx.girl.name.title(),
+    "observation": lambda ctx: ctx.observe(),
+    "level": lambda ctx: str(ctx.level_number),
+    "opinion": lambda ctx: str(ctx.girl.opinion),
+}
+
+
+def compile_template(source: str) -> Render:
+    """Compile ``"{statement.question} {player}"`` style text into a closure."""
+
+    parts: List[Any] = []
+    try:
+        parsed = parse_template(str(source))
+    except StringTableError as exc:
+        raise DialogueGraphError(str(exc)) from exc
+    for name in parsed:
+        if not isinstance(name, Field):
+            parts.append(name)
+            continue
+        if name in _FIELDS:
+            parts.append(_FIELDS[name])
+            continue
+        root, _, rest = name.partition(".")
+        if root not in _FIELD_ROOTS or not rest:
+            raise DialogueGraphError(f"Unknown field {{{name}}} in template {source!r}")
+        parts.append(_path_getter(_FIELD_ROOTS[root], rest.split(".")))
+
+    if all(isinstance(p, str) for p in parts):
+        text = "".join(parts)
+        return lambda ctx: text
+    return lambda ctx: "".join(p if isinstance(p, str) else p(ctx) for p in parts)
+
+
+# -------- effects --------
+def _reply(key: str) -> Effect:
+    def apply(ctx: DialogueContext, step: Step) -> None:
+        reply = ctx.level["reply"].get(key)
+        if not reply:
+            return
+        step.reply = reply[0]
+        ctx.girl.opinion += reply[1]
+
+    return apply
+
+
+def _say(key: str) -> Effect:
+    def apply(ctx: DialogueContext, step: Step) -> None:
+        step.reply = ctx.messages[key]
+
+    return apply
+
+
+def _opinion(delta: str) -> Effect:
+    amount = int(delta)
+
+    def apply(ctx: DialogueContext, step: Step) -> None:
+        ctx.girl.opinion += amount
+
+    return apply
+
+
+def _acquaint(ctx: DialogueContext, step: Step) -> None:
+    if ctx.girl.name not in ctx.player.known_girls:
+        ctx.player.make_acquaintance(ctx.girl)
+
+
+def _make_date(ctx: DialogueContext, step: Step) -> None:
+    locations = ctx.engine.locations
+    location = locations.get(ctx.choice["location"]) if ctx.choice else None
+    if location is None:
+        if not locations:
+            return
+        location = next(iter(locations.values()))
+    ctx.engine.make_date(location, ctx.girl)
+    ctx.date = location
+
+
+_EFFECTS: Dict[str, Callable[..., Effect]] = {
+    "reply": _reply,
+    "say": _say,
+    "opinion": _opinion,
+    "acquaint": lambda: _acquaint,
+    "make_date": lambda: _make_date,
+}
+
+
+def compile_effect(source: str) -> Effect:
+    name, *args = str(source).split()
+    factory = _EFFECTS.get(name)
+    if factory is None:
+        raise DialogueGraphError(f"Unknown dialogue effect {source!r}")
+    try:
+        return factory(*args)
+    except (TypeError, ValueError) as exc:
+        raise DialogueGraphError(f"Bad arguments for dialogue effect {source!r}") from exc
+
+
+# -------- graph --------
+@dataclass(frozen=True)
+class Option:
+    when: Predicate
+    label: Render
+    effects: Tuple[Effect, ...]
+    goto: Optional[str]
+
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    text: Render
+    options: Tuple[Option, ...]
+    each: Optional[str] = None
+    pause: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DialogueGraph:
+    start: str
+    nodes: Mapping[str, Node]
+
+    def session(self, ctx: DialogueContext) -> "DialogueSession":
+        return DialogueSession(self, ctx)
+
+
+def compile_graph(spec: Mapping[str, Any]) -> DialogueGraph:
+    """Compile the ``dialogue_graph`` script section, validating every edge."""
+
+    raw_nodes = spec.get("nodes") or {}
+    start = spec.get("start")
+    if start not in raw_nodes:
+        raise DialogueGraphError(f"Dialogue graph start node {start!r} is not defined")
+
+    nodes: Dict[str, Node] = {}
+    for name, raw in raw_nodes.items():
+        options = []
+        for raw_option in raw.get("options") or ():
+            goto = raw_option.get("goto")
+            if goto is not None and goto not in raw_nodes:
+                raise DialogueGraphError(f"Node {name!r} points at unknown node {goto!r}")
+            options.append(
+                Option(
+                    when=compile_condition(raw_option.get("when")),
+                    label=compile_template(raw_option.get("label", "")),
+                    effects=tuple(compile_effect(e) for e in raw_option.get("effects") or ()),
+                    goto=goto,
+                )
+            )
+        if not options:
+            raise DialogueGraphError(f"Dialogue node {name!r} has no options")
+        pause = raw.get("pause")
+        nodes[name] = Node(
+            name=name,
+            text=compile_template(raw.get("text", "")),
+            options=tuple(options),
+            each=raw.get("each"),
+            pause=None if pause is None else str(pause),
+        )
+    return DialogueGraph(start=start, nodes=nodes)
+
+
+_compiled: Optional[Tuple[Mapping[str, Any], DialogueGraph]] = None
+
+
+def load_graph() -> DialogueGraph:
+    """Return the graph compiled from the current script registry."""
+
+    global _compiled
+    script = load_script()
+    if _compiled is None or _compiled[0] is not script:
+        _compiled = (script, compile_graph(script["dialogue_graph"]))
+    return _compiled[1]
+
+
+class DialogueSession:
+    """Walks a compiled graph for one conversation turn at one level."""
+
+    def __init__(self, graph: DialogueGraph, ctx: DialogueContext):
+        self.graph = graph
+        self.context = ctx
+        self.node = graph.nodes[graph.start]
+
+    def _available(self) -> List[Tuple[Option, Optional[Mapping[str, Any]]]]:
+        ctx = self.context
+        node = self.node
+        entries = ctx.messages[node.each] if node.each else (None,)
+        available = []
+        for entry in entries:
+            ctx.choice = entry
+            for option in node.options:
+                if option.when(ctx):
+                    available.append((option, entry))
+        return available
+
+    @property
+    def paused(self) -> Optional[str]:
+        """Name of the pacing beat when the current node is a pause."""
+        return self.node.pause
+
+    def text(self) -> str:
+        return self.node.text(self.context)
+
+    def options(self) -> List[Tuple[int, str]]:
+        ctx = self.context
+        labels = []
+        for index, (option, entry) in enumerate(self._available(), start=1):
+            ctx.choice = entry
+            labels.append((index, option.label(ctx)))
+        return labels
+
+    def choose(self, option_id: int) -> Optional[Step]:
+        """Apply the option with ``option_id``; ``None`` if it is not on offer."""
+        available = self._available()
+        if not 1 <= option_id <= len(available):
+            return None
+        option, entry = available[option_id - 1]
+        ctx = self.context
+        ctx.choice = entry
+        step = Step()
+        for effect in option.effects:
+            effect(ctx, step)
+        if option.goto is None:
+            step.ended = True
+        else:
+            self.node = self.graph.nodes[option.goto]
+        return step
@@ -0,0 +1,104 @@
+"""Shared, read-only dialogue trees with lightweight per-girl overlays."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Any, Dict, Iterator, Mapping, Tuple
+
+Level = Tuple[int, Mapping[str, Any]]
+
+
+class TreeOverlay(Mapping):
+    """Read-only view of ``overrides`` layered on top of a shared ``base``.
+
+    Only the branches a girl actually overrides are materialised; everything
+    else is looked up in the shared tree, so girls that share a tree never
+    copy it. Nested mappings present on both sides are overlaid recursively;
+    any other override value (e.g. a ``[text, delta]`` reply) replaces the base
+    value outright.
+    """
+
+    __slots__ = ("_base", "_overrides", "_children")
+
+    def __init__(self, base: Mapping[str, Any], overrides: Mapping[str, Any]):
+        self._base = base
+        self._overrides = overrides
+        self._children: Dict[str, TreeOverlay] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        if key not in self._overrides:
+            return self._base[key]
+        override = self._overrides[key]
+        base = self._base.get(key)
+        if isinstance(override, Mapping) and isinstance(base, Mapping):
+            child = self._children[key] = TreeOverlay(base, override)
+            return child
+        return override
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        for key in self._overrides:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for key in self._overrides if key not in self._base)
+
+    def __repr__(self) -> str:
+        return f"TreeOverlay({dict(self._overrides)!r})"
+
+
+def overlay(base: Mapping[str, Any], overrides: Mapping[str, Any] | None) -> Mapping[str, Any]:
+    """Return ``base`` itself when there is nothing to override."""
+    if not overrides:
+        return base
+    return TreeOverlay(base, overrides)
+
+
+def _level_number(key: Any) -> int:
+    if isinstance(key, int):
+        return key
+    if isinstance(key, str) and key.strip().lstrip("-").isdigit():
+        return int(key)
+    raise ValueError(f"Dialogue level key {key!r} is not an integer")
+
+
+class DialogueTree(Mapping):
+    """A dialogue tree compiled into an ordered tuple of ``(number, level)``.
+
+    Levels are sorted once when the tree is compiled, so walking a
+    conversation is a plain index into ``levels``. The mapping interface
+    still exposes the underlying (shared, read-only) tree by its original keys.
+    """
+
+    __slots__ = ("name", "levels", "_tree")
+
+    def __init__(self, tree: Mapping[str, Any], name: str = ""):
+        self.name = name
+        self._tree = tree
+        try:
+            numbered = [(_level_number(key), level) for key, level in tree.items()]
+        except ValueError as exc:
+            raise ValueError(f"Dialogue tree '{name}': {exc}") from exc
+        self.levels: Tuple[Level, ...] = tuple(sorted(numbered, key=itemgetter(0)))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._tree[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tree)
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def __repr__(self) -> str:
+        return f"DialogueTree({self.name!r}, levels={len(self.levels)})"
+
+    def with_overrides(self, overrides: Mapping[str, Any] | None) -> "DialogueTree":
+        """Return ``self`` or a tree compiled from an overlay on top of it."""
+        if not overrides:
+            return self
+        return DialogueTree(overlay(self._tree, overrides), self.name)
@@ -1,6 +1,7 @@
-import time, random
+import random
 import endings
 from locationobj import *
+from pacing import NullPacer
 
 #GAme States
 class EngineDisabled(object):
@@ -46,8 +47,11 @@ class DateEnabled(EngineDisabled):
     
 #Game object
 class Engine(object):
-    def __init__(self):
+    def __init__(self, pacer=None):
+        #presentation timing is up to the host; default to no waiting
+        self.pacer = pacer or NullPacer()
         self.game_over = False
+        self.ending = None
         self.current_location = None
         self.locations = {}
         self.girls = {}
@@ -72,8 +76,7 @@ class Engine(object):
         
     #Engine Setup functions
     def introduction(self, text):
-        time.sleep(0.5)
-        print(text)
+        self.pacer.pause("introduction", lambda: print(text))
         
     def build_locations(self, location_list):
         for key, value in location_list.items():
@@ -91,8 +94,9 @@ class Engine(object):
         location.date_girl = girl
                 
     def fall_in_love(self, player, girl):
-        endings.check_ending(player, girl)
+        self.ending = endings.check_ending(player, girl)
         self.game_over = True
+        return self.ending
                                     
 class Character(object):
     def __init__(self):
@@ -1,26 +1,74 @@
-def check_ending(character, girl):
-    if len(character.experiences) == 0:
-        if girl.committed_in == True:
-            print("She has fallen in love with you, and you are committed to her. Despite your inexperienced nature, the shared love and commitment will lead to new horizons, eternal respect, and unity.")
-        else:
-            print("She has fallen in love with you. In turn you have fallen in love with her. Unfortunately, you lack commitment. Eventually she will leave you and you will be left heartbroken and shattered.\nGame over.")
-    elif len(character.experiences) > 0 and len(character.experiences) < 3:
-        if girl.committed_in == True:
-            print("barely experienced. Committed. ending 2")
-        else:
-            print("barely experienced. Uncommitted. game over 2")
-    elif len(character.experiences) >= 3 and len(character.experiences) < 5:
-        if girl.committed_in == True:
-            print("somewhat experienced. Committed. ending 2")
-        else:
-            print("somewhat experienced. Uncommitted. game over 2")
-    elif len(character.experiences) >= 5 and len(character.experiences) < 7:
-        if girl.committed_in == True:
-            print("very experienced. Committed. ending 2")
-        else:
-            print("very experienced. Uncommitted. game over 2")
-    elif len(character.experiences) == 7:
-        if girl.committed_in == True:
-            print("completely experienced. Committed. ending 2")
-        else:
-            print("completely experienced. Uncommitted. game over 2")
+"""Table-driven endings, loaded from the ``endings`` script section.
+
+Each bucket covers experience counts up to ``max_experiences`` (inclusive,
+starting after the previous bucket) and names one ending for a committed
+girl and one for an uncommitted girl. The buckets are expanded into a list
+indexed by experience count, so resolving an ending is one clamped index.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from script_loader import load_script
+
+
+@dataclass(frozen=True)
+class EndingRecord:
+    id: str
+    text: str
+    girl: str
+    experiences: int
+    committed: bool
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# (committed ending, uncommitted ending), each as (id, text)
+_Pair = Tuple[Tuple[str, str], Tuple[str, str]]
+
+
+class EndingTable(object):
+    def __init__(self, by_count: List[_Pair]):
+        self._by_count = by_count
+
+    def resolve(self, character, girl) -> EndingRecord:
+        # experiences maps each one to whether it has happened yet
+        count = sum(1 for had in character.experiences.values() if had)
+        committed = girl.committed_in == True
+        pair = self._by_count[min(count, len(self._by_count) - 1)]
+        ending_id, text = pair[0] if committed else pair[1]
+        return EndingRecord(ending_id, text, girl.name, count, committed)
+
+
+def compile_endings(spec: Mapping[str, Any]) -> EndingTable:
+    by_count: List[_Pair] = []
+    for bucket in spec.get("buckets") or ():
+        upper = int(bucket["max_experiences"])
+        if upper < len(by_count):
+            raise ValueError(f"Ending buckets must increase; got max_experiences {upper}")
+        pair = tuple(
+            (str(bucket[key]["id"]), str(bucket[key]["text"]))
+            for key in ("committed", "uncommitted")
+        )
+        by_count.extend([pair] * (upper + 1 - len(by_count)))  # type: ignore[list-item]
+    if not by_count:
+        raise ValueError("No ending buckets defined")
+    return EndingTable(by_count)
+
+
+_compiled: Optional[Tuple[Mapping[str, Any], EndingTable]] = None
+
+
+def load_endings() -> EndingTable:
+    global _compiled
+    script = load_script()
+    if _compiled is None or _compiled[0] is not script:
+        _compiled = (script, compile_endings(script["endings"]))
+    return _compiled[1]
+
+
+def check_ending(character, girl) -> EndingRecord:
+    return load_endings().resolve(character, girl)
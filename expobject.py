@@ -1,4 +1,4 @@
-import time, random
+import random
 from typing import Optional
 
 _rng = random.Random()
@@ -15,8 +15,9 @@ class Experience(object):
     def date(self, engine, player):
         #describe location Experience
         print(engine.current_location.date_description)
-        time.sleep(0.3)
+        engine.pacer.pause("date_scene", lambda: self._play_date(engine, player))
 
+    def _play_date(self, engine, player):
         #check if Girl has affinity for Location (increase experience chance)
         if engine.current_location.name == engine.current_location.date_girl.affinity:
             print(engine.current_location.date_girl.name, "loves it here!")
@@ -49,7 +50,7 @@ class Experience(object):
             love_chance = _rng.randint(1,engine.current_location.date_girl.love_count)
             if love_chance == 1:
                 print("She fell in love with you.")
-                engine.fall_in_love(player, engine.current_location.date_girl)
+                print(engine.fall_in_love(player, engine.current_location.date_girl).text)
             else:
                 engine.current_location.date_girl.love_count -= 1
 
@@ -59,19 +60,26 @@ class Experience(object):
             if engine.current_location.date_girl.committed_in != True:
                 player.commit(engine.current_location.date_girl)
             if engine.current_location.date_girl.first_hangout == True:
-                time.sleep(0.5)
-                love_chance = _rng.randint(1,engine.current_location.date_girl.love_count)
-                if love_chance == 1:
-                    print("She almost fell in love with you (but didn't cause it was your first time hanging out).")    
-                engine.current_location.date_girl.first_hangout = False
+                engine.pacer.pause("first_hangout", lambda: self._first_hangout(engine))
+                return
             else:
                 love_chance = _rng.randint(1,engine.current_location.date_girl.love_count)
                 if love_chance == 1:
                     print("She fell in love with you.")
-                    engine.fall_in_love(player, engine.current_location.date_girl)
+                    print(engine.fall_in_love(player, engine.current_location.date_girl).text)
                 else:
                     engine.current_location.date_girl.love_count -= 1
 
+        self._end_date(engine)
+
+    def _first_hangout(self, engine):
+        love_chance = _rng.randint(1,engine.current_location.date_girl.love_count)
+        if love_chance == 1:
+            print("She almost fell in love with you (but didn't cause it was your first time hanging out).")    
+        engine.current_location.date_girl.first_hangout = False
+        self._end_date(engine)
+
+    def _end_date(self, engine):
         #subtract 1 from location experience count, every time visited
         #no matter what (cant go below 2)
         if engine.current_location.experience_count > 2:
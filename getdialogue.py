@@ -1,7 +1,8 @@
 import random
 from typing import Optional
-import time
+from dialogue_graph import DialogueContext, load_graph
 from script_loader import load_script
+from string_table import S, load_strings
 
 
 _rng = random.Random()
@@ -16,7 +17,8 @@ class Dialogue(object):
     def __init__(self):
         script = load_script()
         self.messages = script["dialogue"]
-        self.date_choices = self.messages["date_choices"]
+        self.ui = script["ui"]
+        self.strings = load_strings()
 
     def get_dialogue(self, engine, player, *, cli_mode: bool = True):
         """Legacy console interaction loop.
@@ -28,162 +30,68 @@ class Dialogue(object):
         if not cli_mode:
             raise RuntimeError("Dialogue.get_dialogue is CLI-only; use the GUI adapter")
 
-        encounter_template = self.messages["encounter_message"]
-        name_placeholder = "{name}"
-        if name_placeholder in encounter_template:
-            encounter_text = encounter_template.replace(
-                name_placeholder, f"{player.focus_character.name}"
-            )
-        else:
-            encounter_text = encounter_template
+        encounter_text = self.strings.format(
+            S.ENCOUNTER_MESSAGE, name=player.focus_character.name
+        )
         print(f"\n        {encounter_text}\n")
 
-        print(self.messages["greeting"])
+        print(self.strings[S.GREETING])
 
-        dialogue_tree = player.focus_character.dialogue_tree
+        graph = load_graph()
+        girl = player.focus_character
 
-        # dialogue trees loaded from the script use string keys ("0", "1", ...).
-        # Iterate through the entries in key order while tolerating either
-        # integer or string keys so the dialogue logic works regardless of the
-        # source data format.
-        ordered_dialogue_levels = sorted(
-            dialogue_tree.items(),
-            key=lambda item: int(item[0])
-            if isinstance(item[0], str) and item[0].isdigit()
-            else item[0],
-        )
+        def observe():
+            return _rng.choice(engine.current_location.observations)
 
-        for key, level in ordered_dialogue_levels:
-            level_number = int(key) if isinstance(key, str) and key.isdigit() else key
+        # levels were put in numeric order when the tree was compiled
+        for level_number, level in girl.dialogue_tree.levels:
 
-            print(f"{self.messages['level_label']} {level_number}")
-            print(f"{self.messages['opinion_label']} {player.focus_character.opinion}")
+            print(f"{self.strings[S.LEVEL_LABEL]} {level_number}")
+            print(f"{self.strings[S.OPINION_LABEL]} {girl.opinion}")
 
-            print(self.messages["choice_prompt"])
+            print(self.strings[S.CHOICE_PROMPT])
 
-            if player.focus_character.name not in player.known_girls:
-                print(
-                    1,
-                    '-',
-                    level["statement"]["compliment"],
-                )
-                print(
-                    2,
-                    '-',
-                    level["statement"]["introduction"],
-                    player.name,
-                )
-                print(
-                    3,
-                    '-',
-                    level["statement"]["question"],
+            session = graph.session(
+                DialogueContext(
+                    engine=engine,
+                    player=player,
+                    girl=girl,
+                    level_number=level_number,
+                    level=level,
+                    messages=self.messages,
+                    ui=self.ui,
+                    observe=observe,
                 )
+            )
+            self._run_turn(session)
 
-                statement = input("> ")
+            if session.context.date is not None:
+                break
+
+        engine.start_day()
 
-                if int(statement) == 1:
-                    print(level["reply"]["compliment"][0])
-                    player.focus_character.opinion += level["reply"][
-                        "compliment"
-                    ][1]
-                elif int(statement) == 2:
-                    player.make_acquaintance(player.focus_character)
-                    print(level["reply"]["introduction"][0])
-                    player.focus_character.opinion += level["reply"][
-                        "introduction"
-                    ][1]
-                elif int(statement) == 3:
-                    print(level["reply"]["question"][0])
-                    player.focus_character.opinion += level["reply"][
-                        "question"
-                    ][1]
+    def _run_turn(self, session):
+        """Prompt through one turn of the dialogue graph."""
+        while True:
+            if session.paused:
+                print(session.text())
+                session.context.engine.pacer.pause(session.paused)
+                step = session.choose(1)
             else:
-                if player.focus_character.opinion < 3:
-                    print(
-                        1,
-                        '-',
-                        level["statement"]["compliment"],
-                    )
-                    print(
-                        2,
-                        '-',
-                        _rng.choice(engine.current_location.observations),
-                    )
-                    print(
-                        3,
-                        '-',
-                        level["statement"]["question"],
-                    )
-
-                    statement = input("> ")
-
-                    if int(statement) == 1:
-                        print(level["reply"]["compliment"][0])
-                        player.focus_character.opinion += level["reply"][
-                            "compliment"
-                        ][1]
-                    elif int(statement) == 2:
-                        print(level["reply"]["observation"][0])
-                        player.focus_character.opinion += level["reply"][
-                            "observation"
-                        ][1]
-                    elif int(statement) == 3:
-                        print(level["reply"]["question"][0])
-                        player.focus_character.opinion += level["reply"][
-                            "question"
-                        ][1]
-
-                else:
-                    print(
-                        1,
-                        '-',
-                        level["statement"]["compliment"],
-                    )
-                    print(
-                        2,
-                        '-',
-                        _rng.choice(engine.current_location.observations),
-                    )
-                    print(
-                        3,
-                        '-',
-                        level["statement"]["question"],
-                    )
-                    print(4, '-', self.messages["date_offer"])
-
-                    statement = input("> ")
-
-                    if int(statement) == 1:
-                        print(level["reply"]["compliment"][0])
-                        player.focus_character.opinion += level["reply"][
-                            "compliment"
-                        ][1]
-                    elif int(statement) == 2:
-                        print(level["reply"]["observation"][0])
-                        player.focus_character.opinion += level["reply"][
-                            "observation"
-                        ][1]
-                    elif int(statement) == 3:
-                        print(level["reply"]["question"][0])
-                        player.focus_character.opinion += level["reply"][
-                            "question"
-                        ][1]
-                    elif int(statement) == 4:
-                        print(self.messages["date_invite"])
-                        for index, choice in enumerate(self.date_choices, start=1):
-                            print(index, '-', choice["text"])
-
-                        date_destination = input("> ")
-
-                        print(self.messages["date_confirmation"])
-                        time.sleep(0.3)
-
-                        selected_choice = self.date_choices[int(date_destination) - 1]
-                        engine.make_date(
-                            engine.locations[selected_choice["location"]],
-                            player.focus_character,
-                        )
-
-                        break
+                for option_id, label in session.options():
+                    print(option_id, '-', label)
 
-        engine.start_day()
+                statement = input("> ")
+                step = session.choose(int(statement))
+
+            if step is None:
+                return
+            if step.reply:
+                print(step.reply)
+            if step.ended:
+                return
+            if not session.paused:
+                text = session.text()
+                # a ``say`` effect may already have printed the next prompt
+                if text != step.reply:
+                    print(text)
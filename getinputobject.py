@@ -1,3 +1,4 @@
+from completion import CommandTrie, complete_line
 from locationobj import activate_location
 
 #Parser Error Function  
@@ -32,36 +33,78 @@ class Input(object):
             'command':self.command,
             'inactive_verb':self.inactive_verb
         }
+        self.completions = CommandTrie()
+        self.sync_completions()
+    
+    def sync_completions(self, exits=None, known_locations=()):
+        """Bring the completion trie in line with the current vocab lists.
+
+        ``exits`` are the current location's destinations; known locations are
+        ranked after them even though both live in the 'direction' vocab.
+        """
+        for category in ('verb', 'command', 'inactive_verb', 'noun', 'character'):
+            self.completions.sync(category, self.vocab[category])
+        if exits is None:
+            exits = self.vocab['direction']
+        self.completions.sync('direction', exits)
+        self.completions.sync('location', known_locations)
+
+    def complete(self, text, limit=None):
+        """Return ranked completions for a partially typed command line."""
+        return complete_line(self.completions, text, limit)
     
     def error_msg(self):
         print("I didn't understand you. Try again or type '?'.")
         
-    def help(self):
+    def help_lines(self):
         if not self.vocab['inactive_verb']:
-            print("I can do the following", self.vocab['verb'])
+            lines = ["I can do the following %s" % self.vocab['verb']]
         else:
-            print("I can do the following", self.vocab['verb'], "or", self.vocab['inactive_verb'])
-        print("I can go in the following directions", self.vocab['direction'])
-        print("The following are in this scene", self.vocab['noun'])
+            lines = ["I can do the following %s or %s" % (self.vocab['verb'], self.vocab['inactive_verb'])]
+        lines.append("I can go in the following directions %s" % self.vocab['direction'])
+        lines.append("The following are in this scene %s" % self.vocab['noun'])
+        return lines
+
+    def help(self):
+        for line in self.help_lines():
+            print(line)
         
     def scan(self, sentence, inputobj):
-        """Input the raw text --> Output a List of Tuples which correspond to the categories above"""
+        """Input the raw text --> Output a List of Tuples which correspond to the categories above
+
+        Multi-word vocabulary ("night life district") is matched as one
+        word, longest match first, so completed lines parse as offered.
+        """
         wordlist=sentence.split()
+        longest = max(
+            (len(w.split()) for value in inputobj.vocab.values() for w in value), default=1
+        )
         result=[]
-        for word in wordlist:
-            found=False
-            for key,value in list(inputobj.vocab.items()):
-                if word.lower() in value:
-                    result.append((key,word))
-                    found=True
+        i = 0
+        while i < len(wordlist):
+            for n in range(min(longest, len(wordlist) - i), 0, -1):
+                phrase = " ".join(wordlist[i:i + n])
+                key = self._category(phrase, inputobj)
+                if key is not None:
+                    result.append((key,phrase))
+                    i += n
                     break
-            if not found:
+            else:
+                word = wordlist[i]
+                i += 1
                 try:
                     word=int(word)
                     result.append(('number',word))
                 except ValueError:
                     result.append(('error',word))
         return result
+
+    @staticmethod
+    def _category(phrase, inputobj):
+        for key,value in list(inputobj.vocab.items()):
+            if phrase.lower() in value:
+                return key
+        return None
                 
     def peek(self, word_list):
         if word_list:
@@ -210,3 +253,26 @@ class Input(object):
                 detail = engine.current_location.describe_thing(x.object)
                 if detail:
                     print(detail)
+
+
+def install_readline_completion(inputobj):
+    """Hook ``inputobj.complete`` into readline's Tab completion, if available."""
+    try:
+        import readline
+    except ImportError:
+        return False
+
+    matches = []
+
+    def completer(text, state):
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            # readline replaces only the current word; strip what precedes it
+            start = len(line) - len(text)
+            matches[:] = [m[start:] for m in inputobj.complete(line)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    readline.set_completer_delims(' ')
+    readline.parse_and_bind('tab: complete')
+    return True
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from dialogue_trees import DialogueTree
 from script_loader import load_script
 
 DEFAULT_DIALOGUE_TREE = "default"
@@ -6,25 +6,38 @@ DEFAULT_DIALOGUE_TREE = "default"
 _script = load_script()
 _dialogue_trees = _script.get("dialogue_trees", {})
 _girl_dialogues = _script.get("girls", {})
+# Trees are compiled once per name and shared by every girl that uses them.
+_compiled_trees = {}
 
 
 def _dialogue_tree_for(girl_name):
+    """Return the girl's dialogue tree, shared by reference with other girls.
+
+    A ``dialogue_overrides`` mapping in the girl's script entry is overlaid on
+    the shared tree instead of copying it.
+    """
     tree_name = DEFAULT_DIALOGUE_TREE
+    overrides = None
 
     girl_config = _girl_dialogues.get(girl_name)
     if girl_config is not None:
         tree_name = girl_config.get("dialogue_tree", DEFAULT_DIALOGUE_TREE)
+        overrides = girl_config.get("dialogue_overrides")
     elif DEFAULT_DIALOGUE_TREE not in _dialogue_trees:
         raise KeyError(
             f"No dialogue tree configured for girl '{girl_name}', and no default tree defined."
         )
 
-    try:
-        return deepcopy(_dialogue_trees[tree_name])
-    except KeyError as exc:
-        raise KeyError(
-            f"Dialogue tree '{tree_name}' referenced by girl '{girl_name}' is not defined."
-        ) from exc
+    tree = _compiled_trees.get(tree_name)
+    if tree is None:
+        try:
+            tree = DialogueTree(_dialogue_trees[tree_name], tree_name)
+        except KeyError as exc:
+            raise KeyError(
+                f"Dialogue tree '{tree_name}' referenced by girl '{girl_name}' is not defined."
+            ) from exc
+        _compiled_trees[tree_name] = tree
+    return tree.with_overrides(overrides)
 
 
 _base_girl_definitions = {
@@ -0,0 +1,101 @@
+"""Inverted full-text index over the knowledge base (``game/knowledge.yaml``).
+
+Entries from every section are numbered once; each word of their indexed
+fields maps to the sorted entry numbers containing it. A query matches the
+entries that contain, for every query word, some indexed word starting with
+it, so results narrow as the player types.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+SECTIONS: Tuple[str, ...] = ("notes", "factions", "sites", "tech")
+INDEXED_FIELDS: Tuple[str, ...] = ("title", "name", "summary", "text", "tags")
+# Fields shown for each entry, in display order.
+DISPLAY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "notes": ("title", "text"),
+    "factions": ("name", "summary"),
+    "sites": ("name", "summary"),
+    "tech": ("name", "summary"),
+}
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return "" if value is None else str(value)
+
+
+class KnowledgeIndex(object):
+    def __init__(self, knowledge: Mapping[str, Sequence[Mapping[str, Any]]]):
+        self.entries: List[Mapping[str, Any]] = []
+        # section -> entry numbers, in file order
+        self.sections: Dict[str, List[int]] = {}
+        postings: Dict[str, List[int]] = {}
+        for section in SECTIONS:
+            numbers = self.sections[section] = []
+            for entry in knowledge.get(section) or ():
+                number = len(self.entries)
+                self.entries.append(entry)
+                numbers.append(number)
+                words = set()
+                for field in INDEXED_FIELDS:
+                    words.update(tokenize(_field_text(entry.get(field))))
+                for word in words:
+                    postings.setdefault(word, []).append(number)
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self._prefix_cache: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+        matches: Set[int] = set()
+        vocabulary = self._vocabulary
+        i = bisect_left(vocabulary, prefix)
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            matches.update(self._postings[vocabulary[i]])
+            i += 1
+        if len(self._prefix_cache) > 256:
+            self._prefix_cache.clear()
+        self._prefix_cache[prefix] = matches
+        return matches
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """Entry numbers matching every word of ``query``; ``None`` for an empty query."""
+        words = tokenize(query)
+        if not words:
+            return None
+        # rarest words first keeps the intersection small
+        sets = sorted((self._prefix_matches(w) for w in words), key=len)
+        result = set(sets[0])
+        for s in sets[1:]:
+            result &= s
+            if not result:
+                break
+        return result
+
+    def section_rows(self, section: str, matches: Optional[Iterable[int]] = None) -> List[int]:
+        numbers = self.sections.get(section, [])
+        if matches is None:
+            return numbers
+        wanted = matches if isinstance(matches, (set, frozenset)) else set(matches)
+        return [n for n in numbers if n in wanted]
+
+    def display_text(self, number: int, section: str, joiner: str) -> str:
+        entry = self.entries[number]
+        parts = [str(entry.get(key, "")) for key in DISPLAY_FIELDS[section] if entry.get(key) is not None]
+        return joiner.join(p for p in parts if p)
@@ -115,4 +115,7 @@ def activate_location(engine, destination, inputobj, player) -> List[str]:
     inputobj.vocab['inactive_verb'] = inputobj.inactive_verb
     inputobj.vocab['character'] = inputobj.character
 
+    #keep the completion trie in step, touching only words that changed
+    inputobj.sync_completions(engine.current_location.destinations, player.known_locations)
+
     return messages
@@ -0,0 +1,59 @@
+"""Presentation timing for dramatic pauses.
+
+Engine code asks for a named beat (``pacer.pause("date_scene", then)``) and
+never deals with wall-clock time itself; the host decides what a beat means.
+``BlockingPacer`` sleeps, for the console; ``NullPacer`` skips the wait, for
+headless and batch runs; ``AsyncioPacer`` (and ``app.pacing.QtPacer``)
+schedule ``then`` on an event loop and return immediately.
+"""
+
+from __future__ import annotations
+
+import abc
+import time
+from typing import Callable, Dict, Optional
+
+# Beat name -> seconds.
+BEATS: Dict[str, float] = {
+    "introduction": 0.5,
+    "date_scene": 0.3,
+    "first_hangout": 0.5,
+    "date_confirmation": 0.3,
+}
+
+Callback = Optional[Callable[[], None]]
+
+
+class Pacer(abc.ABC):
+    def __init__(self, beats: Optional[Dict[str, float]] = None):
+        self.beats = dict(BEATS, **(beats or {}))
+
+    def delay(self, beat: str) -> float:
+        return self.beats.get(beat, 0.0)
+
+    @abc.abstractmethod
+    def pause(self, beat: str, then: Callback = None) -> None:
+        """Hold for ``beat``, then run ``then`` (if given)."""
+
+
+class NullPacer(Pacer):
+    def pause(self, beat: str, then: Callback = None) -> None:
+        if then is not None:
+            then()
+
+
+class BlockingPacer(Pacer):
+    def pause(self, beat: str, then: Callback = None) -> None:
+        time.sleep(self.delay(beat))
+        if then is not None:
+            then()
+
+
+class AsyncioPacer(Pacer):
+    def __init__(self, loop, beats: Optional[Dict[str, float]] = None):
+        super().__init__(beats)
+        self.loop = loop
+
+    def pause(self, beat: str, then: Callback = None) -> None:
+        if then is not None:
+            self.loop.call_later(self.delay(beat), then)
@@ -0,0 +1,100 @@
+"""Fast loading of YAML/JSON data files with an on-disk parse cache."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import Any, Callable, Dict, Tuple
+
+import yaml
+
+try:  # libyaml bindings are optional; fall back to the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # depends on how PyYAML was built
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+CACHE_DIR = os.path.join(".cache", "parsed")
+_FORMAT = 1
+
+_logger = logging.getLogger(__name__)
+
+stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def parse_yaml(data: bytes) -> Any:
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def parse_json(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _cache_file(path: str) -> str:
+    name = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}.pickle")
+
+
+def _read_cached(cache_path: str, key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+    try:
+        with open(cache_path, "rb") as f:
+            if pickle.load(f) != key:
+                return False, None
+            return True, pickle.load(f)
+    except FileNotFoundError:
+        return False, None
+    except Exception:
+        _logger.warning("Ignoring unreadable parse cache %s", cache_path, exc_info=True)
+        return False, None
+
+
+def _write_cached(cache_path: str, key: Tuple[Any, ...], value: Any) -> None:
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(key, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except Exception:  # best effort: a missing cache only costs a re-parse
+        _logger.warning("Could not write parse cache %s", cache_path, exc_info=True)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load_cached(path: str, parse: Callable[[bytes], Any], *, use_cache: bool = True) -> Any:
+    """Parse ``path`` with ``parse``, reusing a cached result when unchanged.
+
+    Cache entries are keyed by the resolved path, file size, mtime and a hash
+    of the contents, so an edited file is always re-parsed even if its size
+    and timestamp happen to match.
+    """
+    real = os.path.realpath(path)
+    with open(real, "rb") as f:
+        st = os.fstat(f.fileno())
+        raw = f.read()
+    if not use_cache:
+        return parse(raw)
+
+    key = (_FORMAT, real, st.st_size, st.st_mtime_ns, hashlib.blake2b(raw).hexdigest())
+    cache_path = _cache_file(real)
+    hit, value = _read_cached(cache_path, key)
+    if hit:
+        stats["hits"] += 1
+        return value
+    stats["misses"] += 1
+    value = parse(raw)
+    _write_cached(cache_path, key, value)
+    return value
+
+
+def load_yaml(path: str, *, use_cache: bool = True) -> Any:
+    return load_cached(path, parse_yaml, use_cache=use_cache)
+
+
+def load_json(path: str, *, use_cache: bool = True) -> Any:
+    return load_cached(path, parse_json, use_cache=use_cache)
@@ -1,6 +1,9 @@
 from __future__ import annotations
-import os, json, yaml
-from typing import Any, Dict
+import os, threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from parse_cache import load_json, load_yaml
 
 SCRIPT_PATHS = [
     os.path.join("game", "script.yaml"),
@@ -11,21 +14,66 @@ SCRIPT_PATHS = [
 _DEFAULT_SCRIPT: Dict[str, Any] = {
     "ui": {
         "general": {"continue_label": "Continue", "ellipsis": "…"},
-        "dialogue": {"empty_scene": {"speaker": "", "text": "No one is here."}},
+        "dialogue": {
+            "empty_scene": {"speaker": "", "text": "No one is here."},
+            "history_search_placeholder": "Search history",
+        },
         "nav_overlay": {"location_placeholder": "—", "talk_label": " Talk: ", "talk_button": "Talk"},
         "main_window": {
             "title": "CRPG–VN Hybrid (Long Twilight)",
             "deterministic_seed_action": "Deterministic Seed",
             "deterministic_seed_shortcut": "Ctrl+D",
             "knowledge_title": "Knowledge",
+            "busy_label": "Working…",
+            "player_fallback_name": "You",
+            "stats_title": "Stats",
+            "recent_title": "Recent",
+            "load_failed": "Could not load {name}: {message}",
+            "engine_init_failed": "Engine initialisation failed:\n{message}",
+            "startup_error_title": "Startup Error",
+            "latency_exported": "Latency histograms written to {path}",
+            "latency_export_failed": "Could not export latency histograms: {error}",
+        },
+        "character_pane": {
+            "placeholder": "—",
+            "list_join": ", ",
+            "level_format": "Level {level}",
+            "hp_format": "HP %v",
+            "mp_format": "MP %v",
+            "stamina_format": "STA %v",
+            "inventory_entry_format": "{name} ×{qty}",
+            "attributes_title": "Attributes",
+            "affinity_title": "Affinity",
+            "skills_title": "Skills",
+            "conditions_title": "Conditions",
+            "inventory_title": "Inventory",
         },
-        "character_pane": {},
         "knowledge_pane": {
             "notes_tab": "Notes",
             "factions_tab": "Factions & Enclaves",
             "sites_tab": "Sites & Rumours",
             "tech_tab": "Tech & Lore",
             "status_placeholder": "",
+            "entry_joiner": " — ",
+            "travel_format": "Going to: {destination}",
+            "search_placeholder": "Search lore",
+        },
+        "save_slots": {
+            "save_title": "Save Game",
+            "load_title": "Load Game",
+            "new_button": "New Slot",
+            "autosave_name": "Autosave",
+            "slot_name": "Slot {slot}",
+            "entry_format": "{name} — {location}, {girl}\n{saved_at} · played {play_time}",
+        },
+        "commands": {
+            "placeholder": "Type a command (Tab completes, ? for help)",
+            "go_where": "Where do you want to go?",
+            "unknown_destination": "I'm not sure where that is or if it even exists.",
+            "no_such_person": "I don't see that person here.",
+            "reflect_name": "My name is {name}",
+            "reflect_locations": "My known locations are: {locations}",
+            "not_understood": "I didn't understand you. Try again or type '?'.",
         },
         "determinism": {
             "action_label": "Deterministic Seed",
@@ -49,6 +97,86 @@ _DEFAULT_SCRIPT: Dict[str, Any] = {
         ],
         "encounter_message": "You run into {name}.",
     },
+    "endings": {
+        "buckets": [
+            {
+                "max_experiences": 0,
+                "committed": {
+                    "id": "inexperienced_committed",
+                    "text": "She has fallen in love with you, and you are committed to her. "
+                    "Despite your inexperienced nature, the shared love and commitment will "
+                    "lead to new horizons, eternal respect, and unity.",
+                },
+                "uncommitted": {
+                    "id": "inexperienced_uncommitted",
+                    "text": "She has fallen in love with you. In turn you have fallen in love "
+                    "with her. Unfortunately, you lack commitment. Eventually she will leave "
+                    "you and you will be left heartbroken and shattered.\nGame over.",
+                },
+            },
+            {
+                "max_experiences": 2,
+                "committed": {"id": "barely_committed", "text": "barely experienced. Committed. ending 2"},
+                "uncommitted": {"id": "barely_uncommitted", "text": "barely experienced. Uncommitted. game over 2"},
+            },
+            {
+                "max_experiences": 4,
+                "committed": {"id": "somewhat_committed", "text": "somewhat experienced. Committed. ending 2"},
+                "uncommitted": {"id": "somewhat_uncommitted", "text": "somewhat experienced. Uncommitted. game over 2"},
+            },
+            {
+                "max_experiences": 6,
+                "committed": {"id": "very_committed", "text": "very experienced. Committed. ending 2"},
+                "uncommitted": {"id": "very_uncommitted", "text": "very experienced. Uncommitted. game over 2"},
+            },
+            {
+                "max_experiences": 7,
+                "committed": {"id": "completely_committed", "text": "completely experienced. Committed. ending 2"},
+                "uncommitted": {"id": "completely_uncommitted", "text": "completely experienced. Uncommitted. game over 2"},
+            },
+        ],
+    },
+    "dialogue_graph": {
+        "start": "level",
+        "nodes": {
+            "level": {
+                "text": "{dialogue.level_label} {level}\n{dialogue.opinion_label} {opinion}"
+                "\n\n{dialogue.greeting}",
+                "options": [
+                    {"label": "{statement.compliment}", "effects": ["reply compliment"]},
+                    {
+                        "label": "{statement.introduction} {player}",
+                        "when": "not known",
+                        "effects": ["acquaint", "reply introduction"],
+                    },
+                    {
+                        "label": "{observation}",
+                        "when": "known",
+                        "effects": ["reply observation"],
+                    },
+                    {"label": "{statement.question}", "effects": ["reply question"]},
+                    {
+                        "label": "{dialogue.date_offer}",
+                        "when": "known and opinion >= 3",
+                        "effects": ["say date_invite"],
+                        "goto": "date",
+                    },
+                ],
+            },
+            "date": {
+                "text": "{dialogue.date_invite}",
+                "each": "date_choices",
+                "options": [
+                    {"label": "{choice.text}", "effects": ["make_date"], "goto": "confirm"},
+                ],
+            },
+            "confirm": {
+                "text": "{dialogue.date_confirmation}",
+                "pause": "date_confirmation",
+                "options": [{"label": "{ui.general.continue_label}"}],
+            },
+        },
+    },
     "dialogue_trees": {
         "default": {
             "0": {
@@ -83,13 +211,23 @@ _DEFAULT_SCRIPT: Dict[str, Any] = {
 
 
 def _load_yaml_or_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        if path.endswith((".yaml", ".yml")):
-            return yaml.safe_load(f) or {}
-        return json.load(f)
+    if path.endswith((".yaml", ".yml")):
+        return load_yaml(path) or {}
+    return load_json(path)
 
 
-def load_script() -> Dict[str, Any]:
+def freeze(value: Any) -> Any:
+    """Return a read-only view of parsed script data (mappings and tuples)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def _parse_script() -> Dict[str, Any]:
+    global _parse_count
+    _parse_count += 1
     for p in SCRIPT_PATHS:
         if os.path.exists(p):
             data = _load_yaml_or_json(p)
@@ -101,3 +239,36 @@ def load_script() -> Dict[str, Any]:
                     data[k] = v
             return data
     return _DEFAULT_SCRIPT.copy()
+
+
+_lock = threading.Lock()
+_script: Optional[Mapping[str, Any]] = None
+_parse_count = 0
+
+
+def load_script() -> Mapping[str, Any]:
+    """Return the process-wide script registry, parsing it on first use.
+
+    The result is immutable and shared by every caller; use
+    ``invalidate_script`` to force a re-parse.
+    """
+    global _script
+    script = _script
+    if script is None:
+        with _lock:
+            if _script is None:
+                _script = freeze(_parse_script())
+            script = _script
+    return script
+
+
+def invalidate_script() -> None:
+    """Drop the cached registry so the next ``load_script`` re-reads disk."""
+    global _script
+    with _lock:
+        _script = None
+
+
+def script_parse_count() -> int:
+    """Number of times the script has been read and parsed in this process."""
+    return _parse_count
@@ -0,0 +1,266 @@
+"""Flat, precompiled string table for UI and dialogue text.
+
+Every string the code looks up is declared once in ``_DECLARED`` with its
+script path and the template fields it may use. ``compile_strings`` resolves
+them all against the script up front, parses templates once and reports
+problems at compile time: a key missing from the script falls back to the
+built-in default script with a warning, and a key missing from both (or a
+template using an undeclared field) raises ``StringTableError``. At runtime a
+lookup is a tuple index by an ``S`` member::
+
+    strings = load_strings()
+    strings[S.CONTINUE_LABEL]
+    strings.format(S.ENCOUNTER_MESSAGE, name="tammy")
+"""
+
+from __future__ import annotations
+
+import logging
+from enum import IntEnum
+from string import Formatter
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from script_loader import _DEFAULT_SCRIPT, load_script
+
+_logger = logging.getLogger(__name__)
+
+# A parsed template: literal text and field names, in order.
+Template = Tuple[Union[str, "Field"], ...]
+
+
+class Field(str):
+    """A template placeholder name (distinguishes fields from literal text)."""
+
+
+class StringTableError(ValueError):
+    """Raised when declared strings cannot be resolved or are malformed."""
+
+
+class S(IntEnum):
+    CONTINUE_LABEL = 0
+    ELLIPSIS = 1
+    EMPTY_SCENE_SPEAKER = 2
+    EMPTY_SCENE_TEXT = 3
+    NAV_LOCATION_PLACEHOLDER = 4
+    NAV_TALK_LABEL = 5
+    NAV_TALK_BUTTON = 6
+    WINDOW_TITLE = 7
+    KNOWLEDGE_TITLE = 8
+    SEED_SHORTCUT = 9
+    CHAR_PLACEHOLDER = 10
+    CHAR_LIST_JOIN = 11
+    CHAR_LEVEL_FORMAT = 12
+    CHAR_HP_FORMAT = 13
+    CHAR_MP_FORMAT = 14
+    CHAR_STAMINA_FORMAT = 15
+    CHAR_INVENTORY_ENTRY = 16
+    CHAR_ATTRIBUTES_TITLE = 17
+    CHAR_AFFINITY_TITLE = 18
+    CHAR_SKILLS_TITLE = 19
+    CHAR_CONDITIONS_TITLE = 20
+    CHAR_INVENTORY_TITLE = 21
+    KNOW_NOTES_TAB = 22
+    KNOW_FACTIONS_TAB = 23
+    KNOW_SITES_TAB = 24
+    KNOW_TECH_TAB = 25
+    KNOW_STATUS_PLACEHOLDER = 26
+    KNOW_ENTRY_JOINER = 27
+    KNOW_TRAVEL_FORMAT = 28
+    SEED_ACTION = 29
+    SEED_DIALOG_TITLE = 30
+    SEED_DIALOG_PROMPT = 31
+    SEED_TOAST = 32
+    ENCOUNTER_MESSAGE = 33
+    GREETING = 34
+    CHOICE_PROMPT = 35
+    LEVEL_LABEL = 36
+    OPINION_LABEL = 37
+    DATE_OFFER = 38
+    DATE_INVITE = 39
+    DATE_CONFIRMATION = 40
+    KNOW_SEARCH_PLACEHOLDER = 41
+    BUSY_LABEL = 42
+    SLOTS_SAVE_TITLE = 43
+    SLOTS_LOAD_TITLE = 44
+    SLOTS_NEW_BUTTON = 45
+    SLOTS_AUTOSAVE_NAME = 46
+    SLOTS_SLOT_NAME = 47
+    SLOTS_ENTRY_FORMAT = 48
+    CMD_PLACEHOLDER = 49
+    CMD_GO_WHERE = 50
+    CMD_UNKNOWN_DESTINATION = 51
+    CMD_NO_SUCH_PERSON = 52
+    CMD_REFLECT_NAME = 53
+    CMD_REFLECT_LOCATIONS = 54
+    CMD_NOT_UNDERSTOOD = 55
+    HISTORY_SEARCH_PLACEHOLDER = 56
+    PLAYER_FALLBACK_NAME = 57
+    STATS_TITLE = 58
+    RECENT_TITLE = 59
+    LOAD_FAILED = 60
+    ENGINE_INIT_FAILED = 61
+    STARTUP_ERROR_TITLE = 62
+    LATENCY_EXPORTED = 63
+    LATENCY_EXPORT_FAILED = 64
+
+
+# id -> (script path, template fields the string may use)
+_DECLARED: Dict[S, Tuple[str, Tuple[str, ...]]] = {
+    S.CONTINUE_LABEL: ("ui.general.continue_label", ()),
+    S.ELLIPSIS: ("ui.general.ellipsis", ()),
+    S.EMPTY_SCENE_SPEAKER: ("ui.dialogue.empty_scene.speaker", ()),
+    S.EMPTY_SCENE_TEXT: ("ui.dialogue.empty_scene.text", ()),
+    S.HISTORY_SEARCH_PLACEHOLDER: ("ui.dialogue.history_search_placeholder", ()),
+    S.NAV_LOCATION_PLACEHOLDER: ("ui.nav_overlay.location_placeholder", ()),
+    S.NAV_TALK_LABEL: ("ui.nav_overlay.talk_label", ()),
+    S.NAV_TALK_BUTTON: ("ui.nav_overlay.talk_button", ()),
+    S.WINDOW_TITLE: ("ui.main_window.title", ()),
+    S.KNOWLEDGE_TITLE: ("ui.main_window.knowledge_title", ()),
+    S.SEED_SHORTCUT: ("ui.main_window.deterministic_seed_shortcut", ()),
+    S.BUSY_LABEL: ("ui.main_window.busy_label", ()),
+    S.PLAYER_FALLBACK_NAME: ("ui.main_window.player_fallback_name", ()),
+    S.STATS_TITLE: ("ui.main_window.stats_title", ()),
+    S.RECENT_TITLE: ("ui.main_window.recent_title", ()),
+    S.LOAD_FAILED: ("ui.main_window.load_failed", ("name", "message")),
+    S.ENGINE_INIT_FAILED: ("ui.main_window.engine_init_failed", ("message",)),
+    S.STARTUP_ERROR_TITLE: ("ui.main_window.startup_error_title", ()),
+    S.LATENCY_EXPORTED: ("ui.main_window.latency_exported", ("path",)),
+    S.LATENCY_EXPORT_FAILED: ("ui.main_window.latency_export_failed", ("error",)),
+    S.CHAR_PLACEHOLDER: ("ui.character_pane.placeholder", ()),
+    S.CHAR_LIST_JOIN: ("ui.character_pane.list_join", ()),
+    S.CHAR_LEVEL_FORMAT: ("ui.character_pane.level_format", ("level",)),
+    S.CHAR_HP_FORMAT: ("ui.character_pane.hp_format", ()),
+    S.CHAR_MP_FORMAT: ("ui.character_pane.mp_format", ()),
+    S.CHAR_STAMINA_FORMAT: ("ui.character_pane.stamina_format", ()),
+    S.CHAR_INVENTORY_ENTRY: ("ui.character_pane.inventory_entry_format", ("name", "qty")),
+    S.CHAR_ATTRIBUTES_TITLE: ("ui.character_pane.attributes_title", ()),
+    S.CHAR_AFFINITY_TITLE: ("ui.character_pane.affinity_title", ()),
+    S.CHAR_SKILLS_TITLE: ("ui.character_pane.skills_title", ()),
+    S.CHAR_CONDITIONS_TITLE: ("ui.character_pane.conditions_title", ()),
+    S.CHAR_INVENTORY_TITLE: ("ui.character_pane.inventory_title", ()),
+    S.KNOW_NOTES_TAB: ("ui.knowledge_pane.notes_tab", ()),
+    S.KNOW_FACTIONS_TAB: ("ui.knowledge_pane.factions_tab", ()),
+    S.KNOW_SITES_TAB: ("ui.knowledge_pane.sites_tab", ()),
+    S.KNOW_TECH_TAB: ("ui.knowledge_pane.tech_tab", ()),
+    S.KNOW_STATUS_PLACEHOLDER: ("ui.knowledge_pane.status_placeholder", ()),
+    S.KNOW_ENTRY_JOINER: ("ui.knowledge_pane.entry_joiner", ()),
+    S.KNOW_TRAVEL_FORMAT: ("ui.knowledge_pane.travel_format", ("destination",)),
+    S.KNOW_SEARCH_PLACEHOLDER: ("ui.knowledge_pane.search_placeholder", ()),
+    S.SLOTS_SAVE_TITLE: ("ui.save_slots.save_title", ()),
+    S.SLOTS_LOAD_TITLE: ("ui.save_slots.load_title", ()),
+    S.SLOTS_NEW_BUTTON: ("ui.save_slots.new_button", ()),
+    S.SLOTS_AUTOSAVE_NAME: ("ui.save_slots.autosave_name", ()),
+    S.SLOTS_SLOT_NAME: ("ui.save_slots.slot_name", ("slot",)),
+    S.SLOTS_ENTRY_FORMAT: (
+        "ui.save_slots.entry_format",
+        ("name", "location", "girl", "saved_at", "play_time"),
+    ),
+    S.CMD_PLACEHOLDER: ("ui.commands.placeholder", ()),
+    S.CMD_GO_WHERE: ("ui.commands.go_where", ()),
+    S.CMD_UNKNOWN_DESTINATION: ("ui.commands.unknown_destination", ()),
+    S.CMD_NO_SUCH_PERSON: ("ui.commands.no_such_person", ()),
+    S.CMD_REFLECT_NAME: ("ui.commands.reflect_name", ("name",)),
+    S.CMD_REFLECT_LOCATIONS: ("ui.commands.reflect_locations", ("locations",)),
+    S.CMD_NOT_UNDERSTOOD: ("ui.commands.not_understood", ()),
+    S.SEED_ACTION: ("ui.determinism.action_label", ()),
+    S.SEED_DIALOG_TITLE: ("ui.determinism.dialog_title", ()),
+    S.SEED_DIALOG_PROMPT: ("ui.determinism.dialog_prompt", ()),
+    S.SEED_TOAST: ("ui.determinism.toast", ("seed",)),
+    S.ENCOUNTER_MESSAGE: ("dialogue.encounter_message", ("name",)),
+    S.GREETING: ("dialogue.greeting", ()),
+    S.CHOICE_PROMPT: ("dialogue.choice_prompt", ()),
+    S.LEVEL_LABEL: ("dialogue.level_label", ()),
+    S.OPINION_LABEL: ("dialogue.opinion_label", ()),
+    S.DATE_OFFER: ("dialogue.date_offer", ()),
+    S.DATE_INVITE: ("dialogue.date_invite", ()),
+    S.DATE_CONFIRMATION: ("dialogue.date_confirmation", ()),
+}
+
+
+def parse_template(source: str) -> Template:
+    """Split ``"Going to: {destination}"`` into literals and ``Field`` names."""
+
+    parts: List[Union[str, Field]] = []
+    try:
+        parsed = list(Formatter().parse(source))
+    except ValueError as exc:
+        raise StringTableError(f"Bad template {source!r}: {exc}") from exc
+    for literal, name, _spec, _conv in parsed:
+        if literal:
+            parts.append(literal)
+        if name is not None:
+            parts.append(Field(name))
+    return tuple(parts)
+
+
+def _lookup(root: Mapping[str, Any], path: str) -> Optional[Any]:
+    value: Any = root
+    for part in path.split("."):
+        if not isinstance(value, Mapping) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+class StringTable(object):
+    """Resolved strings and their parsed templates, indexed by ``S``."""
+
+    __slots__ = ("_text", "_templates", "fallbacks")
+
+    def __init__(self, text: Tuple[str, ...], templates: Tuple[Template, ...], fallbacks: Tuple[str, ...]):
+        self._text = text
+        self._templates = templates
+        # script paths that were missing and came from the built-in defaults
+        self.fallbacks = fallbacks
+
+    def __getitem__(self, key: S) -> str:
+        return self._text[key]
+
+    def format(self, key: S, **values: Any) -> str:
+        """Fill a template's fields in a single pass over its parsed parts."""
+        return "".join(
+            str(values[part]) if isinstance(part, Field) else part
+            for part in self._templates[key]
+        )
+
+
+def compile_strings(script: Mapping[str, Any]) -> StringTable:
+    text: List[str] = []
+    templates: List[Template] = []
+    fallbacks: List[str] = []
+    errors: List[str] = []
+    for key in S:
+        path, fields = _DECLARED[key]
+        value = _lookup(script, path)
+        if value is None:
+            value = _lookup(_DEFAULT_SCRIPT, path)
+            if value is None:
+                errors.append(f"{path}: not defined")
+                value = ""
+            else:
+                fallbacks.append(path)
+        value = str(value)
+        template = parse_template(value) if fields else (value,)
+        unknown = {p for p in template if isinstance(p, Field)} - set(fields)
+        if unknown:
+            errors.append(f"{path}: unknown field(s) {sorted(unknown)} in {value!r}")
+        text.append(value)
+        templates.append(template)
+    if errors:
+        raise StringTableError("Invalid script strings:\n  " + "\n  ".join(errors))
+    if fallbacks:
+        _logger.warning("Script strings missing, using defaults: %s", ", ".join(fallbacks))
+    return StringTable(tuple(text), tuple(templates), tuple(fallbacks))
+
+
+_compiled: Optional[Tuple[Mapping[str, Any], StringTable]] = None
+
+
+def load_strings() -> StringTable:
+    """Return the string table compiled from the current script registry."""
+
+    global _compiled
+    script = load_script()
+    if _compiled is None or _compiled[0] is not script:
+        _compiled = (script, compile_strings(script))
+    return _compiled[1]
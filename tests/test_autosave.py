@@ -0,0 +1,89 @@
+import os
+import threading
+
+import pytest
+import yaml
+
+from app.autosave import AutosaveWriter, atomic_write, atomic_write_yaml
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def test_atomic_write_replaces_the_file_and_leaves_no_temporaries(tmp_path):
+    path = str(tmp_path / "nested" / "save.yaml")
+    atomic_write_yaml(path, {"location": "club"})
+    atomic_write_yaml(path, {"location": "river"})
+    assert _read(path) == {"location": "river"}
+    assert os.listdir(tmp_path / "nested") == ["save.yaml"]
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path):
+    path = str(tmp_path / "save.yaml")
+    atomic_write_yaml(path, {"location": "club"})
+
+    def explode(f):
+        f.write("location: ri")
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(path, explode)
+    assert _read(path) == {"location": "club"}
+    assert os.listdir(tmp_path) == ["save.yaml"]
+
+
+def test_pending_snapshots_for_a_path_coalesce_into_one_write(tmp_path):
+    path = str(tmp_path / "save.yaml")
+    done = []
+    writer = AutosaveWriter(debounce_s=60)
+    try:
+        for turn in range(5):
+            writer.submit(path, {"turn": turn}, then=lambda turn=turn: done.append(turn))
+        assert not os.path.exists(path)  # still debouncing
+        assert writer.flush(5)
+    finally:
+        writer.close()
+    assert (writer.written, writer.coalesced) == (1, 4)
+    assert _read(path) == {"turn": 4}
+    assert done == [4]  # only the newest snapshot's callback runs
+
+
+def test_immediate_submit_does_not_wait_for_the_debounce(tmp_path):
+    path = str(tmp_path / "save.yaml")
+    written = threading.Event()
+    writer = AutosaveWriter(debounce_s=60)
+    try:
+        writer.submit(path, {"turn": 1}, immediate=True, then=written.set)
+        assert written.wait(5)
+    finally:
+        writer.close()
+    assert _read(path) == {"turn": 1}
+
+
+def test_a_later_deferred_submit_keeps_the_earlier_deadline(tmp_path):
+    path = str(tmp_path / "save.yaml")
+    written = threading.Event()
+    writer = AutosaveWriter(debounce_s=0.05)
+    try:
+        writer.submit(path, {"turn": 1})
+        writer.debounce_s = 60
+        writer.submit(path, {"turn": 2}, then=written.set)
+        assert written.wait(5)
+    finally:
+        writer.close()
+    assert _read(path) == {"turn": 2}
+
+
+def test_write_errors_are_reported_and_close_is_final(tmp_path):
+    errors = []
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    writer = AutosaveWriter(on_error=lambda path, exc: errors.append(path))
+    bad = str(blocker / "save.yaml")  # parent is a file
+    writer.submit(bad, {"turn": 1}, immediate=True)
+    assert writer.close(5)
+    assert errors == [bad]
+    with pytest.raises(RuntimeError):
+        writer.submit(str(tmp_path / "save.yaml"), {})
@@ -0,0 +1,31 @@
+from app.bus import Bus
+from app.engine_adapter import EngineAdapter
+from getinputobject import Input
+from pacing import NullPacer
+
+
+def test_scan_matches_multi_word_vocabulary_longest_first():
+    inp = Input()
+    inp.verb[:] = ["go"]
+    inp.direction[:] = ["north", "night life district", "night"]
+    assert inp.scan("Go night life district", inp) == [
+        ("verb", "Go"),
+        ("direction", "night life district"),
+    ]
+    assert inp.scan("go night club", inp) == [
+        ("verb", "go"),
+        ("direction", "night"),
+        ("error", "club"),
+    ]
+    assert inp.scan("go 3", inp) == [("verb", "go"), ("number", 3)]
+
+
+def test_completed_multi_word_location_travels_there(qapp):
+    adapter = EngineAdapter(Bus(), seed=1, pacer=NullPacer())
+    adapter.travel_to("north")
+    assert adapter.e.current_location.name == "city"
+
+    line = "go residential district"
+    assert line in adapter.complete("go resid")
+    adapter.run_command(line)
+    assert adapter.e.current_location.name == "residential district"
@@ -0,0 +1,55 @@
+from completion import CommandTrie, complete_line
+
+
+def _trie():
+    trie = CommandTrie()
+    for verb in ("go", "give", "talk", "look"):
+        trie.add(verb, "verb")
+    trie.add("?", "command")
+    for direction in ("north", "nightclub"):
+        trie.add(direction, "direction")
+    trie.add("night life district", "location")
+    trie.add("tammy", "character")
+    trie.add("table", "noun")
+    return trie
+
+
+def test_prefix_completion_ranks_by_category_then_length():
+    trie = _trie()
+    assert trie.complete("g") == ["go", "give"]
+    assert trie.complete("n") == ["north", "nightclub", "night life district"]
+    assert trie.complete("t", ("character", "noun")) == ["tammy", "table"]
+    assert trie.complete("x") == []
+    assert trie.complete("n", limit=1) == ["north"]
+
+
+def test_completion_is_case_insensitive():
+    trie = _trie()
+    assert trie.complete("NI") == ["nightclub", "night life district"]
+    assert "North" in trie
+
+
+def test_cached_ranking_follows_updates():
+    trie = _trie()
+    assert trie.complete("no") == ["north"]
+    trie.add("nook", "noun")
+    assert trie.complete("no") == ["north", "nook"]
+    trie.discard("north", "direction")
+    assert trie.complete("no") == ["nook"]
+    assert "north" not in trie
+
+
+def test_sync_replaces_a_category():
+    trie = _trie()
+    trie.sync("character", ["alice", "Tammy"])
+    assert trie.words("character") == {"alice", "tammy"}
+    trie.sync("character", [])
+    assert trie.complete("a", ("character",)) == []
+
+
+def test_complete_line_uses_the_verbs_argument_categories():
+    trie = _trie()
+    assert complete_line(trie, "ta") == ["talk"]
+    assert complete_line(trie, "talk t") == ["talk tammy"]
+    assert complete_line(trie, "look t") == ["look table"]
+    assert complete_line(trie, "go night l") == ["go night life district"]
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.bus import Bus
+from app.engine_adapter import EngineAdapter
+from dialogue_graph import DialogueContext, DialogueGraphError, compile_condition, compile_graph
+from pacing import NullPacer
+
+
+def _ctx(opinion=0, known=False, committed=False, level=0):
+    girl = SimpleNamespace(name="tammy", opinion=opinion, committed_in=committed)
+    player = SimpleNamespace(
+        name="Jake",
+        known_girls=["tammy"] if known else [],
+        make_acquaintance=lambda g: player.known_girls.append(g.name),
+    )
+    return DialogueContext(
+        engine=None,
+        player=player,
+        girl=girl,
+        level_number=level,
+        level={"statement": {"hi": "Hi"}, "reply": {"hi": ["Hello.", 2]}},
+        messages={"invite": "Where to?", "places": [{"name": "river"}, {"name": "club"}]},
+        ui={},
+        observe=lambda: "Nice day.",
+    )
+
+
+@pytest.mark.parametrize(
+    "source, ctx, expected",
+    [
+        (None, _ctx(), True),
+        ("known", _ctx(known=True), True),
+        ("not known", _ctx(known=True), False),
+        ("opinion >= 3", _ctx(opinion=3), True),
+        ("opinion >= 3", _ctx(opinion=2), False),
+        ("opinion > -1 and level == 0", _ctx(), True),
+        ("known and opinion >= 3", _ctx(known=True, opinion=1), False),
+        ("committed or opinion != 0", _ctx(opinion=1), True),
+        ("not (known or committed)", _ctx(), True),
+        ("not known and not committed or level < 1", _ctx(known=True, level=0), True),
+    ],
+)
+def test_compiled_conditions(source, ctx, expected):
+    assert bool(compile_condition(source)(ctx)) is expected
+
+
+@pytest.mark.parametrize("source", ["opinion >=", "(known", "known)", "mood > 1", "known & 1"])
+def test_bad_conditions_fail_at_compile_time(source):
+    with pytest.raises(DialogueGraphError):
+        compile_condition(source)
+
+
+def _graph():
+    return compile_graph(
+        {
+            "start": "greet",
+            "nodes": {
+                "greet": {
+                    "text": "{statement.hi}, {player}",
+                    "options": [
+                        {"label": "Reply", "effects": ["reply hi"]},
+                        {"label": "Meet", "when": "not known", "effects": ["acquaint"]},
+                        {"label": "Out?", "when": "known", "effects": ["say invite"], "goto": "pick"},
+                    ],
+                },
+                "pick": {
+                    "text": "{dialogue.invite}",
+                    "each": "places",
+                    "options": [{"label": "{choice.name}", "goto": "wait"}],
+                },
+                "wait": {"text": "...", "pause": "date_confirmation", "options": [{"label": "Go"}]},
+            },
+        }
+    )
+
+
+def test_session_walks_options_effects_and_edges():
+    ctx = _ctx()
+    session = _graph().session(ctx)
+    assert session.text() == "Hi, Jake"
+    assert session.options() == [(1, "Reply"), (2, "Meet")]
+
+    step = session.choose(2)
+    assert step.ended and ctx.player.known_girls == ["tammy"]
+    assert session.choose(3) is None  # never more than two on offer
+    assert session.options() == [(1, "Reply"), (2, "Out?")]
+
+    step = session.choose(1)
+    assert (step.reply, step.ended, ctx.girl.opinion) == ("Hello.", True, 2)
+
+    step = session.choose(2)
+    assert (step.reply, step.ended) == ("Where to?", False)
+    assert session.text() == "Where to?"
+    assert session.options() == [(1, "river"), (2, "club")]
+    assert session.paused is None
+
+    session.choose(2)
+    assert session.paused == "date_confirmation"
+
+
+def test_graph_rejects_unknown_edges_and_effects():
+    with pytest.raises(DialogueGraphError):
+        compile_graph({"start": "a", "nodes": {"a": {"options": [{"goto": "b"}]}}})
+    with pytest.raises(DialogueGraphError):
+        compile_graph({"start": "a", "nodes": {"a": {"options": [{"effects": ["dance"]}]}}})
+    with pytest.raises(DialogueGraphError):
+        compile_graph({"start": "a", "nodes": {"a": {"options": [{"label": "{nope}"}]}}})
+
+
+def test_adapter_drops_choices_for_an_outdated_payload(qapp):
+    bus = Bus()
+    payloads = []
+    bus.dialogue_ready.connect(payloads.append)
+    adapter = EngineAdapter(bus, seed=1, pacer=NullPacer())
+    adapter.advance_dialogue()
+    shown = payloads[-1]
+
+    adapter.apply_choice(1, shown["turn"] - 1)
+    assert payloads[-1] is shown
+
+    adapter.apply_choice(1, shown["turn"])
+    assert payloads[-1]["turn"] > shown["turn"]
@@ -0,0 +1,67 @@
+from types import MappingProxyType
+
+import pytest
+
+from dialogue_trees import DialogueTree, TreeOverlay, overlay
+
+BASE = MappingProxyType(
+    {
+        "0": MappingProxyType(
+            {
+                "statement": MappingProxyType({"compliment": "Nice work.", "question": "Copies?"}),
+                "reply": MappingProxyType({"compliment": ("Thanks.", 1)}),
+            }
+        ),
+        "1": MappingProxyType({"statement": MappingProxyType({"compliment": "Great shoes."})}),
+    }
+)
+
+
+def test_overlay_without_overrides_is_the_shared_tree():
+    assert overlay(BASE, None) is BASE
+    assert overlay(BASE, {}) is BASE
+
+
+def test_overlay_replaces_only_overridden_branches():
+    view = overlay(BASE, {"0": {"statement": {"question": "Lunch?"}, "reply": {"compliment": ["Hm.", 0]}}})
+    assert isinstance(view, TreeOverlay)
+    assert view["0"]["statement"]["question"] == "Lunch?"
+    assert view["0"]["statement"]["compliment"] == "Nice work."
+    assert view["0"]["reply"]["compliment"] == ["Hm.", 0]
+    assert view["1"] is BASE["1"]  # untouched levels are not copied
+    assert view["0"] is view["0"]
+    assert BASE["0"]["statement"]["question"] == "Copies?"
+
+
+def test_overlay_adds_new_keys_to_iteration_and_length():
+    view = overlay(BASE, {"2": {"statement": {"compliment": "Hey."}}, "0": {}})
+    assert list(view) == ["0", "1", "2"]
+    assert len(view) == 3
+    assert dict(view["2"]) == {"statement": {"compliment": "Hey."}}
+
+
+def test_overlay_is_read_only():
+    view = overlay(BASE, {"0": {}})
+    with pytest.raises(TypeError):
+        view["0"] = {}
+
+
+def test_levels_are_ordered_numerically_once():
+    tree = DialogueTree({"10": "ten", "2": "two", 0: "zero", " 1 ": "one"}, "mixed")
+    assert tree.levels == ((0, "zero"), (1, "one"), (2, "two"), (10, "ten"))
+    assert tree["10"] == "ten"
+    assert list(tree) == ["10", "2", 0, " 1 "]
+
+
+def test_non_numeric_level_names_the_tree():
+    with pytest.raises(ValueError, match="'broken'"):
+        DialogueTree({"0": {}, "intro": {}}, "broken")
+
+
+def test_with_overrides_recompiles_over_an_overlay():
+    tree = DialogueTree(BASE, "default")
+    assert tree.with_overrides(None) is tree
+    custom = tree.with_overrides({"5": {"statement": {"compliment": "Late."}}})
+    assert [number for number, _ in custom.levels] == [0, 1, 5]
+    assert custom.levels[0][1] is BASE["0"]
+    assert custom.name == "default"
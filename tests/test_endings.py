@@ -0,0 +1,70 @@
+from app.bus import Bus
+from app.engine_adapter import EngineAdapter
+from endings import compile_endings
+from pacing import NullPacer
+from script_loader import load_script
+
+
+def _adapter():
+    bus = Bus()
+    adapter = EngineAdapter(bus, seed=1, pacer=NullPacer())
+    return bus, adapter
+
+
+def test_fall_in_love_reaches_ending_through_adapter(qapp):
+    bus, adapter = _adapter()
+    endings, toasts = [], []
+    bus.ending_reached.connect(endings.append)
+    bus.toast.connect(toasts.append)
+
+    girl = adapter._focused() or next(iter(adapter.e.girls.values()))
+    girl.committed_in = True
+    record = adapter.e.fall_in_love(adapter.mc, girl)
+    assert adapter.e.game_over
+    adapter.apply_choice(1)  # any request that reports state
+
+    assert endings == [record.as_dict()]
+    assert endings[0]["id"] == "inexperienced_committed"
+    assert endings[0]["girl"] == girl.name
+    assert endings[0]["experiences"] == 0
+    assert record.text in toasts
+
+    adapter.apply_choice(1)
+    assert len(endings) == 1  # reported once
+
+
+def test_only_experiences_that_happened_count():
+    table = compile_endings(load_script()["endings"])
+
+    class Player:
+        experiences = {"need_to_protect": False, "river": True, "club": True}
+
+    class Girl:
+        name = "tammy"
+        committed_in = False
+
+    record = table.resolve(Player, Girl)
+    assert (record.id, record.experiences, record.committed) == ("barely_uncommitted", 2, False)
+
+
+def test_counts_past_the_last_bucket_use_it():
+    table = compile_endings(
+        {
+            "buckets": [
+                {
+                    "max_experiences": 1,
+                    "committed": {"id": "c", "text": "C"},
+                    "uncommitted": {"id": "u", "text": "U"},
+                }
+            ]
+        }
+    )
+
+    class Player:
+        experiences = {str(i): True for i in range(5)}
+
+    class Girl:
+        name = "alice"
+        committed_in = True
+
+    assert table.resolve(Player, Girl).id == "c"
@@ -0,0 +1,47 @@
+import builtins
+
+from dialogue_graph import DialogueContext, load_graph
+from elements import Character, Engine
+from getdialogue import Dialogue
+from girl_definitions import girl_list
+from location_definitions import location_list
+from script_loader import load_script
+
+
+def _session(engine, player, girl):
+    level_number, level = girl.dialogue_tree.levels[0]
+    return load_graph().session(
+        DialogueContext(
+            engine=engine,
+            player=player,
+            girl=girl,
+            level_number=level_number,
+            level=level,
+            messages=load_script()["dialogue"],
+            ui=load_script()["ui"],
+            observe=lambda: "Nice day.",
+        )
+    )
+
+
+def test_date_offer_prints_the_invite_once(capsys, monkeypatch):
+    engine = Engine()
+    engine.build_locations(location_list)
+    engine.build_girls(girl_list)
+    player = Character()
+    girl = engine.girls["tammy"]
+    player.make_acquaintance(girl)
+    girl.opinion = 3
+    session = _session(engine, player, girl)
+    offer = len(session.options())  # the date offer is listed last
+    answers = iter([str(offer), "1"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+
+    Dialogue()._run_turn(session)
+
+    out = capsys.readouterr().out
+    messages = load_script()["dialogue"]
+    assert out.count(messages["date_invite"]) == 1
+    assert messages["date_choices"][0]["text"] in out
+    assert messages["date_confirmation"] in out
+    assert session.context.date is engine.locations[messages["date_choices"][0]["location"]]
@@ -0,0 +1,135 @@
+import pytest
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QImage
+
+from app.gui.image_cache import ImageCache, decode_size, needed_size, read_image
+
+
+def _image(width, height=None):
+    image = QImage(width, height or width, QImage.Format_ARGB32)
+    image.fill(QColor("red"))
+    return image
+
+
+def test_evicts_least_recently_used_by_byte_cost(qapp, tmp_path):
+    a, b, c = (str(tmp_path / name) for name in "abc")
+    cache = ImageCache(budget_bytes=2 * 400)  # room for two 10x10 ARGB images
+    cache.put(a, _image(10))
+    cache.put(b, _image(10))
+    assert cache.peek(a) is not None  # a becomes the most recently used
+    cache.put(c, _image(10))
+    assert a in cache and c in cache
+    assert b not in cache
+    assert cache.stats()["bytes"] == 800
+
+
+def test_one_large_image_evicts_several_small_ones(qapp, tmp_path):
+    small = [str(tmp_path / f"s{i}") for i in range(3)]
+    big = str(tmp_path / "big")
+    cache = ImageCache(budget_bytes=3 * 400)
+    for path in small:
+        cache.put(path, _image(10))
+    cache.put(big, _image(10, 20))
+    assert [path in cache for path in small] == [False, False, True]
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 2, "bytes": 1200, "budget_bytes": 1200}
+
+
+def test_newest_entry_is_kept_even_over_budget(qapp, tmp_path):
+    a, b = str(tmp_path / "a"), str(tmp_path / "b")
+    cache = ImageCache(budget_bytes=100)
+    cache.put(a, _image(10))
+    cache.put(b, _image(20))
+    assert a not in cache and b in cache
+    assert cache.stats()["bytes"] == 1600
+
+
+def test_put_keeps_the_larger_decode(qapp, tmp_path):
+    path = str(tmp_path / "a")
+    cache = ImageCache()
+    cache.put(path, _image(20), QSize(40, 40))
+    kept = cache.put(path, _image(10))
+    assert kept.size() == QSize(20, 20)
+    assert cache.stats()["bytes"] == 20 * 20 * 4
+    assert cache.put(path, _image(30)).size() == QSize(30, 30)
+    assert cache.stats()["entries"] == 1
+
+
+def test_peek_counts_hits_and_misses(qapp, tmp_path):
+    path = str(tmp_path / "a")
+    cache = ImageCache()
+    assert cache.peek(path) is None
+    cache.put(path, _image(10), QSize(40, 40))
+    assert cache.peek(path, QSize(10, 10)) is not None
+    # the cached 10x10 decode is too small for a 20x20 target
+    assert cache.peek(path, QSize(20, 20)) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_image_decodes_once_then_hits(qapp, tmp_path):
+    path = str(tmp_path / "a.png")
+    assert _image(16).save(path)
+    cache = ImageCache()
+    first = cache.image(path)
+    assert first.size() == QSize(16, 16)
+    assert cache.image(path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.image(str(tmp_path / "missing.png")) is None
+    assert cache.misses == 2
+
+
+@pytest.mark.parametrize(
+    "target, mode, expected",
+    [
+        (QSize(300, 200), Qt.KeepAspectRatioByExpanding, QSize(300, 240)),
+        (QSize(300, 200), Qt.KeepAspectRatio, QSize(250, 200)),
+        (QSize(4000, 4000), Qt.KeepAspectRatioByExpanding, QSize(1000, 800)),  # never upsampled
+        (None, Qt.KeepAspectRatioByExpanding, QSize(1000, 800)),
+        (QSize(), Qt.KeepAspectRatioByExpanding, QSize(1000, 800)),
+    ],
+)
+def test_needed_size(target, mode, expected):
+    assert needed_size(QSize(1000, 800), target, mode) == expected
+
+
+@pytest.mark.parametrize(
+    "target, mode, expected",
+    [
+        # 300/1000 = 0.3 rounds up to the 3/8 step
+        (QSize(300, 200), Qt.KeepAspectRatioByExpanding, QSize(375, 300)),
+        # fits exactly on the 2/8 step
+        (QSize(300, 200), Qt.KeepAspectRatio, QSize(250, 200)),
+        # the smallest step is 1/8
+        (QSize(1, 1), Qt.KeepAspectRatioByExpanding, QSize(125, 100)),
+        # 0.9 rounds up to 1: decode at native size rather than scaling
+        (QSize(900, 700), Qt.KeepAspectRatioByExpanding, QSize(1000, 800)),
+        (None, Qt.KeepAspectRatioByExpanding, QSize(1000, 800)),
+        (QSize(), Qt.KeepAspectRatioByExpanding, QSize(1000, 800)),
+    ],
+)
+def test_decode_size_rounds_up_to_scale_steps(target, mode, expected):
+    assert decode_size(QSize(1000, 800), target, mode) == expected
+
+
+def test_decode_size_rounds_odd_sizes_up():
+    # 3/8 of 333x111 is 124.875x41.625
+    assert decode_size(QSize(333, 111), QSize(100, 10)) == QSize(125, 42)
+
+
+def test_read_image_decodes_at_the_rounded_size(qapp, tmp_path):
+    path = str(tmp_path / "a.png")
+    assert _image(64).save(path)
+    image, native = read_image(path, QSize(10, 10))
+    assert native == QSize(64, 64)
+    assert image.size() == QSize(16, 16)
+
+
+def test_cached_decode_is_reused_until_the_target_outgrows_it(qapp, tmp_path):
+    path = str(tmp_path / "a.png")
+    assert _image(64).save(path)
+    cache = ImageCache()
+    assert cache.image(path, QSize(10, 10)).size() == QSize(16, 16)
+    assert cache.image(path, QSize(12, 12)).size() == QSize(16, 16)
+    assert cache.image(path, QSize(40, 40)).size() == QSize(40, 40)
+    # the larger decode now serves smaller targets too
+    assert cache.image(path, QSize(10, 10)).size() == QSize(40, 40)
+    assert (cache.hits, cache.misses) == (2, 2)
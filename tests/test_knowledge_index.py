@@ -0,0 +1,60 @@
+import pytest
+
+from knowledge_index import KnowledgeIndex, tokenize
+
+KNOWLEDGE = {
+    "notes": [
+        {"title": "Night market", "text": "Opens after dusk near the river."},
+        {"title": "Rumour", "text": "Someone saw lights at the old gallery."},
+    ],
+    "factions": [
+        {"name": "River Guild", "summary": "Keeps the ferries running.", "tags": ["trade"]},
+    ],
+    "sites": [
+        {"name": "Gallery", "summary": "Closed since the flood."},
+        {"name": "Night club", "summary": "Loud; open late."},
+    ],
+    "tech": [],
+}
+
+
+@pytest.fixture
+def index():
+    return KnowledgeIndex(KNOWLEDGE)
+
+
+def test_entries_are_numbered_in_section_and_file_order(index):
+    assert len(index) == 5
+    assert index.sections == {"notes": [0, 1], "factions": [2], "sites": [3, 4], "tech": []}
+
+
+def test_prefix_matching(index):
+    assert index.search("riv") == {0, 2}
+    assert index.search("gal") == {1, 3}
+    assert index.search("trade") == {2}  # tags are indexed
+    assert index.search("zzz") == set()
+
+
+def test_every_query_word_must_match(index):
+    assert index.search("night") == {0, 4}
+    assert index.search("night riv") == {0}
+    assert index.search("NIGHT, Club!") == {4}
+    assert index.search("night gallery") == set()
+
+
+@pytest.mark.parametrize("query", ["", "   ", "\t\n", "—"])
+def test_blank_query_does_not_filter(index, query):
+    assert index.search(query) is None
+    assert index.section_rows("sites", index.search(query)) == [3, 4]
+
+
+def test_section_rows_keep_file_order(index):
+    assert index.section_rows("sites", {4, 3, 0}) == [3, 4]
+    assert index.section_rows("notes", [1, 0]) == [0, 1]
+    assert index.section_rows("notes", set()) == []
+    assert index.section_rows("unknown", {0}) == []
+
+
+def test_display_text_joins_the_section_fields(index):
+    assert index.display_text(2, "factions", " — ") == "River Guild — Keeps the ferries running."
+    assert tokenize("Loud; open late.") == ["loud", "open", "late"]
@@ -0,0 +1,73 @@
+import importlib
+import os
+
+import pytest
+import yaml
+
+import parse_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(parse_cache, "CACHE_DIR", str(directory))
+    monkeypatch.setattr(parse_cache, "stats", {"hits": 0, "misses": 0})
+    return directory
+
+
+def _write(path, text, mtime_ns=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_is_served_from_the_cache(cache_dir, tmp_path):
+    script = tmp_path / "script.yaml"
+    _write(script, "dialogue:\n  greeting: Hey.\n")
+    assert parse_cache.load_yaml(str(script)) == {"dialogue": {"greeting": "Hey."}}
+    assert parse_cache.load_yaml(str(script)) == {"dialogue": {"greeting": "Hey."}}
+    assert parse_cache.stats == {"hits": 1, "misses": 1}
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_edited_file_is_reparsed_even_with_same_size_and_mtime(cache_dir, tmp_path):
+    script = tmp_path / "script.yaml"
+    _write(script, "greeting: Hey.\n", mtime_ns=1_000_000_000)
+    assert parse_cache.load_yaml(str(script)) == {"greeting": "Hey."}
+    _write(script, "greeting: Yo!!\n", mtime_ns=1_000_000_000)
+    assert parse_cache.load_yaml(str(script)) == {"greeting": "Yo!!"}
+    assert parse_cache.stats == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.parametrize("damage", [b"", b"not a pickle", "truncate"])
+def test_corrupt_or_truncated_cache_is_ignored_and_rebuilt(cache_dir, tmp_path, damage):
+    data = tmp_path / "assets.json"
+    _write(data, '{"locales": {"city": "city.png"}}')
+    parse_cache.load_json(str(data))
+    (cache_file,) = cache_dir.iterdir()
+    if damage == "truncate":
+        damage = cache_file.read_bytes()[:-5]
+    cache_file.write_bytes(damage)
+
+    assert parse_cache.load_json(str(data)) == {"locales": {"city": "city.png"}}
+    assert parse_cache.stats == {"hits": 0, "misses": 2}
+    assert parse_cache.load_json(str(data)) == {"locales": {"city": "city.png"}}
+    assert parse_cache.stats["hits"] == 1  # the rewritten entry is good again
+
+
+def test_use_cache_false_never_touches_the_cache(cache_dir, tmp_path):
+    data = tmp_path / "a.yaml"
+    _write(data, "a: 1\n")
+    assert parse_cache.load_yaml(str(data), use_cache=False) == {"a": 1}
+    assert not cache_dir.exists()
+
+
+def test_falls_back_to_the_pure_python_loader_without_libyaml(monkeypatch):
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        reloaded = importlib.reload(parse_cache)
+        assert reloaded.SafeLoader is yaml.SafeLoader
+        assert reloaded.parse_yaml(b"a: [1, 2]\n") == {"a": [1, 2]}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(parse_cache)
@@ -0,0 +1,72 @@
+import json
+import os
+
+from app.save_slots import AUTOSAVE_SLOT, INDEX_NAME, SaveSlots, SlotInfo, state_hash
+
+SNAPSHOT = {"location": "club", "focused": "tammy", "play_time_s": 125.5, "opinions": {"tammy": 2}}
+
+
+def test_record_round_trips_through_the_index(tmp_path):
+    slots = SaveSlots(str(tmp_path))
+    info = slots.record(3, SNAPSHOT, saved_at=1000.0)
+    slots.record(AUTOSAVE_SLOT, {"location": "work"}, saved_at=1001.0)
+
+    assert info == SlotInfo(
+        slot=3,
+        file="slot-003.yaml",
+        saved_at=1000.0,
+        location="club",
+        focused="tammy",
+        play_time_s=125.5,
+        state_hash=state_hash(SNAPSHOT),
+        thumbnail="slot-003.png",
+    )
+    reread = SaveSlots(str(tmp_path))
+    assert reread.entries() == slots.entries()
+    assert [entry.slot for entry in reread.entries()] == [AUTOSAVE_SLOT, 3]
+    assert reread.get(3) == info
+    assert reread.next_free() == 4
+
+
+def test_state_hash_ignores_key_order():
+    reordered = dict(reversed(list(SNAPSHOT.items())))
+    assert state_hash(reordered) == state_hash(SNAPSHOT)
+    assert state_hash({**SNAPSHOT, "location": "work"}) != state_hash(SNAPSHOT)
+
+
+def test_empty_directory_has_no_slots(tmp_path):
+    slots = SaveSlots(str(tmp_path / "missing"))
+    assert slots.entries() == []
+    assert slots.next_free() == 1
+
+
+def test_remove_deletes_the_entry_and_its_files(tmp_path):
+    slots = SaveSlots(str(tmp_path))
+    for path in (slots.slot_path(2), slots.thumbnail_path(2)):
+        open(path, "w").close()
+    slots.record(2, SNAPSHOT)
+    slots.remove(2)
+    assert SaveSlots(str(tmp_path)).get(2) is None
+    assert sorted(os.listdir(tmp_path)) == [INDEX_NAME]
+
+
+def test_unreadable_index_is_rebuilt_from_the_slot_files(tmp_path):
+    slots = SaveSlots(str(tmp_path))
+    for slot in (0, 7):
+        open(slots.slot_path(slot), "w").close()
+    open(slots.thumbnail_path(7), "w").close()
+    open(tmp_path / "notes.txt", "w").close()
+    (tmp_path / INDEX_NAME).write_text("{not json", encoding="utf-8")
+
+    entries = SaveSlots(str(tmp_path)).entries()
+    assert [(e.slot, e.file, e.thumbnail) for e in entries] == [
+        (0, "slot-000.yaml", None),
+        (7, "slot-007.yaml", "slot-007.png"),
+    ]
+
+
+def test_index_from_another_version_is_rebuilt(tmp_path):
+    slots = SaveSlots(str(tmp_path))
+    open(slots.slot_path(1), "w").close()
+    (tmp_path / INDEX_NAME).write_text(json.dumps({"version": 99, "slots": {}}), encoding="utf-8")
+    assert [e.slot for e in SaveSlots(str(tmp_path)).entries()] == [1]
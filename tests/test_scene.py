@@ -0,0 +1,37 @@
+from PySide6.QtCore import QSize, QThreadPool
+from PySide6.QtGui import QColor, QImage
+
+from app.gui.image_cache import ImageCache
+from app.gui.scene import CenterScene
+
+
+def _settle(qapp):
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+
+def test_scaled_pixmaps_are_bounded_by_bytes(qapp, tmp_path):
+    path = str(tmp_path / "bg.png")
+    image = QImage(400, 300, QImage.Format_RGB32)
+    image.fill(QColor("#336699"))
+    assert image.save(path)
+
+    one_frame = 400 * 300 * 4  # no scaled pixmap is larger
+    scene = CenterScene(cache=ImageCache(), scaled_budget_bytes=int(2.5 * one_frame))
+    scene.resize(300, 200)
+    scene.show()
+    scene.set_background(path)
+    _settle(qapp)
+    for width in range(310, 400, 10):
+        scene.resize(width, 200)
+        scene._smooth_all()
+        _settle(qapp)
+
+    assert 1 < len(scene._scaled) <= 2
+    assert scene._scaled_bytes <= scene.scaled_budget_bytes
+    assert scene._scaled_bytes == sum(
+        p.width() * p.height() * p.depth() // 8 for p in scene._scaled.values()
+    )
+    newest = next(reversed(scene._scaled))
+    assert newest[2:] == (390, 200)
+    assert scene.bg.pixmap().size() == QSize(390, 292)
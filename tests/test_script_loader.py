@@ -0,0 +1,49 @@
+import pytest
+
+import script_loader
+from script_loader import freeze, invalidate_script, load_script, script_parse_count
+
+
+@pytest.fixture
+def fresh_registry():
+    invalidate_script()
+    yield
+    invalidate_script()
+
+
+def test_registry_is_parsed_once_and_shared(fresh_registry):
+    before = script_parse_count()
+    first = load_script()
+    assert load_script() is first
+    assert script_parse_count() == before + 1
+
+    invalidate_script()
+    assert load_script() is not first
+    assert script_parse_count() == before + 2
+
+
+def test_registry_is_read_only(fresh_registry):
+    script = load_script()
+    with pytest.raises(TypeError):
+        script["ui"] = {}
+    with pytest.raises(TypeError):
+        script["ui"]["general"]["continue_label"] = "Next"
+    assert isinstance(script["dialogue"]["date_choices"], tuple)
+
+
+def test_freeze_converts_nested_containers():
+    frozen = freeze({"a": [1, {"b": [2]}]})
+    assert frozen["a"] == (1, {"b": (2,)})
+    with pytest.raises(TypeError):
+        frozen["a"][1]["b"] = ()
+
+
+def test_script_on_disk_is_completed_from_defaults(fresh_registry, tmp_path, monkeypatch):
+    (tmp_path / "game").mkdir()
+    (tmp_path / "game" / "script.yaml").write_text(
+        "dialogue:\n  greeting: Yo.\n", encoding="utf-8"
+    )
+    monkeypatch.chdir(tmp_path)
+    script = load_script()
+    assert script["dialogue"]["greeting"] == "Yo."
+    assert script["endings"] == freeze(script_loader._DEFAULT_SCRIPT["endings"])
@@ -0,0 +1,68 @@
+import pytest
+
+import string_table
+from script_loader import load_script
+from string_table import Field, S, StringTableError, compile_strings, load_strings, parse_template
+
+
+def _without(script, path):
+    """Deep, mutable copy of ``script`` with the key at ``path`` removed."""
+
+    def thaw(value):
+        if hasattr(value, "items"):
+            return {k: thaw(v) for k, v in value.items()}
+        if isinstance(value, tuple):
+            return [thaw(v) for v in value]
+        return value
+
+    copy = thaw(script)
+    *parents, leaf = path.split(".")
+    node = copy
+    for part in parents:
+        node = node[part]
+    del node[leaf]
+    return copy
+
+
+def test_parse_template_splits_literals_and_fields():
+    assert parse_template("Going to: {destination}!") == ("Going to: ", "destination", "!")
+    assert isinstance(parse_template("{a}")[0], Field)
+    assert parse_template("plain") == ("plain",)
+    with pytest.raises(StringTableError):
+        parse_template("{unclosed")
+
+
+def test_every_id_is_declared():
+    assert set(string_table._DECLARED) == set(S)
+
+
+def test_every_declared_key_resolves_from_the_script():
+    strings = compile_strings(load_script())
+    assert strings.fallbacks == ()
+    assert strings[S.CONTINUE_LABEL] == "Continue"
+    assert strings.format(S.SEED_TOAST, seed=7) == "Deterministic seed set to 7."
+    assert strings.format(S.SLOTS_SLOT_NAME, slot=3) == "Slot 3"
+
+
+def test_missing_key_falls_back_to_the_default_script():
+    script = _without(load_script(), "ui.main_window.busy_label")
+    strings = compile_strings(script)
+    assert strings.fallbacks == ("ui.main_window.busy_label",)
+    assert strings[S.BUSY_LABEL] == "Working…"
+
+
+def test_undeclared_template_field_is_a_compile_error():
+    script = _without(load_script(), "ui.determinism.toast")
+    script["ui"]["determinism"]["toast"] = "Seed {value}"
+    with pytest.raises(StringTableError, match="ui.determinism.toast"):
+        compile_strings(script)
+
+
+def test_key_missing_everywhere_is_a_compile_error(monkeypatch):
+    monkeypatch.setitem(string_table._DECLARED, S.CONTINUE_LABEL, ("ui.general.nowhere", ()))
+    with pytest.raises(StringTableError, match="ui.general.nowhere: not defined"):
+        compile_strings(load_script())
+
+
+def test_load_strings_is_compiled_once_per_registry():
+    assert load_strings() is load_strings()
@@ -0,0 +1,68 @@
+from app.gui.toast_history import ToastHistoryModel, search_proxy
+
+
+def _rows(model):
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def _record(model):
+    events = []
+    model.rowsInserted.connect(lambda _, first, last: events.append(("inserted", first, last)))
+    model.rowsRemoved.connect(lambda _, first, last: events.append(("removed", first, last)))
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    return events
+
+
+def test_appends_become_inserted_rows(qapp):
+    model = ToastHistoryModel(capacity=3)
+    events = _record(model)
+    model.append("a")
+    model.append("b")
+    assert _rows(model) == ["a", "b"]
+    assert events == [("inserted", 0, 0), ("inserted", 1, 1)]
+
+
+def test_full_buffer_drops_the_oldest_row_and_keeps_order(qapp):
+    model = ToastHistoryModel(capacity=3)
+    for message in "abc":
+        model.append(message)
+    events = _record(model)
+    for message in "defg":
+        model.append(message)
+    assert _rows(model) == ["e", "f", "g"]
+    assert model.rowCount() == 3
+    assert events == [("removed", 0, 0), ("inserted", 2, 2)] * 4
+
+
+def test_tail_returns_the_newest_messages_oldest_first(qapp):
+    model = ToastHistoryModel(capacity=4)
+    assert model.tail(5) == []
+    for message in "abcdef":
+        model.append(message)
+    assert model.tail(2) == ["e", "f"]
+    assert model.tail(10) == ["c", "d", "e", "f"]
+    assert model.tail(0) == []
+
+
+def test_clear_resets_the_model(qapp):
+    model = ToastHistoryModel(capacity=2)
+    for message in "abc":
+        model.append(message)
+    events = _record(model)
+    model.clear()
+    assert model.rowCount() == 0 and model.tail(3) == []
+    assert events == [("reset",)]
+    model.append("x")
+    assert _rows(model) == ["x"]
+
+
+def test_search_proxy_filters_case_insensitively(qapp):
+    model = ToastHistoryModel(capacity=5)
+    for message in ("You run into Tammy.", "I am at the club.", "tammy is here."):
+        model.append(message)
+    proxy = search_proxy(model)
+    proxy.setFilterFixedString("TAMMY")
+    assert [proxy.index(r, 0).data() for r in range(proxy.rowCount())] == [
+        "You run into Tammy.",
+        "tammy is here.",
+    ]
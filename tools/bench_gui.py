@@ -0,0 +1,175 @@
+"""Benchmark GUI actions headlessly under the ``offscreen`` Qt platform.
+
+Boots ``MainWindow`` with a fixed seed, drives a scripted sequence of
+``option_chosen`` / ``travel_chosen`` / ``talk_to`` events through the
+``Bus`` and records, per action, wall time until the engine thread, the
+event queue and the image workers are idle, Python allocations (``tracemalloc``) and the live
+widget count::
+
+    python -m tools.bench_gui --seed 7 --rounds 3 --json .cache/bench_gui.json
+
+No display is needed. The game's save file is never written.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from statistics import median
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+from PySide6.QtCore import QEventLoop, QThreadPool, qVersion  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from app.gui.main_window import MainWindow  # noqa: E402
+
+Action = Tuple[str, Any]
+
+# Starts and ends in the residential district, so rounds can repeat.
+DEFAULT_SCRIPT: Tuple[Action, ...] = (
+    ("option_chosen", 1),
+    ("option_chosen", 2),
+    ("option_chosen", 1),
+    ("travel_chosen", "north"),
+    ("talk_to", "liz"),
+    ("option_chosen", 1),
+    ("option_chosen", 1),
+    ("travel_chosen", "south"),
+    ("travel_chosen", "inside"),
+    ("travel_chosen", "outside"),
+    ("talk_to", "tammy"),
+    ("option_chosen", 1),
+)
+
+
+def _settle(app: QApplication, window: MainWindow) -> None:
+    """Run until the engine, queued events and image workers have drained."""
+    pool = QThreadPool.globalInstance()
+    app.processEvents()
+    engine = window.engine
+    if engine is not None and engine.pending:
+        loop = QEventLoop()
+        engine.idle.connect(loop.quit)
+        while engine.pending:
+            loop.exec()
+        engine.idle.disconnect(loop.quit)
+        app.processEvents()
+    while pool.activeThreadCount():
+        pool.waitForDone(50)
+        app.processEvents()
+    app.processEvents()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _summarise(samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    by_action: Dict[str, List[Dict[str, Any]]] = {}
+    for sample in samples:
+        by_action.setdefault(sample["action"], []).append(sample)
+    summary = {}
+    for action, rows in sorted(by_action.items()):
+        wall = [r["wall_ms"] for r in rows]
+        summary[action] = {
+            "count": len(rows),
+            "wall_ms_median": median(wall),
+            "wall_ms_max": max(wall),
+            "alloc_kib_median": median(r["alloc_kib"] for r in rows),
+            "peak_kib_max": max(r["peak_kib"] for r in rows),
+        }
+    return summary
+
+
+def run(seed: int, rounds: int, script: Sequence[Action] = DEFAULT_SCRIPT) -> Dict[str, Any]:
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+
+    start = time.perf_counter()
+    window = MainWindow(seed=seed, autosave=False)
+    window.show()
+    _settle(app, window)
+    startup_ms = (time.perf_counter() - start) * 1e3
+
+    tracemalloc.start()
+    samples: List[Dict[str, Any]] = []
+    try:
+        for round_no in range(rounds):
+            for action, arg in script:
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                start = time.perf_counter()
+                getattr(window.bus, action).emit(arg)
+                _settle(app, window)
+                wall_ms = (time.perf_counter() - start) * 1e3
+                after, peak = tracemalloc.get_traced_memory()
+                samples.append({
+                    "round": round_no,
+                    "action": action,
+                    "arg": arg,
+                    "wall_ms": wall_ms,
+                    "alloc_kib": (after - before) / 1024,
+                    "peak_kib": (peak - before) / 1024,
+                    "widgets": len(QApplication.allWidgets()),
+                })
+    finally:
+        tracemalloc.stop()
+        window.close()
+
+    return {
+        "seed": seed,
+        "rounds": rounds,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "qt": qVersion(),
+        "platform": app.platformName(),
+        "startup_ms": startup_ms,
+        "actions": samples,
+        "summary": _summarise(samples),
+        "latency": window.latency.snapshot(),
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(f"seed {report['seed']}, {report['rounds']} round(s), startup {report['startup_ms']:.1f}ms")
+    print(f"{'action':16} {'n':>4} {'median':>10} {'max':>10} {'alloc KiB':>10} {'peak KiB':>10}")
+    for action, s in report["summary"].items():
+        print(
+            f"{action:16} {s['count']:4d} {s['wall_ms_median']:8.2f}ms {s['wall_ms_max']:8.2f}ms "
+            f"{s['alloc_kib_median']:10.1f} {s['peak_kib_max']:10.1f}"
+        )
+    widgets = [a["widgets"] for a in report["actions"]]
+    if widgets:
+        print(f"widgets: first {widgets[0]}, last {widgets[-1]}, max {max(widgets)}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args(argv)
+
+    report = run(args.seed, args.rounds)
+    _print_report(report)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
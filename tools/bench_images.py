@@ -0,0 +1,147 @@
+"""Benchmark full-resolution versus scaled decoding of the scene assets.
+
+For every image referenced by ``game/assets.yaml`` this times decoding at
+full resolution and then smooth-scaling to the display size (the old scene
+loader) against ``QImageReader.setScaledSize`` decoding followed by the same
+scale, and records the decoded image size in bytes. The scaled decode
+always reads the original file; ``read_image`` as the scene calls it, which
+may pick a pre-scaled variant from the asset manifest, is reported
+separately as ``manifest``::
+
+    python -m tools.bench_images --size 1280x720 --repeat 5 --json .cache/bench_images.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSize, Qt  # noqa: E402
+from PySide6.QtGui import QGuiApplication, QImage, QImageReader  # noqa: E402
+
+from app.gui.image_cache import decode_size, read_image  # noqa: E402
+from app.loaders import load_assets  # noqa: E402
+
+
+def _asset_paths() -> List[str]:
+    assets = load_assets()
+    paths = [
+        *assets.get("locales", {}).values(),
+        *assets.get("sprites", {}).values(),
+        *assets.get("defaults", {}).values(),
+    ]
+    return [p for p in dict.fromkeys(paths) if isinstance(p, str) and os.path.exists(p)]
+
+
+def _best_of(repeat: int, fn: Callable[[], QImage]) -> Tuple[float, QImage]:
+    best = float("inf")
+    image = QImage()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        image = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, image
+
+
+def _full(path: str, size: QSize) -> Callable[[], QImage]:
+    def decode() -> QImage:
+        image = QImage(path)
+        image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        return image
+    return decode
+
+
+def _scaled(path: str, size: QSize) -> Callable[[], QImage]:
+    def decode() -> QImage:
+        reader = QImageReader(path)
+        native = reader.size()
+        scaled = decode_size(native, size)
+        if scaled != native:
+            reader.setScaledSize(scaled)
+        image = reader.read()
+        image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        return image
+    return decode
+
+
+def _manifest(path: str, size: QSize) -> Callable[[], QImage]:
+    def decode() -> QImage:
+        image, _native = read_image(path, size)
+        image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        return image
+    return decode
+
+
+def run(size: QSize, repeat: int) -> Dict[str, object]:
+    results: Dict[str, Dict[str, float]] = {}
+    for path in _asset_paths():
+        full_s, full_img = _best_of(repeat, _full(path, size))
+        scaled_s, scaled_img = _best_of(repeat, _scaled(path, size))
+        manifest_s, manifest_img = _best_of(repeat, _manifest(path, size))
+        results[path] = {
+            "full_ms": full_s * 1e3,
+            "scaled_ms": scaled_s * 1e3,
+            "manifest_ms": manifest_s * 1e3,
+            "full_bytes": full_img.sizeInBytes(),
+            "scaled_bytes": scaled_img.sizeInBytes(),
+            "manifest_bytes": manifest_img.sizeInBytes(),
+        }
+    totals = {
+        key: sum(r[key] for r in results.values())
+        for key in (
+            "full_ms", "scaled_ms", "manifest_ms", "full_bytes", "scaled_bytes", "manifest_bytes"
+        )
+    }
+    return {
+        "size": [size.width(), size.height()],
+        "repeat": repeat,
+        "files": results,
+        "total": totals,
+    }
+
+
+def _print_report(report: Dict[str, object]) -> None:
+    width, height = report["size"]  # type: ignore[misc]
+    print(f"target size: {width}x{height}")
+    print(
+        f"{'file':52} {'full':>10} {'scaled':>10} {'manifest':>10}"
+        f" {'full MiB':>9} {'scaled MiB':>10} {'manif. MiB':>10}"
+    )
+    rows = dict(report["files"])  # type: ignore[arg-type]
+    rows["total"] = report["total"]
+    for path, r in rows.items():
+        print(
+            f"{path:52} {r['full_ms']:8.2f}ms {r['scaled_ms']:8.2f}ms {r['manifest_ms']:8.2f}ms "
+            f"{r['full_bytes'] / 2**20:9.2f} {r['scaled_bytes'] / 2**20:10.2f}"
+            f" {r['manifest_bytes'] / 2**20:10.2f}"
+        )
+
+
+def _parse_size(text: str) -> QSize:
+    width, _, height = text.lower().partition("x")
+    return QSize(int(width), int(height))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=_parse_size, default=QSize(1280, 720))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication([])  # noqa: F841 - image plugins
+    report = run(args.size, args.repeat)
+    _print_report(report)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
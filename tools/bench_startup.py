@@ -0,0 +1,104 @@
+"""Benchmark cold-start parsing of the game's data files.
+
+Compares the original pure-Python ``yaml.safe_load`` path against the
+libyaml loader and a warm on-disk parse cache::
+
+    python -m tools.bench_startup --repeat 20 --json .cache/bench_startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import yaml
+
+import parse_cache
+from app.loaders import ASSET_PATH, CHAR_PATH, KNOW_PATH
+from script_loader import SCRIPT_PATHS
+
+EXTRA_PATHS = ["script.yaml"]
+
+
+def _data_files() -> List[str]:
+    candidates = [*SCRIPT_PATHS, *EXTRA_PATHS, CHAR_PATH, KNOW_PATH, ASSET_PATH]
+    return [p for p in candidates if os.path.exists(p) and p.endswith((".yaml", ".yml"))]
+
+
+def _best_of(repeat: int, fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _pure_python(path: str) -> object:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=yaml.SafeLoader)
+
+
+def run(repeat: int) -> Dict[str, object]:
+    files = _data_files()
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        original_dir = parse_cache.CACHE_DIR
+        parse_cache.CACHE_DIR = cache_dir
+        try:
+            for path in files:
+                parse_cache.load_yaml(path)  # populate the cache
+                results[path] = {
+                    "pure_python_ms": _best_of(repeat, lambda: _pure_python(path)) * 1e3,
+                    "libyaml_ms": _best_of(
+                        repeat, lambda: parse_cache.load_yaml(path, use_cache=False)
+                    ) * 1e3,
+                    "cached_ms": _best_of(repeat, lambda: parse_cache.load_yaml(path)) * 1e3,
+                }
+        finally:
+            parse_cache.CACHE_DIR = original_dir
+
+    totals = {
+        key: sum(r[key] for r in results.values())
+        for key in ("pure_python_ms", "libyaml_ms", "cached_ms")
+    }
+    return {
+        "libyaml_available": parse_cache.SafeLoader is not yaml.SafeLoader,
+        "repeat": repeat,
+        "files": results,
+        "total": totals,
+    }
+
+
+def _print_report(report: Dict[str, object]) -> None:
+    print(f"libyaml available: {report['libyaml_available']}")
+    print(f"{'file':32} {'before':>10} {'libyaml':>10} {'cached':>10}")
+    rows = dict(report["files"])  # type: ignore[arg-type]
+    rows["total"] = report["total"]
+    for path, r in rows.items():
+        print(
+            f"{path:32} {r['pure_python_ms']:9.3f}ms {r['libyaml_ms']:9.3f}ms "
+            f"{r['cached_ms']:9.3f}ms"
+        )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat)
+    _print_report(report)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Build trimmed, deduplicated, pre-scaled variants of the scene assets.
+
+Reads every image referenced by ``game/assets.yaml``, stores each distinct
+file content once (keyed by hash), trims fully transparent margins and
+writes scaled copies sized for the standard window sizes, plus a manifest
+the game uses to pick the nearest variant at runtime::
+
+    python -m tools.build_assets --out .cache/assets
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from typing import Any, Dict, List, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRect, QSize, Qt  # noqa: E402
+from PySide6.QtGui import QGuiApplication, QImage  # noqa: E402
+
+from app.gui.asset_manifest import ASSET_CACHE_DIR, MANIFEST_NAME, MANIFEST_VERSION  # noqa: E402
+from app.loaders import load_assets  # noqa: E402
+
+WINDOW_SIZES = [QSize(1280, 720), QSize(1920, 1080), QSize(2560, 1440)]
+# Fraction of the window CenterScene gives the sprite label.
+SPRITE_BOX = (0.85, 0.90)
+
+
+def _asset_kinds() -> Dict[str, str]:
+    """Map each referenced path to "background" or "sprite"."""
+    assets = load_assets()
+    kinds: Dict[str, str] = {}
+    for path in assets.get("sprites", {}).values():
+        kinds[path] = "sprite"
+    for section in ("locales", "defaults"):
+        for path in assets.get(section, {}).values():
+            kinds.setdefault(path, "background")
+    return {os.path.normpath(p): k for p, k in kinds.items() if isinstance(p, str) and os.path.exists(p)}
+
+
+def _content_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def opaque_bounds(image: QImage) -> QRect:
+    """Bounding box of the pixels with non-zero alpha."""
+    if not image.hasAlphaChannel():
+        return image.rect()
+    # one alpha byte per pixel, whatever the machine's byte order
+    alpha8 = image.convertToFormat(QImage.Format_Alpha8)
+    bits = bytes(alpha8.constBits())
+    stride = alpha8.bytesPerLine()
+    width = alpha8.width()
+    rows: List[int] = []
+    columns = 0
+    for y in range(alpha8.height()):
+        alpha = bits[y * stride : y * stride + width]
+        if any(alpha):
+            rows.append(y)
+            columns |= int.from_bytes(alpha, "big")
+    if not rows:
+        return QRect(0, 0, 1, 1)
+    mask = columns.to_bytes(width, "big")
+    left = next(x for x in range(width) if mask[x])
+    right = next(x for x in reversed(range(width)) if mask[x])
+    return QRect(left, rows[0], right - left + 1, rows[-1] - rows[0] + 1)
+
+
+def _scales(canvas: QSize, kind: str) -> List[float]:
+    """Downscale factors needed to cover each standard window size."""
+    scales = set()
+    for window in WINDOW_SIZES:
+        if kind == "sprite":
+            box = QSize(int(window.width() * SPRITE_BOX[0]), int(window.height() * SPRITE_BOX[1]))
+            fitted = canvas.scaled(box, Qt.KeepAspectRatio)
+        else:
+            fitted = canvas.scaled(window, Qt.KeepAspectRatioByExpanding)
+        scale = max(fitted.width() / canvas.width(), fitted.height() / canvas.height())
+        if scale < 1:
+            scales.add(round(scale, 4))
+    return sorted(scales) + [1.0]
+
+
+def _write_variant(image: QImage, trim: QRect, scale: float, digest: str, out: str) -> Dict[str, Any]:
+    cropped = image.copy(trim)
+    if scale < 1:
+        size = QSize(max(1, math.ceil(trim.width() * scale)), max(1, math.ceil(trim.height() * scale)))
+        cropped = cropped.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    name = f"{digest}-{cropped.width()}x{cropped.height()}.png"
+    target = os.path.join(out, name)
+    tmp = f"{target}.{os.getpid()}.tmp.png"
+    if not cropped.save(tmp, "PNG"):
+        raise OSError(f"Could not write {target}")
+    os.replace(tmp, target)
+    return {"file": name, "scale": scale, "size": [cropped.width(), cropped.height()]}
+
+
+def build(out: str = ASSET_CACHE_DIR) -> Dict[str, Any]:
+    os.makedirs(out, exist_ok=True)
+    sources: Dict[str, Dict[str, Any]] = {}
+    images: Dict[str, Dict[str, Any]] = {}
+    kinds_by_hash: Dict[str, Tuple[str, str]] = {}
+    for path, kind in sorted(_asset_kinds().items()):
+        st = os.stat(path)
+        digest = _content_hash(path)
+        sources[path] = {"hash": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        # a file used both ways is built with the larger (background) coverage
+        if digest not in kinds_by_hash or kind == "background":
+            kinds_by_hash[digest] = (path, kind)
+
+    for digest, (path, kind) in kinds_by_hash.items():
+        image = QImage(path)
+        if image.isNull():
+            raise OSError(f"Could not decode {path}")
+        trim = opaque_bounds(image) if kind == "sprite" else image.rect()
+        scales = _scales(image.size(), kind)
+        if trim == image.rect():
+            scales.remove(1.0)  # the source file itself is the full-size variant
+        variants = [_write_variant(image, trim, s, digest, out) for s in scales]
+        images[digest] = {
+            "kind": kind,
+            "canvas": [image.width(), image.height()],
+            "trim": [trim.x(), trim.y(), trim.width(), trim.height()],
+            "variants": variants,
+        }
+
+    manifest = {"version": MANIFEST_VERSION, "sources": sources, "images": images}
+    tmp = os.path.join(out, f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, os.path.join(out, MANIFEST_NAME))
+    return manifest
+
+
+def _print_report(manifest: Dict[str, Any], out: str) -> None:
+    images = manifest["images"]
+    print(f"{len(manifest['sources'])} referenced files, {len(images)} distinct images -> {out}")
+    for digest, entry in images.items():
+        x, y, w, h = entry["trim"]
+        sizes = ", ".join("x".join(map(str, v["size"])) for v in entry["variants"])
+        print(f"  {digest[:12]} {entry['kind']:10} trim {w}x{h}+{x}+{y}  variants: {sizes}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=ASSET_CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication([])  # noqa: F841 - image plugins
+    manifest = build(args.out)
+    _print_report(manifest, args.out)
+
+
+if __name__ == "__main__":
+    main()